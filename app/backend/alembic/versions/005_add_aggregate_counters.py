@@ -0,0 +1,60 @@
+"""add denormalized counters to tm_collections and tm_groups
+
+Revision ID: 005_add_aggregate_counters
+Revises: 004_add_users
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '005_add_aggregate_counters'
+down_revision: Union[str, None] = '004_add_users'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('tm_collections', sa.Column('member_count', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('tm_collections', sa.Column('read_count', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('tm_collections', sa.Column('paid_count', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('tm_groups', sa.Column('collections_count', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('tm_groups', sa.Column('total_amount', sa.BigInteger(), nullable=False, server_default='0'))
+    
+    # Backfill counters from existing rows
+    op.execute("""
+        UPDATE tm_collections c
+        SET member_count = s.member_count,
+            read_count = s.read_count,
+            paid_count = s.paid_count
+        FROM (
+            SELECT collection_id,
+                   count(*) AS member_count,
+                   count(*) FILTER (WHERE read_at IS NOT NULL) AS read_count,
+                   count(*) FILTER (WHERE paid_at IS NOT NULL) AS paid_count
+            FROM tm_member_status
+            GROUP BY collection_id
+        ) s
+        WHERE c.id = s.collection_id
+    """)
+    op.execute("""
+        UPDATE tm_groups g
+        SET collections_count = s.collections_count,
+            total_amount = s.total_amount
+        FROM (
+            SELECT group_id, count(*) AS collections_count, sum(amount) AS total_amount
+            FROM tm_collections
+            GROUP BY group_id
+        ) s
+        WHERE g.id = s.group_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('tm_groups', 'total_amount')
+    op.drop_column('tm_groups', 'collections_count')
+    op.drop_column('tm_collections', 'paid_count')
+    op.drop_column('tm_collections', 'read_count')
+    op.drop_column('tm_collections', 'member_count')
@@ -0,0 +1,44 @@
+"""add tm_event_log_daily rollup table
+
+Revision ID: 006_add_event_log_daily
+Revises: 005_add_aggregate_counters
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '006_add_event_log_daily'
+down_revision: Union[str, None] = '005_add_aggregate_counters'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'tm_event_log_daily',
+        sa.Column('owner_id', sa.String(), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('collection_id', sa.String(), nullable=False),
+        sa.Column('type', postgresql.ENUM('notice_sent', 'read', 'paid_marked', 'reminder_scheduled', 'reminder_sent', name='logtype', create_type=False), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False, server_default='0'),
+        sa.ForeignKeyConstraint(['collection_id'], ['tm_collections.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('owner_id', 'date', 'collection_id', 'type')
+    )
+    
+    # Backfill from existing logs (dates in UTC)
+    op.execute("""
+        INSERT INTO tm_event_log_daily (owner_id, date, collection_id, type, count)
+        SELECT g.owner_id, (l.created_at AT TIME ZONE 'UTC')::date, l.collection_id, l.type, count(*)
+        FROM tm_event_logs l
+        JOIN tm_collections c ON c.id = l.collection_id
+        JOIN tm_groups g ON g.id = c.group_id
+        GROUP BY g.owner_id, (l.created_at AT TIME ZONE 'UTC')::date, l.collection_id, l.type
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('tm_event_log_daily')
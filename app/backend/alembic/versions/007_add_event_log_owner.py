@@ -0,0 +1,36 @@
+"""add owner_id to tm_event_logs
+
+Revision ID: 007_add_event_log_owner
+Revises: 006_add_event_log_daily
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '007_add_event_log_owner'
+down_revision: Union[str, None] = '006_add_event_log_daily'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('tm_event_logs', sa.Column('owner_id', sa.String(), nullable=True))
+    
+    # Backfill owners from the collection's group
+    op.execute("""
+        UPDATE tm_event_logs l
+        SET owner_id = g.owner_id
+        FROM tm_collections c
+        JOIN tm_groups g ON g.id = c.group_id
+        WHERE c.id = l.collection_id
+    """)
+    op.alter_column('tm_event_logs', 'owner_id', nullable=False)
+    op.create_index('ix_tm_event_logs_owner_created', 'tm_event_logs', ['owner_id', sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tm_event_logs_owner_created', table_name='tm_event_logs')
+    op.drop_column('tm_event_logs', 'owner_id')
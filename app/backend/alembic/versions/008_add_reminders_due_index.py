@@ -0,0 +1,24 @@
+"""add partial index for due reminders
+
+Revision ID: 008_add_reminders_due_index
+Revises: 007_add_event_log_owner
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '008_add_reminders_due_index'
+down_revision: Union[str, None] = '007_add_event_log_owner'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_tm_reminders_due', 'tm_reminders', ['scheduled_at'], unique=False, postgresql_where=sa.text('is_sent = false'))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tm_reminders_due', table_name='tm_reminders')
@@ -0,0 +1,29 @@
+"""add recurrence rule columns to tm_reminders
+
+Revision ID: 009_add_reminder_recurrence
+Revises: 008_add_reminders_due_index
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '009_add_reminder_recurrence'
+down_revision: Union[str, None] = '008_add_reminders_due_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('tm_reminders', sa.Column('repeat_until', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('tm_reminders', sa.Column('repeat_count', sa.Integer(), nullable=True))
+    op.add_column('tm_reminders', sa.Column('sent_count', sa.Integer(), nullable=False, server_default='0'))
+    op.execute("UPDATE tm_reminders SET sent_count = 1 WHERE is_sent")
+
+
+def downgrade() -> None:
+    op.drop_column('tm_reminders', 'sent_count')
+    op.drop_column('tm_reminders', 'repeat_count')
+    op.drop_column('tm_reminders', 'repeat_until')
@@ -0,0 +1,51 @@
+"""add tm_notice_deliveries queue table
+
+Revision ID: 010_add_notice_deliveries
+Revises: 009_add_reminder_recurrence
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '010_add_notice_deliveries'
+down_revision: Union[str, None] = '009_add_reminder_recurrence'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'tm_notice_deliveries',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('notice_id', sa.String(), nullable=False),
+        sa.Column('collection_id', sa.String(), nullable=False),
+        sa.Column('member_id', sa.String(), nullable=False),
+        sa.Column('owner_id', sa.String(), nullable=False),
+        sa.Column('channel', sa.String(length=20), nullable=False),
+        sa.Column('phone', sa.String(), nullable=False),
+        sa.Column('message', sa.String(), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('next_attempt_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('last_error', sa.String(), nullable=True),
+        sa.Column('provider_message_id', sa.String(), nullable=True),
+        sa.Column('sent_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['notice_id'], ['tm_event_logs.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['collection_id'], ['tm_collections.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['member_id'], ['tm_member_status.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_tm_notice_deliveries_member_id', 'tm_notice_deliveries', ['member_id'], unique=False)
+    op.create_index('ix_tm_notice_deliveries_notice_status', 'tm_notice_deliveries', ['notice_id', 'status'], unique=False)
+    op.create_index('ix_tm_notice_deliveries_due', 'tm_notice_deliveries', ['next_attempt_at'], unique=False, postgresql_where=sa.text("status IN ('pending', 'sending')"))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tm_notice_deliveries_due', table_name='tm_notice_deliveries')
+    op.drop_index('ix_tm_notice_deliveries_notice_status', table_name='tm_notice_deliveries')
+    op.drop_index('ix_tm_notice_deliveries_member_id', table_name='tm_notice_deliveries')
+    op.drop_table('tm_notice_deliveries')
@@ -0,0 +1,24 @@
+"""add (status, due_date) index for the collection status sweep
+
+Revision ID: 011_add_collection_status_index
+Revises: 010_add_notice_deliveries
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '011_add_collection_status_index'
+down_revision: Union[str, None] = '010_add_notice_deliveries'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_tm_collections_status_due_date', 'tm_collections', ['status', 'due_date'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tm_collections_status_due_date', table_name='tm_collections')
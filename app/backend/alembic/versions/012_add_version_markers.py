@@ -0,0 +1,26 @@
+"""add version markers to tm_collections and tm_groups
+
+Revision ID: 012_add_version_markers
+Revises: 011_add_collection_status_index
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '012_add_version_markers'
+down_revision: Union[str, None] = '011_add_collection_status_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('tm_collections', sa.Column('version', sa.BigInteger(), nullable=False, server_default='0'))
+    op.add_column('tm_groups', sa.Column('version', sa.BigInteger(), nullable=False, server_default='0'))
+
+
+def downgrade() -> None:
+    op.drop_column('tm_groups', 'version')
+    op.drop_column('tm_collections', 'version')
@@ -0,0 +1,107 @@
+"""store ULID primary and foreign keys as native uuid
+
+Revision ID: 013_store_ulids_as_uuid
+Revises: 012_add_version_markers
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '013_store_ulids_as_uuid'
+down_revision: Union[str, None] = '012_add_version_markers'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# owner_id/user_id columns keep text: they hold auth subjects, not generated ULIDs
+ULID_COLUMNS = {
+    'users': ['id'],
+    'user_settings': ['id'],
+    'user_payment_methods': ['id'],
+    'tm_groups': ['id'],
+    'tm_collections': ['id', 'group_id'],
+    'tm_member_status': ['id', 'collection_id'],
+    'tm_event_logs': ['id', 'collection_id'],
+    'tm_event_log_daily': ['collection_id'],
+    'tm_reminders': ['id', 'collection_id'],
+    'tm_notice_deliveries': ['id', 'notice_id', 'collection_id', 'member_id'],
+}
+
+# Session-local (pg_temp) helpers; Crockford base32 <-> 128 bits
+CONVERSION_FUNCTIONS = """
+CREATE OR REPLACE FUNCTION pg_temp.ulid_to_uuid(value text) RETURNS uuid AS $$
+DECLARE
+    bits varbit := B'';
+    digit int;
+    hex text := '';
+BEGIN
+    IF length(value) <> 26 THEN
+        RAISE EXCEPTION 'Invalid ULID: %', value;
+    END IF;
+    FOR i IN 1..26 LOOP
+        digit := strpos('0123456789ABCDEFGHJKMNPQRSTVWXYZ', upper(substr(value, i, 1))) - 1;
+        IF digit < 0 OR (i = 1 AND digit > 7) THEN
+            RAISE EXCEPTION 'Invalid ULID: %', value;
+        END IF;
+        bits := bits || digit::bit(5);
+    END LOOP;
+    bits := substring(bits FROM 3);
+    FOR i IN 0..31 LOOP
+        hex := hex || to_hex(substring(bits FROM i * 4 + 1 FOR 4)::bit(4)::int);
+    END LOOP;
+    RETURN hex::uuid;
+END
+$$ LANGUAGE plpgsql IMMUTABLE STRICT;
+
+CREATE OR REPLACE FUNCTION pg_temp.uuid_to_ulid(value uuid) RETURNS text AS $$
+DECLARE
+    bits varbit := B'00' || ('x' || replace(value::text, '-', ''))::bit(128);
+    ulid text := '';
+BEGIN
+    FOR i IN 0..25 LOOP
+        ulid := ulid || substr(
+            '0123456789ABCDEFGHJKMNPQRSTVWXYZ',
+            substring(bits FROM i * 5 + 1 FOR 5)::bit(5)::int + 1,
+            1
+        );
+    END LOOP;
+    RETURN ulid;
+END
+$$ LANGUAGE plpgsql IMMUTABLE STRICT;
+"""
+
+
+def _drop_foreign_keys(bind) -> list:
+    """Drop FKs between the converted tables, returning (table, name, definition) to recreate."""
+    foreign_keys = bind.execute(sa.text("""
+        SELECT conrelid::regclass::text, conname, pg_get_constraintdef(oid)
+        FROM pg_constraint
+        WHERE contype = 'f' AND confrelid::regclass::text = ANY(:tables)
+    """), {'tables': list(ULID_COLUMNS)}).all()
+    for table, name, _ in foreign_keys:
+        op.drop_constraint(name, table, type_='foreignkey')
+    return foreign_keys
+
+
+def _convert(column_type: str, function: str) -> None:
+    bind = op.get_bind()
+    bind.execute(sa.text(CONVERSION_FUNCTIONS))
+    foreign_keys = _drop_foreign_keys(bind)
+    for table, columns in ULID_COLUMNS.items():
+        # One ALTER TABLE per table so it is rewritten (and its indexes rebuilt) once
+        op.execute(
+            f'ALTER TABLE {table} '
+            + ', '.join(f'ALTER COLUMN {c} TYPE {column_type} USING pg_temp.{function}({c})' for c in columns)
+        )
+    for table, name, definition in foreign_keys:
+        op.execute(f'ALTER TABLE {table} ADD CONSTRAINT {name} {definition}')
+
+
+def upgrade() -> None:
+    _convert('uuid', 'ulid_to_uuid')
+
+
+def downgrade() -> None:
+    _convert('varchar', 'uuid_to_ulid')
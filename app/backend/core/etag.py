@@ -0,0 +1,39 @@
+"""Conditional GET (ETag / If-None-Match) helpers.
+
+ETags are built from cheap version markers (see counters_service), so a
+matching request can be answered with 304 before the response body is
+queried or serialized.
+"""
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response, status
+
+# Clients must revalidate, and shared caches must not store per-user data
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: object) -> str:
+    """Build a strong ETag from the parts identifying one version of a response."""
+    digest = hashlib.sha256(":".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+def conditional_response(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """Set the ETag on response and return a 304 if the client's copy is current."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+        )
+    return None
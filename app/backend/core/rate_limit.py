@@ -0,0 +1,309 @@
+"""Request rate limiting.
+
+RateLimitMiddleware is a pure ASGI middleware that matches each request to the
+first RateLimitPolicy for its method and path, and counts it against the
+caller's key: the Bearer token's user (per="user", falling back to the client
+IP for anonymous requests) or the client IP (per="ip"). Requests over the
+limit get 429 with a Retry-After header before reaching the app, so they never
+take a database connection.
+
+Backends: an in-process token bucket (limits apply per worker) or a
+sliding-window counter in Redis shared by all workers, with FakeRedis standing
+in for tests. If the shared backend fails, requests are let through.
+"""
+import inspect
+import logging
+import math
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from fastapi.responses import JSONResponse
+
+from app.backend.core.config import settings
+from app.backend.core.response_cache import FakeRedis
+from app.backend.core.security import verify_access_token
+
+logger = logging.getLogger(__name__)
+
+WRITE_METHODS = ("POST", "PATCH", "PUT", "DELETE")
+
+
+def parse_rate(rate: str) -> Tuple[int, float]:
+    """Parse "limit/seconds" (e.g. "5/60") into (limit, window_seconds)."""
+    limit, _, seconds = rate.partition("/")
+    try:
+        parsed = int(limit), float(seconds)
+    except ValueError:
+        raise ValueError(f"Rate must look like limit/seconds: {rate!r}") from None
+    if parsed[0] < 1 or parsed[1] <= 0:
+        raise ValueError(f"Rate must be positive: {rate!r}")
+    return parsed
+
+
+def _path_regex(path: str) -> str:
+    # "{param}" matches one path segment and a trailing "*" matches any suffix
+    prefix = path.endswith("*")
+    regex = re.sub(r"\\\{[^/]+?\\\}", "[^/]+", re.escape(path.rstrip("*")))
+    return regex + (".*" if prefix else "$")
+
+
+class RateLimitPolicy:
+    """Allow `limit` requests per `window_seconds` for matching requests."""
+
+    def __init__(
+        self,
+        name: str,
+        limit: int,
+        window_seconds: float,
+        methods: Iterable[str],
+        paths: Iterable[str],
+        per: str = "user",
+    ) -> None:
+        if per not in ("user", "ip"):
+            raise ValueError(f"Unknown rate limit key: {per}")
+        self.name = name
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.methods = frozenset(methods)
+        self.per = per
+        self.pattern = re.compile("|".join(f"(?:{_path_regex(path)})" for path in paths))
+
+    def matches(self, method: str, path: str) -> bool:
+        return method in self.methods and self.pattern.match(path) is not None
+
+
+async def _resolve(result: Any) -> Any:
+    # redis.asyncio clients return awaitables, FakeRedis returns plain values
+    return await result if inspect.isawaitable(result) else result
+
+
+class RateLimitBackend:
+    """Interface for rate limit counters."""
+
+    name = "base"
+
+    async def hit(self, key: str, limit: int, window_seconds: float) -> float:
+        """Count one request; returns 0 when allowed, else seconds until a retry can succeed."""
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, Any]:
+        return {}
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """In-process token buckets, one per key, kept for the most recent max_keys keys."""
+
+    name = "memory"
+
+    def __init__(self, max_keys: int = 100000) -> None:
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()  # key -> [tokens, updated]
+
+    async def hit(self, key: str, limit: int, window_seconds: float) -> float:
+        # No awaits below, so the update is atomic within the event loop
+        now = time.monotonic()
+        rate = limit / window_seconds
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.max_keys:
+                # The least recently seen bucket has most likely refilled already
+                self._buckets.popitem(last=False)
+            bucket = self._buckets[key] = [float(limit), now]
+        else:
+            self._buckets.move_to_end(key)
+            bucket[0] = min(float(limit), bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            return 0.0
+        return (1 - bucket[0]) / rate
+
+    def stats(self) -> Dict[str, Any]:
+        return {"keys": len(self._buckets), "max_keys": self.max_keys}
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Sliding-window counters shared by all workers.
+
+    Each key counts requests in fixed windows; the previous window's count is
+    weighted by how much of it still overlaps the sliding window. Like the
+    token bucket, only allowed requests count: a rejected request's increment
+    is taken back.
+    """
+
+    name = "redis"
+
+    def __init__(self, client: Any, prefix: str = "tm:ratelimit:") -> None:
+        self.client = client
+        self.prefix = prefix
+
+    async def hit(self, key: str, limit: int, window_seconds: float) -> float:
+        now = time.time()
+        window = int(now // window_seconds)
+        elapsed = now - window * window_seconds
+        current_key = f"{self.prefix}{key}:{window}"
+        current = await _resolve(self.client.incr(current_key))
+        if current == 1:
+            await _resolve(self.client.pexpire(current_key, int(window_seconds * 2000)))
+        previous = int(await _resolve(self.client.get(f"{self.prefix}{key}:{window - 1}")) or 0)
+
+        if previous * (1 - elapsed / window_seconds) + current <= limit:
+            return 0.0
+        await _resolve(self.client.incr(current_key, -1))
+        if current > limit or not previous:
+            return window_seconds - elapsed
+        # Wait until the previous window's weighted share leaves room for this request
+        return max(0.0, (window_seconds - elapsed) - (limit - current) * window_seconds / previous)
+
+
+def create_rate_limit_backend(name: str, redis_url: Optional[str] = None, max_keys: int = 100000) -> RateLimitBackend:
+    """Create the backend named in settings ("memory", "redis" or "fake-redis")."""
+    if name == "memory":
+        return MemoryRateLimitBackend(max_keys)
+    if name == "redis":
+        if not redis_url:
+            raise ValueError("RATE_LIMIT_REDIS_URL is required for the redis backend")
+        import redis.asyncio  # Optional dependency, only needed for this backend
+        return RedisRateLimitBackend(redis.asyncio.Redis.from_url(redis_url))
+    if name == "fake-redis":
+        return RedisRateLimitBackend(FakeRedis())
+    raise ValueError(f"Unknown rate limit backend: {name}")
+
+
+class RateLimiter:
+    """Matches requests to policies and counts them in a backend."""
+
+    def __init__(self, policies: List[RateLimitPolicy], backend: RateLimitBackend) -> None:
+        self.policies = policies
+        self.backend = backend
+        self.allowed = {policy.name: 0 for policy in policies}
+        self.limited = {policy.name: 0 for policy in policies}
+        self.errors = 0
+
+    def match(self, method: str, path: str) -> Optional[RateLimitPolicy]:
+        """Get the first policy matching the request, if any."""
+        for policy in self.policies:
+            if policy.matches(method, path):
+                return policy
+        return None
+
+    async def check(self, policy: RateLimitPolicy, identity: str) -> float:
+        """Count a request; returns 0 when allowed, else the Retry-After seconds."""
+        try:
+            retry_after = await self.backend.hit(f"{policy.name}:{identity}", policy.limit, policy.window_seconds)
+        except Exception:
+            logger.warning("Rate limit backend failed; letting the request through", exc_info=True)
+            self.errors += 1
+            return 0.0
+        if retry_after:
+            self.limited[policy.name] += 1
+        else:
+            self.allowed[policy.name] += 1
+        return retry_after
+
+    def stats(self) -> Dict[str, Any]:
+        """Get allowed/limited counts per policy and backend statistics."""
+        return {
+            "backend": self.backend.name,
+            "errors": self.errors,
+            "policies": {
+                policy.name: {
+                    "limit": policy.limit,
+                    "window_seconds": policy.window_seconds,
+                    "per": policy.per,
+                    "allowed": self.allowed[policy.name],
+                    "limited": self.limited[policy.name],
+                }
+                for policy in self.policies
+            },
+            **self.backend.stats(),
+        }
+
+
+class RateLimitMiddleware:
+    """ASGI middleware answering 429 with Retry-After for requests over their policy's limit."""
+
+    def __init__(self, app: Any, limiter: RateLimiter, trust_forwarded: bool = False, forwarded_hops: int = 1) -> None:
+        self.app = app
+        self.limiter = limiter
+        self.trust_forwarded = trust_forwarded
+        self.forwarded_hops = forwarded_hops
+
+    def identity(self, scope: Dict[str, Any], policy: RateLimitPolicy) -> str:
+        """Get the key a request is counted under."""
+        headers = dict(scope["headers"])
+        if policy.per == "user":
+            scheme, _, token = headers.get(b"authorization", b"").decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer" and token:
+                principal = verify_access_token(token)
+                if principal is not None:
+                    return f"user:{principal.user_id}"
+        if self.trust_forwarded and b"x-forwarded-for" in headers:
+            # Each of our forwarded_hops proxies appends the address it saw, so
+            # entries left of those are client-supplied and can be spoofed
+            forwarded = [entry.strip() for entry in headers[b"x-forwarded-for"].decode("latin-1").split(",")]
+            return "ip:" + forwarded[max(len(forwarded) - self.forwarded_hops, 0)]
+        client = scope.get("client")
+        return f"ip:{client[0] if client else 'unknown'}"
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        policy = self.limiter.match(scope["method"], scope["path"])
+        if policy is None:
+            return await self.app(scope, receive, send)
+
+        retry_after = await self.limiter.check(policy, self.identity(scope, policy))
+        if not retry_after:
+            return await self.app(scope, receive, send)
+        response = JSONResponse(
+            {"detail": "Too many requests"},
+            status_code=429,
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+        await response(scope, receive, send)
+
+
+def default_policies() -> List[RateLimitPolicy]:
+    """Build the policies configured in settings; the first match wins."""
+    return [
+        RateLimitPolicy(
+            "verification_code",
+            *parse_rate(settings.RATE_LIMIT_VERIFICATION_CODE),
+            methods=["POST"],
+            paths=["/auth/send-verification-code"],
+            per="ip",
+        ),
+        RateLimitPolicy(
+            "login",
+            *parse_rate(settings.RATE_LIMIT_LOGIN),
+            methods=["POST"],
+            paths=["/auth/login/*", "/auth/signup"],
+            per="ip",
+        ),
+        RateLimitPolicy(
+            "bulk_write",
+            *parse_rate(settings.RATE_LIMIT_BULK_WRITE),
+            methods=["POST"],
+            paths=[
+                "/total-manager/collections/{collection_id}/members/bulk",
+                "/total-manager/collections/{collection_id}/members/import",
+                "/total-manager/collections/{collection_id}/notice",
+                "/total-manager/reminders/{reminder_id}/send",
+            ],
+        ),
+        RateLimitPolicy(
+            "write",
+            *parse_rate(settings.RATE_LIMIT_WRITE),
+            methods=WRITE_METHODS,
+            paths=["/total-manager/*", "/users/me/*"],
+        ),
+    ]
+
+
+rate_limiter = RateLimiter(
+    default_policies(),
+    create_rate_limit_backend(settings.RATE_LIMIT_BACKEND, settings.RATE_LIMIT_REDIS_URL, settings.RATE_LIMIT_MAX_KEYS),
+)
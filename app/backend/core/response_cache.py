@@ -0,0 +1,343 @@
+"""Response caching utilities.
+
+ResponseCache stores serialized response models in a pluggable backend:
+an in-process LRU with TTL (default), any Redis-protocol client, or nothing.
+Concurrent misses for one key are coalesced (single-flight) so the loader
+runs once per process. Callers invalidate keys after committing a change;
+a load that overlaps an invalidation in this process is not stored, and
+across processes staleness is bounded by the TTL. Callers that key entries
+by a version marker never need to invalidate. Network backends are called
+from a worker thread in the async path so they do not block the event loop.
+"""
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Type, TypeVar
+
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel
+
+from app.backend.core.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class CacheBackend:
+    """Interface for response cache storage (string keys, bytes values)."""
+
+    name = "base"
+    blocking = False  # True when calls do network I/O
+
+    def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        raise NotImplementedError
+
+    def delete(self, *keys: str) -> None:
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, Any]:
+        """Get size and memory use."""
+        return {}
+
+
+class NullCacheBackend(CacheBackend):
+    """Backend that stores nothing (caching disabled)."""
+
+    name = "none"
+
+    def get(self, key: str) -> Optional[bytes]:
+        return None
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        pass
+
+    def delete(self, *keys: str) -> None:
+        pass
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU backend with per-entry TTL."""
+
+    name = "memory"
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self._cache = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._cache.get(key, record_stats=False)
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        self._cache.set(key, value, ttl_seconds=ttl_seconds)
+
+    def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._cache.delete(key)
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self._cache.stats()
+        return {key: stats[key] for key in ("size", "max_size", "memory_bytes")}
+
+
+class RedisCacheBackend(CacheBackend):
+    """Backend over a Redis-protocol client (redis.Redis or FakeRedis)."""
+
+    name = "redis"
+    blocking = True
+
+    def __init__(self, client: Any, prefix: str = "tm:response:") -> None:
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(self.prefix + key)
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        self.client.set(self.prefix + key, value, px=max(1, int(ttl_seconds * 1000)))
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self.client.delete(*(self.prefix + key for key in keys))
+
+    def stats(self) -> Dict[str, Any]:
+        # Server-wide figures; the server may be shared with other data
+        return {
+            "size": self.client.dbsize(),
+            "memory_bytes": self.client.info("memory").get("used_memory"),
+        }
+
+
+class FakeRedis:
+    """In-memory stand-in for the subset of the redis.Redis API used here."""
+
+    def __init__(self) -> None:
+        self._data: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+
+    def _live(self, key: str) -> Optional[tuple]:
+        entry = self._data.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+            del self._data[key]
+            return None
+        return entry
+
+    def get(self, name: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._live(name)
+            return entry[0] if entry else None
+
+    def set(self, name: str, value: bytes, ex: Optional[float] = None, px: Optional[int] = None) -> bool:
+        ttl = px / 1000 if px is not None else ex
+        with self._lock:
+            self._data[name] = (value, time.monotonic() + ttl if ttl is not None else None)
+        return True
+
+    def delete(self, *names: str) -> int:
+        with self._lock:
+            return sum(self._data.pop(name, None) is not None for name in names)
+
+    def incr(self, name: str, amount: int = 1) -> int:
+        with self._lock:
+            entry = self._live(name)
+            value, expires_at = (int(entry[0]) + amount, entry[1]) if entry else (amount, None)
+            self._data[name] = (str(value).encode(), expires_at)
+            return value
+
+    def pexpire(self, name: str, time_ms: int) -> bool:
+        with self._lock:
+            entry = self._live(name)
+            if entry is None:
+                return False
+            self._data[name] = (entry[0], time.monotonic() + time_ms / 1000)
+            return True
+
+    def dbsize(self) -> int:
+        with self._lock:
+            return sum(self._live(key) is not None for key in list(self._data))
+
+    def info(self, section: Optional[str] = None) -> Dict[str, Any]:
+        with self._lock:
+            used = sum(len(key) + len(value) for key, (value, _) in self._data.items())
+        return {"used_memory": used}
+
+    def flushdb(self) -> bool:
+        with self._lock:
+            self._data.clear()
+        return True
+
+
+def create_cache_backend(
+    name: str,
+    max_size: int,
+    ttl_seconds: float,
+    redis_url: Optional[str] = None,
+) -> CacheBackend:
+    """Create the backend named in settings ("memory", "redis", "fake-redis" or "none")."""
+    if name == "memory":
+        return MemoryCacheBackend(max_size, ttl_seconds)
+    if name == "redis":
+        if not redis_url:
+            raise ValueError("RESPONSE_CACHE_REDIS_URL is required for the redis backend")
+        import redis  # Optional dependency, only needed for this backend
+        return RedisCacheBackend(redis.Redis.from_url(redis_url))
+    if name == "fake-redis":
+        return RedisCacheBackend(FakeRedis())
+    if name == "none":
+        return NullCacheBackend()
+    raise ValueError(f"Unknown response cache backend: {name}")
+
+
+class _Flight:
+    """One in-progress load; invalidated marks it as not storable."""
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+        self.invalidated = False
+
+
+class ResponseCache:
+    """Cache of serialized response models with single-flight loading."""
+
+    def __init__(self, backend: CacheBackend, ttl_seconds: float, flight_timeout_seconds: float = 30.0) -> None:
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.flight_timeout_seconds = flight_timeout_seconds
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self._async_flights: Dict[str, tuple] = {}  # key -> (_Flight, asyncio.Future)
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _lookup(self, key: str, model: Type[M]) -> Optional[M]:
+        try:
+            raw = self.backend.get(key)
+        except Exception:
+            # A cache outage must not fail the request
+            logger.warning("Response cache get failed for %s", key, exc_info=True)
+            self._count("errors")
+            return None
+        if raw is None:
+            return None
+        self._count("hits")
+        return model.model_validate_json(raw)
+
+    def _store(self, key: str, value: BaseModel, flight: _Flight) -> None:
+        if flight.invalidated:
+            return
+        try:
+            self.backend.set(key, value.model_dump_json().encode(), self.ttl_seconds)
+            if flight.invalidated:  # Invalidated while storing
+                self.backend.delete(key)
+        except Exception:
+            logger.warning("Response cache set failed for %s", key, exc_info=True)
+            self._count("errors")
+
+    def get_or_load(self, key: str, loader: Callable[[], M], model: Type[M]) -> M:
+        """Get a cached response, or load and cache it once per concurrent miss."""
+        cached = self._lookup(key, model)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            if not flight.event.wait(self.flight_timeout_seconds):
+                return loader()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = loader()
+            self._store(key, flight.value, flight)
+            return flight.value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.event.set()
+
+    async def aget_or_load(self, key: str, loader: Callable[[], Awaitable[M]], model: Type[M]) -> M:
+        """Async variant of get_or_load for coroutine loaders."""
+        cached = (
+            await run_in_threadpool(self._lookup, key, model)
+            if self.backend.blocking
+            else self._lookup(key, model)
+        )
+        if cached is not None:
+            return cached
+
+        pending = self._async_flights.get(key)
+        if pending is not None:
+            self._count("coalesced")
+            return await asyncio.shield(pending[1])
+
+        flight, future = _Flight(), asyncio.get_running_loop().create_future()
+        self._async_flights[key] = (flight, future)
+        self._count("misses")
+        try:
+            value = await loader()
+            if self.backend.blocking:
+                await run_in_threadpool(self._store, key, value, flight)
+            else:
+                self._store(key, value, flight)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Retrieved here so an unawaited future does not log
+            raise
+        finally:
+            del self._async_flights[key]
+
+    def invalidate(self, *keys: str) -> None:
+        """Drop keys, and keep in-progress loads of them from being stored."""
+        with self._lock:
+            for key in keys:
+                if key in self._flights:
+                    self._flights[key].invalidated = True
+                if key in self._async_flights:
+                    self._async_flights[key][0].invalidated = True
+        try:
+            self.backend.delete(*keys)
+        except Exception:
+            logger.error("Response cache invalidation failed for %s", keys, exc_info=True)
+            self._count("errors")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit ratio, single-flight and backend size/memory statistics."""
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            stats = {
+                "backend": self.backend.name,
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "errors": self.errors,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+        try:
+            stats.update(self.backend.stats())
+        except Exception:
+            logger.warning("Response cache stats failed", exc_info=True)
+        return stats
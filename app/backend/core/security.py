@@ -0,0 +1,124 @@
+"""JWT access tokens and the shared authentication dependency.
+
+Access tokens are JWTs signed with settings.SECRET_KEY using
+settings.ALGORITHM (HS256/HS384/HS512), with the key ID (JWT_KEY_ID) in the
+``kid`` header. Keys listed in JWT_PREVIOUS_KEYS still verify tokens they
+signed, so a key can be rotated without logging everyone out. Verification
+never touches the database, and verified tokens are cached until they expire
+(bounded by the cache TTL) so repeated tokens skip the signature check.
+"""
+import hmac
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from fastapi import Depends, Header, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from jwt import JWT
+from jwt.exceptions import JWTException
+from jwt.jwk import OctetJWK
+from jwt.utils import b64decode, get_int_from_datetime, get_time_from_int
+
+from app.backend.core.cache import TTLCache
+from app.backend.core.config import settings
+from app.backend.schemas.auth import TokenPrincipal
+
+SUPPORTED_ALGORITHMS = ("HS256", "HS384", "HS512")
+
+_jwt = JWT()
+bearer_scheme = HTTPBearer(auto_error=False)
+
+# token -> TokenPrincipal
+token_cache = TTLCache(
+    max_size=settings.AUTH_TOKEN_CACHE_MAX_SIZE,
+    ttl_seconds=settings.AUTH_TOKEN_CACHE_TTL_SECONDS,
+)
+
+
+def load_signing_keys(key_id: str, secret_key: str, previous_keys: str) -> Dict[str, OctetJWK]:
+    """Build the key ID -> key map from the current key and "kid:secret,..." previous keys."""
+    keys = {}
+    for entry in filter(None, (part.strip() for part in previous_keys.split(","))):
+        previous_id, separator, previous_secret = entry.partition(":")
+        if not separator or not previous_secret:
+            raise ValueError("JWT_PREVIOUS_KEYS entries must look like kid:secret")
+        keys[previous_id] = OctetJWK(previous_secret.encode())
+    keys[key_id] = OctetJWK(secret_key.encode())
+    return keys
+
+
+if settings.ALGORITHM not in SUPPORTED_ALGORITHMS:
+    raise ValueError(f"Unsupported JWT ALGORITHM: {settings.ALGORITHM}")
+signing_keys = load_signing_keys(settings.JWT_KEY_ID, settings.SECRET_KEY, settings.JWT_PREVIOUS_KEYS)
+
+
+def create_access_token(user_id: str, expires_in: Optional[timedelta] = None) -> str:
+    """Create a signed access token for a user."""
+    now = datetime.now(timezone.utc)
+    expires_at = now + (expires_in or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
+    return _jwt.encode(
+        {"sub": user_id, "iat": get_int_from_datetime(now), "exp": get_int_from_datetime(expires_at)},
+        signing_keys[settings.JWT_KEY_ID],
+        alg=settings.ALGORITHM,
+        optional_headers={"kid": settings.JWT_KEY_ID},
+    )
+
+
+def _decode_access_token(token: str) -> Optional[TokenPrincipal]:
+    try:
+        header = json.loads(b64decode(token.split(".", 1)[0]))
+        key = signing_keys.get(header.get("kid", settings.JWT_KEY_ID))
+        if key is None:
+            return None
+        payload = _jwt.decode(token, key, algorithms={settings.ALGORITHM})
+    except (JWTException, ValueError, AttributeError):
+        return None
+    if not isinstance(payload.get("sub"), str) or "exp" not in payload:
+        return None
+    return TokenPrincipal(user_id=payload["sub"], expires_at=get_time_from_int(payload["exp"]))
+
+
+def verify_access_token(token: str) -> Optional[TokenPrincipal]:
+    """Verify an access token, returning its principal or None when invalid or expired."""
+    principal = token_cache.get(token)
+    if principal is not None:
+        return principal  # Cached for no longer than the token's remaining lifetime
+    
+    principal = _decode_access_token(token)
+    if principal is not None:
+        remaining = (principal.expires_at - datetime.now(timezone.utc)).total_seconds()
+        token_cache.set(token, principal, ttl_seconds=min(remaining, token_cache.ttl_seconds))
+    return principal
+
+
+async def get_current_principal(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+) -> TokenPrincipal:
+    """Authenticate the request from its Bearer token.
+
+    Async because it never blocks, so it runs without a threadpool hop.
+    """
+    principal = verify_access_token(credentials.credentials) if credentials else None
+    if principal is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or missing access token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return principal
+
+
+async def get_current_user_id(principal: TokenPrincipal = Depends(get_current_principal)) -> str:
+    """Get the authenticated user's ID."""
+    return principal.user_id
+
+
+async def require_internal_token(x_internal_token: Optional[str] = Header(None)) -> None:
+    """Allow only callers presenting settings.INTERNAL_API_TOKEN in X-Internal-Token."""
+    if not settings.INTERNAL_API_TOKEN:
+        # Not configured: behave as if the internal endpoints did not exist
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if x_internal_token is None or not hmac.compare_digest(
+        x_internal_token.encode(), settings.INTERNAL_API_TOKEN.encode()
+    ):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid internal token")
@@ -0,0 +1,179 @@
+"""Short-lived SMS verification code storage.
+
+Codes are kept per phone number (one live code each) as hashes, with an
+expiry and a failed-attempt counter, so a check is a single key lookup.
+The memory store drops expired codes in periodic sweeps driven by a min-heap
+of expiry times; the Redis store (shared by all workers) leaves expiry to
+Redis key TTLs.
+"""
+import enum
+import heapq
+import hmac
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.backend.core.response_cache import FakeRedis
+
+
+class VerificationResult(str, enum.Enum):
+    """Outcome of checking a verification code."""
+    OK = "ok"
+    MISSING = "missing"  # Never issued, expired or already used
+    MISMATCH = "mismatch"
+    LOCKED = "locked"  # Too many failed attempts; the code was discarded
+
+
+class VerificationStore:
+    """Interface for verification code storage."""
+
+    name = "base"
+
+    def __init__(self, ttl_seconds: float, max_attempts: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_attempts = max_attempts
+
+    def issue(self, phone: str, code_hash: str) -> None:
+        """Store a new code for a phone, replacing any live one and resetting attempts."""
+        raise NotImplementedError
+
+    def verify(self, phone: str, code_hash: str) -> VerificationResult:
+        """Check a code; a correct code is consumed, and every check counts as an attempt."""
+        raise NotImplementedError
+
+    def discard(self, phone: str) -> None:
+        """Drop a phone's code (e.g. when sending it failed)."""
+        raise NotImplementedError
+
+    def sweep(self) -> int:
+        """Drop expired codes; returns how many were dropped."""
+        return 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {}
+
+
+class MemoryVerificationStore(VerificationStore):
+    """In-process store with an expiry heap swept every sweep_interval_seconds."""
+
+    name = "memory"
+
+    def __init__(self, ttl_seconds: float, max_attempts: int, sweep_interval_seconds: float = 60.0) -> None:
+        super().__init__(ttl_seconds, max_attempts)
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self._codes: Dict[str, List[Any]] = {}  # phone -> [code_hash, expires_at, attempts]
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+        self._next_sweep = time.monotonic() + sweep_interval_seconds
+        self.expired = 0
+
+    def _sweep(self, now: float) -> int:
+        dropped = 0
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            expires_at, phone = heapq.heappop(self._expiry_heap)
+            entry = self._codes.get(phone)
+            # Entries for codes since reissued or used are stale and just skipped
+            if entry is not None and entry[1] == expires_at:
+                del self._codes[phone]
+                dropped += 1
+        self._next_sweep = now + self.sweep_interval_seconds
+        self.expired += dropped
+        return dropped
+
+    def issue(self, phone: str, code_hash: str) -> None:
+        now = time.monotonic()
+        expires_at = now + self.ttl_seconds
+        with self._lock:
+            self._codes[phone] = [code_hash, expires_at, 0]
+            heapq.heappush(self._expiry_heap, (expires_at, phone))
+            if now >= self._next_sweep:
+                self._sweep(now)
+
+    def verify(self, phone: str, code_hash: str) -> VerificationResult:
+        with self._lock:
+            entry = self._codes.get(phone)
+            if entry is None or entry[1] <= time.monotonic():
+                return VerificationResult.MISSING
+            entry[2] += 1
+            if hmac.compare_digest(entry[0], code_hash):
+                del self._codes[phone]
+                return VerificationResult.OK
+            if entry[2] >= self.max_attempts:
+                del self._codes[phone]
+                return VerificationResult.LOCKED
+            return VerificationResult.MISMATCH
+
+    def discard(self, phone: str) -> None:
+        with self._lock:
+            self._codes.pop(phone, None)
+
+    def sweep(self) -> int:
+        with self._lock:
+            return self._sweep(time.monotonic())
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"size": len(self._codes), "expiry_heap": len(self._expiry_heap), "expired": self.expired}
+
+
+class RedisVerificationStore(VerificationStore):
+    """Store shared by all workers (redis.Redis or FakeRedis); Redis TTLs handle expiry."""
+
+    name = "redis"
+
+    def __init__(self, client: Any, ttl_seconds: float, max_attempts: int, prefix: str = "tm:verification:") -> None:
+        super().__init__(ttl_seconds, max_attempts)
+        self.client = client
+        self.prefix = prefix
+
+    def _keys(self, phone: str) -> Tuple[str, str]:
+        return f"{self.prefix}{phone}", f"{self.prefix}{phone}:attempts"
+
+    def issue(self, phone: str, code_hash: str) -> None:
+        code_key, attempts_key = self._keys(phone)
+        self.client.delete(attempts_key)
+        self.client.set(code_key, code_hash.encode(), px=int(self.ttl_seconds * 1000))
+
+    def verify(self, phone: str, code_hash: str) -> VerificationResult:
+        code_key, attempts_key = self._keys(phone)
+        # Counting first keeps concurrent guesses from exceeding max_attempts
+        attempts = self.client.incr(attempts_key)
+        if attempts == 1:
+            self.client.pexpire(attempts_key, int(self.ttl_seconds * 1000))
+        stored: Optional[bytes] = self.client.get(code_key)
+        if stored is None:
+            return VerificationResult.MISSING
+        if hmac.compare_digest(stored, code_hash.encode()):
+            # DEL is atomic: of concurrent requests with the same correct code,
+            # only the one that actually removed it consumes it
+            if not self.client.delete(code_key):
+                return VerificationResult.MISSING
+            self.client.delete(attempts_key)
+            return VerificationResult.OK
+        if attempts >= self.max_attempts:
+            self.client.delete(code_key, attempts_key)
+            return VerificationResult.LOCKED
+        return VerificationResult.MISMATCH
+
+    def discard(self, phone: str) -> None:
+        self.client.delete(*self._keys(phone))
+
+
+def create_verification_store(
+    name: str,
+    ttl_seconds: float,
+    max_attempts: int,
+    sweep_interval_seconds: float = 60.0,
+    redis_url: Optional[str] = None,
+) -> VerificationStore:
+    """Create the store named in settings ("memory", "redis" or "fake-redis")."""
+    if name == "memory":
+        return MemoryVerificationStore(ttl_seconds, max_attempts, sweep_interval_seconds)
+    if name == "redis":
+        if not redis_url:
+            raise ValueError("VERIFICATION_CODE_REDIS_URL is required for the redis backend")
+        import redis  # Optional dependency, only needed for this backend
+        return RedisVerificationStore(redis.Redis.from_url(redis_url), ttl_seconds, max_attempts)
+    if name == "fake-redis":
+        return RedisVerificationStore(FakeRedis(), ttl_seconds, max_attempts)
+    raise ValueError(f"Unknown verification code backend: {name}")
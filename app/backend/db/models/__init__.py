@@ -4,11 +4,14 @@ from app.backend.db.models.total_manager import (
     TMCollection,
     TMMemberStatus,
     TMEventLog,
+    TMEventLogDaily,
     TMReminder,
+    TMNoticeDelivery,
     GroupType,
     PaymentType,
     CollectionStatus,
     LogType,
+    DeliveryStatus,
 )
 from app.backend.db.models.user import User
 
@@ -18,10 +21,13 @@ __all__ = [
     "TMCollection",
     "TMMemberStatus",
     "TMEventLog",
+    "TMEventLogDaily",
     "TMReminder",
+    "TMNoticeDelivery",
     "GroupType",
     "PaymentType",
     "CollectionStatus",
     "LogType",
+    "DeliveryStatus",
 ]
 
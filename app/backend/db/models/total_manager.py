@@ -1,8 +1,9 @@
 """Total Manager database models."""
-from sqlalchemy import Column, String, Integer, Date, DateTime, Boolean, ForeignKey, Enum as SQLEnum, Index
+from sqlalchemy import Column, String, Integer, BigInteger, Date, DateTime, Boolean, ForeignKey, Enum as SQLEnum, Index
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from app.backend.db.base import Base
+from app.backend.db.types import ULIDType
 import enum
 
 
@@ -36,14 +37,31 @@ class LogType(str, enum.Enum):
     REMINDER_SENT = "reminder_sent"
 
 
+class DeliveryStatus(str, enum.Enum):
+    """Notice delivery status enumeration."""
+    PENDING = "pending"  # Waiting for (re)try at next_attempt_at
+    SENDING = "sending"  # Claimed by a worker until next_attempt_at (lease)
+    SENT = "sent"
+    FAILED = "failed"  # Gave up after a permanent error or max attempts
+
+
+# Stored by value ("read", ...) to match the logtype enum created in migration 001
+LogTypeColumn = SQLEnum(LogType, name="logtype", values_callable=lambda enum: [e.value for e in enum])
+
+
 class TMGroup(Base):
     """Total Manager Group model."""
     __tablename__ = "tm_groups"
     
-    id = Column(String, primary_key=True)  # ULID string
+    id = Column(ULIDType, primary_key=True)  # ULID, stored as uuid
     owner_id = Column(String, nullable=False, index=True)
     name = Column(String, nullable=False)
     type = Column(String(20), nullable=False)  # Store as plain string instead of enum
+    # Denormalized counters, maintained by the collections service
+    collections_count = Column(Integer, nullable=False, default=0, server_default="0")
+    total_amount = Column(BigInteger, nullable=False, default=0, server_default="0")
+    # Bumped on any change to the group or its collections (ETag / response cache key)
+    version = Column(BigInteger, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     collections = relationship("TMCollection", back_populates="group", cascade="all, delete-orphan")
@@ -53,27 +71,37 @@ class TMCollection(Base):
     """Total Manager Collection model."""
     __tablename__ = "tm_collections"
     
-    id = Column(String, primary_key=True)  # ULID string
-    group_id = Column(String, ForeignKey("tm_groups.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(ULIDType, primary_key=True)  # ULID, stored as uuid
+    group_id = Column(ULIDType, ForeignKey("tm_groups.id", ondelete="CASCADE"), nullable=False, index=True)
     title = Column(String, nullable=False)
     amount = Column(Integer, nullable=False)
     due_date = Column(Date, nullable=False)
     payment_type = Column(String(20), nullable=False)  # Store as plain string instead of enum
     payment_value = Column(String, nullable=False)
     status = Column(String(20), nullable=False, default='active')  # Store as plain string instead of enum
+    # Denormalized counters, maintained by the members service
+    member_count = Column(Integer, nullable=False, default=0, server_default="0")
+    read_count = Column(Integer, nullable=False, default=0, server_default="0")
+    paid_count = Column(Integer, nullable=False, default=0, server_default="0")
+    # Bumped on any change to the collection or its members (ETag of polled reads)
+    version = Column(BigInteger, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     group = relationship("TMGroup", back_populates="collections")
     members = relationship("TMMemberStatus", back_populates="collection", cascade="all, delete-orphan")
     logs = relationship("TMEventLog", back_populates="collection", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index('ix_tm_collections_status_due_date', 'status', 'due_date'),  # Status sweep
+    )
+
 
 class TMMemberStatus(Base):
     """Total Manager Member Status model."""
     __tablename__ = "tm_member_status"
     
-    id = Column(String, primary_key=True)  # ULID string
-    collection_id = Column(String, ForeignKey("tm_collections.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(ULIDType, primary_key=True)  # ULID, stored as uuid
+    collection_id = Column(ULIDType, ForeignKey("tm_collections.id", ondelete="CASCADE"), nullable=False, index=True)
     display_name = Column(String, nullable=False)
     phone = Column(String, nullable=True)
     read_at = Column(DateTime(timezone=True), nullable=True)
@@ -87,9 +115,10 @@ class TMEventLog(Base):
     """Total Manager Event Log model."""
     __tablename__ = "tm_event_logs"
     
-    id = Column(String, primary_key=True)  # ULID string
-    collection_id = Column(String, ForeignKey("tm_collections.id", ondelete="CASCADE"), nullable=False)
-    type = Column(SQLEnum(LogType), nullable=False)
+    id = Column(ULIDType, primary_key=True)  # ULID, stored as uuid
+    collection_id = Column(ULIDType, ForeignKey("tm_collections.id", ondelete="CASCADE"), nullable=False)
+    owner_id = Column(String, nullable=False)  # Denormalized from the collection's group
+    type = Column(LogTypeColumn, nullable=False)
     message = Column(String, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
@@ -97,22 +126,41 @@ class TMEventLog(Base):
 
     __table_args__ = (
         Index('ix_tm_event_logs_collection_created', 'collection_id', 'created_at', postgresql_ops={'created_at': 'DESC'}),
+        Index('ix_tm_event_logs_owner_created', 'owner_id', 'created_at', 'id', postgresql_ops={'created_at': 'DESC', 'id': 'DESC'}),
     )
 
 
+class TMEventLogDaily(Base):
+    """Daily event log counts per owner, collection and type.
+
+    Maintained on insert alongside tm_event_logs so log statistics do not
+    scan the full log history.
+    """
+    __tablename__ = "tm_event_log_daily"
+    
+    owner_id = Column(String, primary_key=True)
+    date = Column(Date, primary_key=True)
+    collection_id = Column(ULIDType, ForeignKey("tm_collections.id", ondelete="CASCADE"), primary_key=True)
+    type = Column(LogTypeColumn, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
 class TMReminder(Base):
     """Total Manager Reminder model."""
     __tablename__ = "tm_reminders"
     
-    id = Column(String, primary_key=True)  # ULID string
+    id = Column(ULIDType, primary_key=True)  # ULID, stored as uuid
     user_id = Column(String, nullable=False, index=True)
-    collection_id = Column(String, ForeignKey("tm_collections.id", ondelete="SET NULL"), nullable=True)
+    collection_id = Column(ULIDType, ForeignKey("tm_collections.id", ondelete="SET NULL"), nullable=True)
     title = Column(String, nullable=False)
     scheduled_at = Column(DateTime(timezone=True), nullable=False, index=True)
     repeat_type = Column(String, nullable=False)  # "none", "daily", "weekly"
+    repeat_until = Column(DateTime(timezone=True), nullable=True)  # No occurrences after this
+    repeat_count = Column(Integer, nullable=True)  # Total occurrences to send
     message = Column(String, nullable=True)
-    is_sent = Column(Boolean, default=False, nullable=False)
-    sent_at = Column(DateTime(timezone=True), nullable=True)
+    is_sent = Column(Boolean, default=False, nullable=False)  # True once the series has ended
+    sent_at = Column(DateTime(timezone=True), nullable=True)  # Last sent occurrence
+    sent_count = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), nullable=True)
     
@@ -121,5 +169,35 @@ class TMReminder(Base):
     __table_args__ = (
         Index('ix_tm_reminders_user_scheduled', 'user_id', 'scheduled_at'),
         Index('ix_tm_reminders_user_sent', 'user_id', 'is_sent'),
+        Index('ix_tm_reminders_due', 'scheduled_at', postgresql_where=text('is_sent = false')),
     )
 
+
+class TMNoticeDelivery(Base):
+    """Per-member outbound delivery of a notice (durable send queue)."""
+    __tablename__ = "tm_notice_deliveries"
+    
+    id = Column(ULIDType, primary_key=True)  # ULID, stored as uuid
+    notice_id = Column(ULIDType, ForeignKey("tm_event_logs.id", ondelete="CASCADE"), nullable=False)  # notice_sent log
+    collection_id = Column(ULIDType, ForeignKey("tm_collections.id", ondelete="CASCADE"), nullable=False)
+    member_id = Column(ULIDType, ForeignKey("tm_member_status.id", ondelete="CASCADE"), nullable=False, index=True)
+    owner_id = Column(String, nullable=False)
+    channel = Column(String(20), nullable=False)  # "sms", "kakao", ...
+    phone = Column(String, nullable=False)
+    message = Column(String, nullable=False)  # Rendered for the member
+    status = Column(String(20), nullable=False, default=DeliveryStatus.PENDING.value)
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    next_attempt_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    last_error = Column(String, nullable=True)
+    provider_message_id = Column(String, nullable=True)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index('ix_tm_notice_deliveries_notice_status', 'notice_id', 'status'),
+        Index(
+            'ix_tm_notice_deliveries_due',
+            'next_attempt_at',
+            postgresql_where=text("status IN ('pending', 'sending')"),
+        ),
+    )
@@ -2,13 +2,14 @@
 from sqlalchemy import Column, String, Boolean, DateTime, Index
 from sqlalchemy.sql import func
 from app.backend.db.base import Base
+from app.backend.db.types import ULIDType
 
 
 class User(Base):
     """User model."""
     __tablename__ = "users"
     
-    id = Column(String, primary_key=True)  # ULID string
+    id = Column(ULIDType, primary_key=True)  # ULID, stored as uuid
     phone = Column(String, unique=True, nullable=True, index=True)  # 전화번호
     kakao_id = Column(String, unique=True, nullable=True, index=True)  # 카카오톡 ID
     name = Column(String, nullable=True)  # 사용자 이름
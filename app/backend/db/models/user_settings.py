@@ -2,13 +2,14 @@
 from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.sql import func
 from app.backend.db.base import Base
+from app.backend.db.types import ULIDType
 
 
 class UserSettings(Base):
     """User notification settings model."""
     __tablename__ = "user_settings"
     
-    id = Column(String, primary_key=True)  # ULID string
+    id = Column(ULIDType, primary_key=True)  # ULID, stored as uuid
     user_id = Column(String, unique=True, nullable=False, index=True)
     push_notifications_enabled = Column(Boolean, default=True, nullable=False)
     email_notifications_enabled = Column(Boolean, default=False, nullable=False)
@@ -21,7 +22,7 @@ class UserPaymentMethod(Base):
     """User payment method model."""
     __tablename__ = "user_payment_methods"
     
-    id = Column(String, primary_key=True)  # ULID string
+    id = Column(ULIDType, primary_key=True)  # ULID, stored as uuid
     user_id = Column(String, nullable=False, index=True)
     bank_name = Column(String, nullable=False)
     account_number = Column(String, nullable=False)
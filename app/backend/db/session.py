@@ -1,12 +1,202 @@
 """Database session management."""
-from sqlalchemy import create_engine
+import hashlib
+import hmac
+import itertools
+import math
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional
+
+from fastapi import Depends, Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 from app.backend.core.config import settings
+from app.backend.db.pool import engine_options
 
-engine = create_engine(settings.DATABASE_URL)
+engine = create_engine(settings.DATABASE_URL, **engine_options())
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def get_async_database_url(url: Optional[str] = None) -> str:
+    """Get the asyncpg database URL."""
+    if url is None:
+        if settings.ASYNC_DATABASE_URL:
+            return settings.ASYNC_DATABASE_URL
+        url = settings.DATABASE_URL
+    return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+
+def get_replica_urls() -> List[str]:
+    """Get the configured read replica URLs."""
+    return [url.strip() for url in settings.DATABASE_REPLICA_URLS.split(",") if url.strip()]
+
+
+replica_engines = [create_engine(url, **engine_options()) for url in get_replica_urls()]
+_replica_sessions = itertools.cycle(
+    [sessionmaker(autocommit=False, autoflush=False, bind=e) for e in replica_engines]
+    or [SessionLocal]
+)
+
+# The async engine is only created in async mode so that asyncpg is not
+# required for sync deployments.
+async_engine: Optional[AsyncEngine] = None
+AsyncSessionLocal: Optional[async_sessionmaker[AsyncSession]] = None
+async_replica_engines: List[AsyncEngine] = []
+_async_replica_sessions = None
+if settings.DATABASE_ASYNC:
+    async_engine = create_async_engine(get_async_database_url(), **engine_options(is_async=True))
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+    async_replica_engines = [
+        create_async_engine(get_async_database_url(url), **engine_options(is_async=True))
+        for url in get_replica_urls()
+    ]
+    _async_replica_sessions = itertools.cycle(
+        [async_sessionmaker(bind=e, autoflush=False, expire_on_commit=False) for e in async_replica_engines]
+        or [AsyncSessionLocal]
+    )
+
+
+# Read-your-writes: the time of a user's last commit on the primary travels
+# with the client (READ_YOUR_WRITES_COOKIE, or the X-Last-Write-At header for
+# clients without a cookie jar), so any worker can route its next reads to the
+# primary. The marker is "<epoch seconds>.<HMAC>" signed with SECRET_KEY for
+# that user, so a client cannot pin its reads to the primary by sending a
+# made-up time. _last_write_at is only a per-process fallback for clients
+# that send neither: it covers reads handled by the worker that took the write.
+READ_YOUR_WRITES_COOKIE = "tm_last_write"
+LAST_WRITE_HEADER = "x-last-write-at"
+_last_write_at: Dict[str, float] = {}
+_last_write_lock = threading.Lock()
+# Per-request holder the middleware turns into the cookie/header
+_request_write: ContextVar[Optional[Dict[str, str]]] = ContextVar("request_write", default=None)
+
+
+def _last_write_signature(user_id: str, at: str) -> str:
+    """Sign a last-write time for one user."""
+    return hmac.new(settings.SECRET_KEY.encode(), f"last_write:{user_id}:{at}".encode(), hashlib.sha256).hexdigest()
+
+
+def record_write(user_id: str) -> None:
+    """Record that a user has just written to the primary."""
+    marker = _request_write.get()
+    if marker is not None:
+        at = f"{time.time():.3f}"
+        marker["value"] = f"{at}.{_last_write_signature(user_id, at)}"
+    now = time.monotonic()
+    with _last_write_lock:
+        _last_write_at[user_id] = now
+        if len(_last_write_at) > 10000:
+            expired = [
+                uid for uid, at in _last_write_at.items()
+                if now - at > settings.READ_YOUR_WRITES_SECONDS
+            ]
+            for uid in expired:
+                del _last_write_at[uid]
+
+
+def client_last_write(request: Request, user_id: str) -> Optional[float]:
+    """Get the last-write time (epoch seconds) the client sent back, if any.
+    
+    Returns None unless the marker was signed for this user. The time is
+    clamped to now, so clock skew between workers cannot extend the window.
+    """
+    raw = request.headers.get(LAST_WRITE_HEADER) or request.cookies.get(READ_YOUR_WRITES_COOKIE)
+    at, _, signature = (raw or "").rpartition(".")
+    if not at or not hmac.compare_digest(signature, _last_write_signature(user_id, at)):
+        return None
+    try:
+        return min(float(at), time.time())
+    except ValueError:
+        return None
+
+
+def has_recent_write(user_id: str, last_write: Optional[float] = None) -> bool:
+    """Check whether a user wrote within the read-your-writes window.
+    
+    A last_write outside [now - READ_YOUR_WRITES_SECONDS, now] is ignored.
+    """
+    if last_write is not None and 0 <= time.time() - last_write < settings.READ_YOUR_WRITES_SECONDS:
+        return True
+    at = _last_write_at.get(user_id)
+    return at is not None and time.monotonic() - at < settings.READ_YOUR_WRITES_SECONDS
+
+
+class ReadYourWritesMiddleware:
+    """ASGI middleware returning the time of a request's primary commit to the client.
+    
+    Responses to requests that committed carry X-Last-Write-At and a
+    short-lived cookie with the same signed value; read_db_dependency checks
+    either.
+    """
+    
+    def __init__(self, app: Any) -> None:
+        self.app = app
+    
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        marker: Dict[str, str] = {}
+        token = _request_write.set(marker)
+        
+        async def send_with_marker(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start" and "value" in marker:
+                value = marker["value"]
+                max_age = math.ceil(settings.READ_YOUR_WRITES_SECONDS)
+                message = {**message, "headers": [
+                    *message.get("headers", []),
+                    (LAST_WRITE_HEADER.encode(), value.encode()),
+                    (b"set-cookie", f"{READ_YOUR_WRITES_COOKIE}={value}; Max-Age={max_age}; Path=/; HttpOnly; SameSite=Lax".encode()),
+                ]}
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_with_marker)
+        finally:
+            _request_write.reset(token)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _record_user_write(session: Session) -> None:
+    """Start the read-your-writes window for the session's user."""
+    user_id = session.info.get("user_id")
+    if user_id:
+        record_write(user_id)
+
+
+def warm_up_pool() -> None:
+    """Pre-open pooled connections so the first requests skip connection setup."""
+    if not settings.DB_POOL_WARMUP or settings.DB_PGBOUNCER:
+        return
+    connections = []
+    try:
+        for e in [engine, *replica_engines]:
+            for _ in range(settings.DB_POOL_SIZE):
+                connections.append(e.connect())
+    finally:
+        for connection in connections:
+            connection.close()
+
+
+async def warm_up_async_pool() -> None:
+    """Pre-open pooled async connections."""
+    if async_engine is None or not settings.DB_POOL_WARMUP or settings.DB_PGBOUNCER:
+        return
+    connections = []
+    try:
+        for e in [async_engine, *async_replica_engines]:
+            for _ in range(settings.DB_POOL_SIZE):
+                connections.append(await e.connect())
+    finally:
+        for connection in connections:
+            await connection.close()
+
+
 def get_db() -> Session:
     """Get database session."""
     db = SessionLocal()
@@ -15,3 +205,61 @@ def get_db() -> Session:
     finally:
         db.close()
 
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """Get async database session."""
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async database mode is disabled (set DATABASE_ASYNC=true)")
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def get_replica_db() -> Iterator[Session]:
+    """Get a read-only session on a replica (the primary when none is configured)."""
+    db = next(_replica_sessions)()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def write_db_dependency(get_user_id: Callable[..., str]) -> Callable[..., Iterator[Session]]:
+    """Build a primary session dependency that records the user's writes."""
+    def get_write_db(user_id: str = Depends(get_user_id)) -> Iterator[Session]:
+        db = SessionLocal()
+        db.info["user_id"] = user_id
+        try:
+            yield db
+        finally:
+            db.close()
+    return get_write_db
+
+
+def read_db_dependency(get_user_id: Callable[..., str]) -> Callable[..., Iterator[Session]]:
+    """Build a read session dependency routed to a replica.
+    
+    Falls back to the primary when no replica is configured or the user
+    wrote within the read-your-writes window (per the client's marker or,
+    failing that, this process's record).
+    """
+    def get_read_db(request: Request, user_id: str = Depends(get_user_id)) -> Iterator[Session]:
+        recent = has_recent_write(user_id, client_last_write(request, user_id))
+        session_factory = SessionLocal if recent else next(_replica_sessions)
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+    return get_read_db
+
+
+def async_read_db_dependency(get_user_id: Callable[..., str]) -> Callable[..., AsyncIterator[AsyncSession]]:
+    """Build an async read session dependency routed to a replica."""
+    async def get_async_read_db(request: Request, user_id: str = Depends(get_user_id)) -> AsyncIterator[AsyncSession]:
+        if AsyncSessionLocal is None:
+            raise RuntimeError("Async database mode is disabled (set DATABASE_ASYNC=true)")
+        recent = has_recent_write(user_id, client_last_write(request, user_id))
+        session_factory = AsyncSessionLocal if recent else next(_async_replica_sessions)
+        async with session_factory() as db:
+            yield db
+    return get_async_read_db
@@ -0,0 +1,34 @@
+"""Custom column types."""
+import uuid
+from typing import Any, Optional
+
+from sqlalchemy import Uuid
+from sqlalchemy.types import TypeDecorator
+
+from app.backend.utils.ulid import ulid_to_uuid, uuid_to_ulid
+
+# Matches no row: generate_ulid never produces the all-zero ULID
+NIL_UUID = uuid.UUID(int=0)
+
+
+class ULIDType(TypeDecorator):
+    """ULID stored as a native 16-byte uuid and exposed as its 26-char string.
+
+    Values that are not valid ULIDs (e.g. a malformed ID in a URL) bind as the
+    nil uuid, so lookups find nothing and the usual 404 follows instead of a
+    database error.
+    """
+
+    impl = Uuid(as_uuid=True)
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Any) -> Optional[uuid.UUID]:
+        if value is None or isinstance(value, uuid.UUID):
+            return value
+        try:
+            return ulid_to_uuid(value)
+        except ValueError:
+            return NIL_UUID
+
+    def process_result_value(self, value: Any, dialect: Any) -> Optional[str]:
+        return None if value is None else uuid_to_ulid(value)
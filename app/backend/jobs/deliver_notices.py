@@ -0,0 +1,40 @@
+"""Notice delivery worker.
+
+Sends queued per-member notice messages through the configured provider
+(settings.NOTICE_PROVIDER). Several workers can run at once; each claims its
+own batches with FOR UPDATE SKIP LOCKED.
+
+    python -m app.backend.jobs.deliver_notices          # run until stopped
+    python -m app.backend.jobs.deliver_notices --once   # drain once (cron)
+"""
+import argparse
+import asyncio
+import logging
+
+from app.backend.core.config import settings
+from app.backend.db.session import SessionLocal
+from app.backend.services.notice_delivery_worker import NoticeDeliveryWorker
+from app.backend.services.notice_providers import load_provider
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Deliver queued notices.")
+    parser.add_argument("--once", action="store_true", help="exit once nothing is due")
+    args = parser.parse_args()
+    
+    worker = NoticeDeliveryWorker(
+        load_provider(settings.NOTICE_PROVIDER),
+        SessionLocal,
+        concurrency=settings.NOTICE_CONCURRENCY,
+        rate_per_second=settings.NOTICE_RATE_PER_SECOND,
+        batch_size=settings.NOTICE_BATCH_SIZE,
+        max_attempts=settings.NOTICE_MAX_ATTEMPTS,
+        retry_base_seconds=settings.NOTICE_RETRY_BASE_SECONDS,
+        lease_seconds=settings.NOTICE_LEASE_SECONDS,
+    )
+    asyncio.run(worker.run(poll_seconds=settings.NOTICE_POLL_SECONDS, once=args.once))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
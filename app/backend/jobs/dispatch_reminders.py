@@ -0,0 +1,57 @@
+"""Reminder dispatcher worker.
+
+Sends reminders whose scheduled_at has passed. Several workers can run at
+once; each claims its own batch with FOR UPDATE SKIP LOCKED.
+
+    python -m app.backend.jobs.dispatch_reminders          # run until stopped
+    python -m app.backend.jobs.dispatch_reminders --once   # drain once (cron)
+"""
+import argparse
+import logging
+import time
+
+from app.backend.core.config import settings
+from app.backend.db.session import SessionLocal
+from app.backend.services.reminder_dispatch_service import dispatch_due_reminders, dispatch_stats
+
+logger = logging.getLogger(__name__)
+
+
+def run(once: bool = False) -> None:
+    """Dispatch due reminders, polling when there is nothing to send."""
+    batch_size = settings.REMINDER_DISPATCH_BATCH_SIZE
+    while True:
+        db = SessionLocal()
+        try:
+            sent = dispatch_due_reminders(db, batch_size)
+        except Exception:
+            logger.exception("Reminder dispatch batch failed")
+            sent = 0
+        finally:
+            db.close()
+        if sent:
+            stats = dispatch_stats.snapshot()
+            logger.info(
+                "Dispatched %d reminders (total %d, avg lag %.1fs, max lag %.1fs)",
+                sent,
+                stats["dispatched"],
+                stats["lag_avg_seconds"],
+                stats["lag_max_seconds"],
+            )
+        # A full batch means more may be due; otherwise wait for new ones
+        if sent < batch_size:
+            if once:
+                return
+            time.sleep(settings.REMINDER_DISPATCH_POLL_SECONDS)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Dispatch due reminders.")
+    parser.add_argument("--once", action="store_true", help="exit once no due reminders are left")
+    args = parser.parse_args()
+    run(once=args.once)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
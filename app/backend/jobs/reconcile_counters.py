@@ -0,0 +1,32 @@
+"""Counter reconciliation job.
+
+Recomputes the denormalized counters on tm_collections and tm_groups and
+repairs any drift. Run periodically (e.g. from cron):
+
+    python -m app.backend.jobs.reconcile_counters
+"""
+import logging
+
+from app.backend.db.session import SessionLocal
+from app.backend.services.counters_service import reconcile_counters
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    """Run one reconciliation pass."""
+    db = SessionLocal()
+    try:
+        result = reconcile_counters(db)
+    finally:
+        db.close()
+    logger.info(
+        "Counter reconciliation done: %d collections, %d groups fixed",
+        result["collections_fixed"],
+        result["groups_fixed"],
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
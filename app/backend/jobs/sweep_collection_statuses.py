@@ -0,0 +1,33 @@
+"""Collection status sweep job.
+
+Moves collections to due_soon/closed as their due dates approach and pass.
+Run at least daily, shortly after midnight (e.g. from cron); running it more
+often or from several hosts at once is safe:
+
+    python -m app.backend.jobs.sweep_collection_statuses
+"""
+import logging
+
+from app.backend.db.session import SessionLocal
+from app.backend.services.collection_status_service import sweep_collection_statuses
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    """Run one sweep."""
+    db = SessionLocal()
+    try:
+        result = sweep_collection_statuses(db)
+    finally:
+        db.close()
+    logger.info(
+        "Collection status sweep done: %d closed, %d due soon",
+        result["closed"],
+        result["due_soon"],
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
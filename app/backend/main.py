@@ -1,5 +1,9 @@
 """FastAPI application main file."""
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from app.backend.routers import (
     auth,
     groups,
@@ -9,9 +13,38 @@ from app.backend.routers import (
     notices,
     reminders,
     user_settings,
+    metrics,
+    exports,
 )
+from app.backend.core.config import settings
+from app.backend.core.rate_limit import RateLimitMiddleware, rate_limiter
+from app.backend.db.session import ReadYourWritesMiddleware, warm_up_pool, warm_up_async_pool
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown."""
+    try:
+        await run_in_threadpool(warm_up_pool)
+        await warm_up_async_pool()
+    except Exception:
+        logger.warning("Database pool warm-up failed", exc_info=True)
+    yield
+
+
+app = FastAPI(title="Total Manager API", version="1.0.0", lifespan=lifespan)
+
+app.add_middleware(ReadYourWritesMiddleware)
 
-app = FastAPI(title="Total Manager API", version="1.0.0")
+if settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(
+        RateLimitMiddleware,
+        limiter=rate_limiter,
+        trust_forwarded=settings.RATE_LIMIT_TRUST_FORWARDED,
+        forwarded_hops=settings.RATE_LIMIT_FORWARDED_HOPS,
+    )
 
 # Include routers
 app.include_router(auth.router)
@@ -22,6 +55,8 @@ app.include_router(logs.router)
 app.include_router(notices.router)
 app.include_router(reminders.router)
 app.include_router(user_settings.router)
+app.include_router(exports.router)
+app.include_router(metrics.router)
 
 @app.get("/")
 def root():
@@ -7,6 +7,8 @@ from app.backend.routers import (
     notices,
     reminders,
     user_settings,
+    metrics,
+    exports,
 )
 
 __all__ = [
@@ -17,4 +19,6 @@ __all__ = [
     "notices",
     "reminders",
     "user_settings",
+    "metrics",
+    "exports",
 ]
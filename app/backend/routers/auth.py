@@ -1,6 +1,7 @@
 """Authentication router."""
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
+from app.backend.core.security import get_current_user_id
 from app.backend.db.session import get_db
 from app.backend.schemas.auth import (
     SignupRequest,
@@ -16,7 +17,9 @@ from app.backend.services.auth_service import (
     get_user_by_phone,
     create_access_token,
     phone_login,
+    get_user_principal,
 )
+from app.backend.services.verification_service import send_verification_code
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -67,32 +70,20 @@ def login_kakao(
 
 
 @router.post("/send-verification-code", response_model=SendVerificationCodeResponse)
-def send_verification_code(
-    request: SendVerificationCodeRequest,
-    db: Session = Depends(get_db),
-):
+async def send_verification_code_endpoint(request: SendVerificationCodeRequest):
     """SMS 인증 코드 발송."""
-    # TODO: SMS 발송 서비스 연동
-    # 현재는 임시로 성공 응답만 반환
+    await send_verification_code(request.phone)
     return SendVerificationCodeResponse(
         success=True,
-        message="인증 코드가 발송되었습니다 (개발 모드: 실제 발송되지 않음)"
+        message="인증 코드가 발송되었습니다"
     )
 
 
 @router.get("/me", response_model=UserOut)
 def get_current_user(
     db: Session = Depends(get_db),
-    # TODO: JWT 토큰에서 user_id 추출
-    user_id: str = "user_123",  # 임시
+    user_id: str = Depends(get_current_user_id),
 ):
     """현재 사용자 정보 조회."""
-    from app.backend.db.models.user import User
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="사용자를 찾을 수 없습니다"
-        )
-    return UserOut.model_validate(user)
+    return get_user_principal(db, user_id)
 
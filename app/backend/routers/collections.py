@@ -1,9 +1,13 @@
 """Collections router."""
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
-from app.backend.db.session import get_db
+from app.backend.core.config import settings
+from app.backend.core.etag import conditional_response, make_etag
+from app.backend.core.security import get_current_user_id
+from app.backend.db.session import read_db_dependency, async_read_db_dependency, write_db_dependency
 from app.backend.schemas.total_manager import (
     CollectionCreate,
     CollectionOut,
@@ -16,16 +20,17 @@ from app.backend.services.collections_service import (
     update_collection,
     delete_collection,
     get_collection_summary,
+    get_collection_summaries,
 )
-from app.backend.services.common import verify_collection_access
+from app.backend.services.common import verify_collection_access, get_collection_version, get_group_version
+from app.backend.services import async_reads_service
 
 router = APIRouter(prefix="/total-manager", tags=["collections"])
 
 
-# Temporary auth dependency - replace with actual auth when available
-def get_current_user_id() -> str:
-    """Get current user ID. TODO: Replace with actual auth."""
-    return "user_123"
+get_read_db = read_db_dependency(get_current_user_id)
+get_async_read_db = async_read_db_dependency(get_current_user_id)
+get_write_db = write_db_dependency(get_current_user_id)
 
 
 @router.post(
@@ -36,7 +41,7 @@ def get_current_user_id() -> str:
 def create_collection_endpoint(
     group_id: str,
     collection_data: CollectionCreate,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_write_db),
     user_id: str = Depends(get_current_user_id),
 ):
     """Create a new collection."""
@@ -46,17 +51,34 @@ def create_collection_endpoint(
 @router.get("/groups/{group_id}/collections", response_model=List[CollectionOut])
 def list_collections_endpoint(
     group_id: str,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_read_db),
     user_id: str = Depends(get_current_user_id),
 ):
-    """List all collections for a group."""
+    """List all collections for a group (supports If-None-Match)."""
+    etag = make_etag("collections", group_id, get_group_version(db, group_id, user_id))
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
     return list_collections(db, group_id, user_id)
 
 
+# Registered before /collections/{collection_id} so "summaries" is not taken as an ID.
+@router.get("/collections/summaries", response_model=List[CollectionSummaryOut])
+def get_collection_summaries_endpoint(
+    ids: List[str] = Query(..., min_length=1, max_length=100),
+    db: Session = Depends(get_read_db),
+    user_id: str = Depends(get_current_user_id),
+):
+    """Get summaries for many collections at once."""
+    return get_collection_summaries(db, ids, user_id)
+
+
 @router.get("/collections/{collection_id}", response_model=CollectionOut)
 def get_collection_endpoint(
     collection_id: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     user_id: str = Depends(get_current_user_id),
 ):
     """Get a collection by ID."""
@@ -67,7 +89,7 @@ def get_collection_endpoint(
 def update_collection_endpoint(
     collection_id: str,
     collection_data: CollectionUpdate,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_write_db),
     user_id: str = Depends(get_current_user_id),
 ):
     """Update a collection."""
@@ -77,7 +99,7 @@ def update_collection_endpoint(
 @router.delete("/collections/{collection_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_collection_endpoint(
     collection_id: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_write_db),
     user_id: str = Depends(get_current_user_id),
 ):
     """Delete a collection."""
@@ -85,12 +107,34 @@ def delete_collection_endpoint(
     return None
 
 
-@router.get("/collections/{collection_id}/summary", response_model=CollectionSummaryOut)
-def get_collection_summary_endpoint(
-    collection_id: str,
-    db: Session = Depends(get_db),
-    user_id: str = Depends(get_current_user_id),
-):
-    """Get collection summary with statistics."""
-    return get_collection_summary(db, collection_id, user_id)
+if settings.DATABASE_ASYNC:
+    @router.get("/collections/{collection_id}/summary", response_model=CollectionSummaryOut)
+    async def get_collection_summary_endpoint(
+        collection_id: str,
+        request: Request,
+        response: Response,
+        db: AsyncSession = Depends(get_async_read_db),
+        user_id: str = Depends(get_current_user_id),
+    ):
+        """Get collection summary with statistics (supports If-None-Match)."""
+        version = await async_reads_service.get_collection_version(db, collection_id, user_id)
+        not_modified = conditional_response(request, response, make_etag("summary", collection_id, version))
+        if not_modified:
+            return not_modified
+        return await async_reads_service.get_collection_summary(db, collection_id, user_id, version)
+else:
+    @router.get("/collections/{collection_id}/summary", response_model=CollectionSummaryOut)
+    def get_collection_summary_endpoint(
+        collection_id: str,
+        request: Request,
+        response: Response,
+        db: Session = Depends(get_read_db),
+        user_id: str = Depends(get_current_user_id),
+    ):
+        """Get collection summary with statistics (supports If-None-Match)."""
+        version = get_collection_version(db, collection_id, user_id)
+        not_modified = conditional_response(request, response, make_etag("summary", collection_id, version))
+        if not_modified:
+            return not_modified
+        return get_collection_summary(db, collection_id, user_id, version)
 
@@ -0,0 +1,67 @@
+"""Exports router."""
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from typing import Iterator, Optional
+
+from app.backend.core.security import get_current_user_id
+from app.backend.db.session import read_db_dependency
+from app.backend.db.models.total_manager import LogType
+from app.backend.routers.logs import parse_log_type
+from app.backend.services.exports_service import export_members, export_collections, export_logs
+
+router = APIRouter(prefix="/total-manager", tags=["exports"])
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+get_read_db = read_db_dependency(get_current_user_id)
+
+
+def export_response(chunks: Iterator[str], export_format: str, filename: str) -> StreamingResponse:
+    """Wrap export chunks in a downloadable streaming response."""
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format}"'},
+    )
+
+
+@router.get("/collections/{collection_id}/members/export")
+def export_members_endpoint(
+    collection_id: str,
+    export_format: str = Query("csv", alias="format", pattern="^(csv|ndjson)$"),
+    db: Session = Depends(get_read_db),
+    user_id: str = Depends(get_current_user_id),
+):
+    """Export a collection's members as CSV or NDJSON."""
+    chunks = export_members(db, collection_id, user_id, export_format)
+    return export_response(chunks, export_format, f"members-{collection_id}")
+
+
+@router.get("/groups/{group_id}/collections/export")
+def export_collections_endpoint(
+    group_id: str,
+    export_format: str = Query("csv", alias="format", pattern="^(csv|ndjson)$"),
+    db: Session = Depends(get_read_db),
+    user_id: str = Depends(get_current_user_id),
+):
+    """Export a group's collections as CSV or NDJSON."""
+    chunks = export_collections(db, group_id, user_id, export_format)
+    return export_response(chunks, export_format, f"collections-{group_id}")
+
+
+@router.get("/logs/export")
+def export_logs_endpoint(
+    collection_id: Optional[str] = Query(None),
+    log_type: Optional[LogType] = Depends(parse_log_type),
+    export_format: str = Query("csv", alias="format", pattern="^(csv|ndjson)$"),
+    db: Session = Depends(get_read_db),
+    user_id: str = Depends(get_current_user_id),
+):
+    """Export all event logs for the current user as CSV or NDJSON."""
+    chunks = export_logs(db, user_id, export_format, collection_id=collection_id, log_type=log_type)
+    return export_response(chunks, export_format, "logs")
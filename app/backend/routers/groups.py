@@ -3,7 +3,8 @@ from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
 from typing import List
 
-from app.backend.db.session import get_db
+from app.backend.core.security import get_current_user_id
+from app.backend.db.session import read_db_dependency, write_db_dependency
 from app.backend.schemas.total_manager import GroupCreate, GroupOut, GroupUpdate, GroupDetailOut
 from app.backend.services.groups_service import (
     create_group,
@@ -16,16 +17,14 @@ from app.backend.services.groups_service import (
 router = APIRouter(prefix="/total-manager/groups", tags=["groups"])
 
 
-# Temporary auth dependency - replace with actual auth when available
-def get_current_user_id() -> str:
-    """Get current user ID. TODO: Replace with actual auth."""
-    return "user_123"
+get_read_db = read_db_dependency(get_current_user_id)
+get_write_db = write_db_dependency(get_current_user_id)
 
 
 @router.post("", response_model=GroupOut, status_code=status.HTTP_201_CREATED)
 def create_group_endpoint(
     group_data: GroupCreate,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_write_db),
     user_id: str = Depends(get_current_user_id),
 ):
     """Create a new group."""
@@ -34,7 +33,7 @@ def create_group_endpoint(
 
 @router.get("", response_model=List[GroupOut])
 def list_groups_endpoint(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     user_id: str = Depends(get_current_user_id),
 ):
     """List all groups for the current user."""
@@ -44,7 +43,7 @@ def list_groups_endpoint(
 @router.get("/{group_id}", response_model=GroupDetailOut)
 def get_group_endpoint(
     group_id: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     user_id: str = Depends(get_current_user_id),
 ):
     """Get a group by ID with statistics."""
@@ -55,7 +54,7 @@ def get_group_endpoint(
 def update_group_endpoint(
     group_id: str,
     group_data: GroupUpdate,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_write_db),
     user_id: str = Depends(get_current_user_id),
 ):
     """Update a group."""
@@ -65,7 +64,7 @@ def update_group_endpoint(
 @router.delete("/{group_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_group_endpoint(
     group_id: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_write_db),
     user_id: str = Depends(get_current_user_id),
 ):
     """Delete a group."""
@@ -1,63 +1,106 @@
 """Logs router."""
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 
-from app.backend.db.session import get_db
+from app.backend.core.config import settings
+from app.backend.core.security import get_current_user_id
+from app.backend.db.session import read_db_dependency, async_read_db_dependency
 from app.backend.db.models.total_manager import LogType
-from app.backend.schemas.total_manager import EventLogOut, LogStatsOut
+from app.backend.schemas.total_manager import EventLogOut, EventLogPageOut, LogStatsOut
 from app.backend.services.logs_service import (
     list_logs,
     list_all_logs,
     get_log_stats,
 )
+from app.backend.services import async_reads_service
 
 router = APIRouter(prefix="/total-manager", tags=["logs"])
 
 
-# Temporary auth dependency - replace with actual auth when available
-def get_current_user_id() -> str:
-    """Get current user ID. TODO: Replace with actual auth."""
-    return "user_123"
-
-
-@router.get("/collections/{collection_id}/logs", response_model=List[EventLogOut])
-def list_logs_endpoint(
-    collection_id: str,
-    db: Session = Depends(get_db),
-    user_id: str = Depends(get_current_user_id),
-):
-    """List all logs for a collection."""
-    return list_logs(db, collection_id, user_id)
-
-
-@router.get("/logs", response_model=dict)
-def list_all_logs_endpoint(
-    collection_id: Optional[str] = Query(None),
-    log_type: Optional[str] = Query(None),
-    limit: int = Query(50, ge=1, le=100),
-    offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
-    user_id: str = Depends(get_current_user_id),
-):
-    """List all logs for the current user."""
-    log_type_enum = None
-    if log_type:
-        try:
-            log_type_enum = LogType(log_type)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid log_type: {log_type}"
-            )
-    return list_all_logs(db, user_id, collection_id=collection_id, log_type=log_type_enum, limit=limit, offset=offset)
-
-
-@router.get("/logs/stats", response_model=LogStatsOut)
-def get_log_stats_endpoint(
-    db: Session = Depends(get_db),
-    user_id: str = Depends(get_current_user_id),
-):
-    """Get log statistics for the current user."""
-    return get_log_stats(db, user_id)
+get_read_db = read_db_dependency(get_current_user_id)
+get_async_read_db = async_read_db_dependency(get_current_user_id)
 
+
+def parse_log_type(log_type: Optional[str] = Query(None)) -> Optional[LogType]:
+    """Parse the log_type query parameter."""
+    if not log_type:
+        return None
+    try:
+        return LogType(log_type)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid log_type: {log_type}"
+        )
+
+
+if settings.DATABASE_ASYNC:
+    @router.get("/collections/{collection_id}/logs", response_model=List[EventLogOut])
+    async def list_logs_endpoint(
+        collection_id: str,
+        db: AsyncSession = Depends(get_async_read_db),
+        user_id: str = Depends(get_current_user_id),
+    ):
+        """List all logs for a collection."""
+        return await async_reads_service.list_logs(db, collection_id, user_id)
+
+    @router.get("/logs", response_model=EventLogPageOut)
+    async def list_all_logs_endpoint(
+        collection_id: Optional[str] = Query(None),
+        log_type: Optional[LogType] = Depends(parse_log_type),
+        limit: int = Query(50, ge=1, le=100),
+        offset: int = Query(0, ge=0),
+        cursor: Optional[str] = Query(None),
+        count: str = Query("exact", pattern="^(exact|approximate|none)$"),
+        db: AsyncSession = Depends(get_async_read_db),
+        user_id: str = Depends(get_current_user_id),
+    ):
+        """List all logs for the current user."""
+        return await async_reads_service.list_all_logs(
+            db, user_id, collection_id=collection_id, log_type=log_type,
+            limit=limit, offset=offset, cursor=cursor, count=count
+        )
+
+    @router.get("/logs/stats", response_model=LogStatsOut)
+    async def get_log_stats_endpoint(
+        db: AsyncSession = Depends(get_async_read_db),
+        user_id: str = Depends(get_current_user_id),
+    ):
+        """Get log statistics for the current user."""
+        return await async_reads_service.get_log_stats(db, user_id)
+else:
+    @router.get("/collections/{collection_id}/logs", response_model=List[EventLogOut])
+    def list_logs_endpoint(
+        collection_id: str,
+        db: Session = Depends(get_read_db),
+        user_id: str = Depends(get_current_user_id),
+    ):
+        """List all logs for a collection."""
+        return list_logs(db, collection_id, user_id)
+
+    @router.get("/logs", response_model=EventLogPageOut)
+    def list_all_logs_endpoint(
+        collection_id: Optional[str] = Query(None),
+        log_type: Optional[LogType] = Depends(parse_log_type),
+        limit: int = Query(50, ge=1, le=100),
+        offset: int = Query(0, ge=0),
+        cursor: Optional[str] = Query(None),
+        count: str = Query("exact", pattern="^(exact|approximate|none)$"),
+        db: Session = Depends(get_read_db),
+        user_id: str = Depends(get_current_user_id),
+    ):
+        """List all logs for the current user."""
+        return list_all_logs(
+            db, user_id, collection_id=collection_id, log_type=log_type,
+            limit=limit, offset=offset, cursor=cursor, count=count
+        )
+
+    @router.get("/logs/stats", response_model=LogStatsOut)
+    def get_log_stats_endpoint(
+        db: Session = Depends(get_read_db),
+        user_id: str = Depends(get_current_user_id),
+    ):
+        """Get log statistics for the current user."""
+        return get_log_stats(db, user_id)
@@ -1,14 +1,22 @@
 """Members router."""
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, File, Request, Response, UploadFile, status
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
-from app.backend.db.session import get_db
+from app.backend.core.config import settings
+from app.backend.core.etag import conditional_response, make_etag
+from app.backend.core.security import get_current_user_id
+from app.backend.db.session import read_db_dependency, async_read_db_dependency, write_db_dependency
 from app.backend.schemas.total_manager import (
     MemberCreate,
     MemberOut,
     MemberUpdate,
     BulkMemberCreate,
+    BulkMemberOut,
+    BulkMemberMark,
+    BulkMemberMarkOut,
+    RosterImportOut,
 )
 from app.backend.services.members_service import (
     add_member,
@@ -18,15 +26,19 @@ from app.backend.services.members_service import (
     bulk_add_members,
     mark_read,
     mark_paid,
+    bulk_mark_read,
+    bulk_mark_paid,
 )
+from app.backend.services.roster_import_service import import_roster_csv
+from app.backend.services.common import get_collection_version
+from app.backend.services import async_reads_service
 
 router = APIRouter(prefix="/total-manager", tags=["members"])
 
 
-# Temporary auth dependency - replace with actual auth when available
-def get_current_user_id() -> str:
-    """Get current user ID. TODO: Replace with actual auth."""
-    return "user_123"
+get_read_db = read_db_dependency(get_current_user_id)
+get_async_read_db = async_read_db_dependency(get_current_user_id)
+get_write_db = write_db_dependency(get_current_user_id)
 
 
 @router.post(
@@ -37,28 +49,50 @@ def get_current_user_id() -> str:
 def add_member_endpoint(
     collection_id: str,
     member_data: MemberCreate,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_write_db),
     user_id: str = Depends(get_current_user_id),
 ):
     """Add a member to a collection."""
     return add_member(db, collection_id, user_id, member_data)
 
 
-@router.get("/collections/{collection_id}/members", response_model=List[MemberOut])
-def list_members_endpoint(
-    collection_id: str,
-    db: Session = Depends(get_db),
-    user_id: str = Depends(get_current_user_id),
-):
-    """List all members for a collection."""
-    return list_members(db, collection_id, user_id)
+if settings.DATABASE_ASYNC:
+    @router.get("/collections/{collection_id}/members", response_model=List[MemberOut])
+    async def list_members_endpoint(
+        collection_id: str,
+        request: Request,
+        response: Response,
+        db: AsyncSession = Depends(get_async_read_db),
+        user_id: str = Depends(get_current_user_id),
+    ):
+        """List all members for a collection (supports If-None-Match)."""
+        version = await async_reads_service.get_collection_version(db, collection_id, user_id)
+        not_modified = conditional_response(request, response, make_etag("members", collection_id, version))
+        if not_modified:
+            return not_modified
+        return await async_reads_service.list_members(db, collection_id, user_id)
+else:
+    @router.get("/collections/{collection_id}/members", response_model=List[MemberOut])
+    def list_members_endpoint(
+        collection_id: str,
+        request: Request,
+        response: Response,
+        db: Session = Depends(get_read_db),
+        user_id: str = Depends(get_current_user_id),
+    ):
+        """List all members for a collection (supports If-None-Match)."""
+        version = get_collection_version(db, collection_id, user_id)
+        not_modified = conditional_response(request, response, make_etag("members", collection_id, version))
+        if not_modified:
+            return not_modified
+        return list_members(db, collection_id, user_id)
 
 
 @router.patch("/members/{member_id}", response_model=MemberOut)
 def update_member_endpoint(
     member_id: str,
     member_data: MemberUpdate,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_write_db),
     user_id: str = Depends(get_current_user_id),
 ):
     """Update a member."""
@@ -68,7 +102,7 @@ def update_member_endpoint(
 @router.delete("/members/{member_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_member_endpoint(
     member_id: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_write_db),
     user_id: str = Depends(get_current_user_id),
 ):
     """Delete a member."""
@@ -76,21 +110,54 @@ def delete_member_endpoint(
     return None
 
 
-@router.post("/collections/{collection_id}/members/bulk", response_model=dict)
+@router.post("/collections/{collection_id}/members/bulk", response_model=BulkMemberOut)
 def bulk_add_members_endpoint(
     collection_id: str,
     bulk_data: BulkMemberCreate,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_write_db),
     user_id: str = Depends(get_current_user_id),
 ):
     """Add multiple members at once."""
     return bulk_add_members(db, collection_id, user_id, bulk_data)
 
 
+@router.post("/collections/{collection_id}/members/import", response_model=RosterImportOut)
+def import_roster_endpoint(
+    collection_id: str,
+    file: UploadFile = File(...),
+    db: Session = Depends(get_write_db),
+    user_id: str = Depends(get_current_user_id),
+):
+    """Import members from a CSV roster (display_name, phone columns)."""
+    return import_roster_csv(db, collection_id, user_id, file.file)
+
+
+@router.post("/collections/{collection_id}/members/read", response_model=BulkMemberMarkOut)
+def bulk_mark_read_endpoint(
+    collection_id: str,
+    bulk_data: BulkMemberMark,
+    db: Session = Depends(get_write_db),
+    user_id: str = Depends(get_current_user_id),
+):
+    """Mark many members of a collection as read."""
+    return bulk_mark_read(db, collection_id, user_id, bulk_data)
+
+
+@router.post("/collections/{collection_id}/members/paid", response_model=BulkMemberMarkOut)
+def bulk_mark_paid_endpoint(
+    collection_id: str,
+    bulk_data: BulkMemberMark,
+    db: Session = Depends(get_write_db),
+    user_id: str = Depends(get_current_user_id),
+):
+    """Mark many members of a collection as paid."""
+    return bulk_mark_paid(db, collection_id, user_id, bulk_data)
+
+
 @router.post("/members/{member_id}/read", response_model=MemberOut)
 def mark_read_endpoint(
     member_id: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_write_db),
     user_id: str = Depends(get_current_user_id),
 ):
     """Mark a member as read."""
@@ -100,7 +167,7 @@ def mark_read_endpoint(
 @router.post("/members/{member_id}/paid", response_model=MemberOut)
 def mark_paid_endpoint(
     member_id: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_write_db),
     user_id: str = Depends(get_current_user_id),
 ):
     """Mark a member as paid."""
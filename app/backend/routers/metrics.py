@@ -0,0 +1,20 @@
+"""Internal metrics router."""
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.backend.core.security import require_internal_token
+from app.backend.db.session import get_replica_db
+from app.backend.services.metrics_service import get_metrics
+
+router = APIRouter(
+    prefix="/internal",
+    tags=["internal"],
+    include_in_schema=False,
+    dependencies=[Depends(require_internal_token)],
+)
+
+
+@router.get("/metrics")
+def get_metrics_endpoint(db: Session = Depends(get_replica_db)):
+    """Get internal runtime metrics (backlog counts are read from a replica)."""
+    return get_metrics(db)
@@ -1,27 +1,41 @@
 """Notices router."""
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
+from typing import Optional
 
-from app.backend.db.session import get_db
-from app.backend.schemas.total_manager import NoticeCreate, NoticeOut
+from app.backend.core.security import get_current_user_id
+from app.backend.db.session import read_db_dependency, write_db_dependency
+from app.backend.db.models.total_manager import DeliveryStatus
+from app.backend.schemas.total_manager import NoticeCreate, NoticeOut, NoticeDeliveriesOut
 from app.backend.services.notices_service import send_notice
+from app.backend.services.notice_delivery_service import get_notice_deliveries
 
 router = APIRouter(prefix="/total-manager", tags=["notices"])
 
 
-# Temporary auth dependency - replace with actual auth when available
-def get_current_user_id() -> str:
-    """Get current user ID. TODO: Replace with actual auth."""
-    return "user_123"
+get_read_db = read_db_dependency(get_current_user_id)
+get_write_db = write_db_dependency(get_current_user_id)
 
 
 @router.post("/collections/{collection_id}/notice", response_model=NoticeOut)
 def send_notice_endpoint(
     collection_id: str,
     notice_data: NoticeCreate,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_write_db),
     user_id: str = Depends(get_current_user_id),
 ):
     """Send a notice for a collection."""
     return send_notice(db, collection_id, user_id, notice_data)
 
+
+@router.get("/notices/{notice_id}/deliveries", response_model=NoticeDeliveriesOut)
+def get_notice_deliveries_endpoint(
+    notice_id: str,
+    delivery_status: Optional[DeliveryStatus] = Query(None, alias="status"),
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_read_db),
+    user_id: str = Depends(get_current_user_id),
+):
+    """Get per-member delivery status for a notice."""
+    return get_notice_deliveries(db, notice_id, user_id, delivery_status, limit=limit, offset=offset)
@@ -1,13 +1,16 @@
 """Reminders router."""
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
+from datetime import datetime
 from typing import List, Optional
 
-from app.backend.db.session import get_db
+from app.backend.core.security import get_current_user_id
+from app.backend.db.session import get_db, write_db_dependency
 from app.backend.schemas.total_manager import (
     ReminderCreate,
     ReminderUpdate,
     ReminderOut,
+    ReminderOccurrenceOut,
 )
 from app.backend.services.reminders_service import (
     create_reminder,
@@ -17,21 +20,19 @@ from app.backend.services.reminders_service import (
     delete_reminder,
     send_reminder,
     verify_reminder_access,
+    list_upcoming_occurrences,
 )
 
 router = APIRouter(prefix="/total-manager/reminders", tags=["reminders"])
 
 
-# Temporary auth dependency - replace with actual auth when available
-def get_current_user_id() -> str:
-    """Get current user ID. TODO: Replace with actual auth."""
-    return "user_123"
+get_write_db = write_db_dependency(get_current_user_id)
 
 
 @router.post("", response_model=ReminderOut, status_code=status.HTTP_201_CREATED)
 def create_reminder_endpoint(
     reminder_data: ReminderCreate,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_write_db),
     user_id: str = Depends(get_current_user_id),
 ):
     """Create a new reminder."""
@@ -42,11 +43,30 @@ def create_reminder_endpoint(
 def list_reminders_endpoint(
     is_sent: Optional[bool] = None,
     collection_id: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    offset: int = Query(0, ge=0),
     db: Session = Depends(get_db),
     user_id: str = Depends(get_current_user_id),
 ):
     """List reminders for the current user."""
-    return list_reminders(db, user_id, is_sent=is_sent, collection_id=collection_id)
+    return list_reminders(
+        db, user_id, is_sent=is_sent, collection_id=collection_id, limit=limit, offset=offset
+    )
+
+
+@router.get("/upcoming", response_model=List[ReminderOccurrenceOut])
+def list_upcoming_occurrences_endpoint(
+    start: datetime,
+    end: datetime,
+    collection_id: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    user_id: str = Depends(get_current_user_id),
+):
+    """List reminder occurrences between start and end, including repeats."""
+    return list_upcoming_occurrences(
+        db, user_id, start, end, collection_id=collection_id, limit=limit
+    )
 
 
 @router.get("/{reminder_id}", response_model=ReminderOut)
@@ -63,7 +83,7 @@ def get_reminder_endpoint(
 def update_reminder_endpoint(
     reminder_id: str,
     reminder_data: ReminderUpdate,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_write_db),
     user_id: str = Depends(get_current_user_id),
 ):
     """Update a reminder."""
@@ -73,7 +93,7 @@ def update_reminder_endpoint(
 @router.delete("/{reminder_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_reminder_endpoint(
     reminder_id: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_write_db),
     user_id: str = Depends(get_current_user_id),
 ):
     """Delete a reminder."""
@@ -84,7 +104,7 @@ def delete_reminder_endpoint(
 @router.post("/{reminder_id}/send", response_model=ReminderOut)
 def send_reminder_endpoint(
     reminder_id: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_write_db),
     user_id: str = Depends(get_current_user_id),
 ):
     """Send a reminder immediately."""
@@ -3,6 +3,7 @@ from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
 from typing import List
 
+from app.backend.core.security import get_current_user_id
 from app.backend.db.session import get_db
 from app.backend.schemas.user_settings import (
     NotificationSettingsOut,
@@ -25,12 +26,6 @@ from app.backend.services.user_settings_service import (
 router = APIRouter(prefix="/users/me", tags=["user-settings"])
 
 
-# Temporary auth dependency - replace with actual auth when available
-def get_current_user_id() -> str:
-    """Get current user ID. TODO: Replace with actual auth."""
-    return "user_123"
-
-
 # Notification settings endpoints
 @router.get("/settings/notifications", response_model=NotificationSettingsOut)
 def get_notification_settings_endpoint(
@@ -1,5 +1,6 @@
 """Authentication schemas."""
 from pydantic import BaseModel, Field, field_validator
+from datetime import datetime
 from typing import Optional
 
 
@@ -79,3 +80,8 @@ class SendVerificationCodeResponse(BaseModel):
     success: bool = True
     message: str = "인증 코드가 발송되었습니다"
 
+
+class TokenPrincipal(BaseModel):
+    """검증된 액세스 토큰의 사용자 정보."""
+    user_id: str
+    expires_at: datetime
@@ -1,12 +1,13 @@
 """Total Manager Pydantic schemas."""
 from pydantic import BaseModel, Field, field_validator
 from datetime import date, datetime
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from app.backend.db.models.total_manager import (
     GroupType,
     PaymentType,
     CollectionStatus,
     LogType,
+    DeliveryStatus,
 )
 
 
@@ -134,8 +135,52 @@ class MemberUpdate(BaseModel):
 
 
 class BulkMemberCreate(BaseModel):
-    """Bulk member creation schema."""
-    members: List[MemberCreate]
+    """Bulk member creation schema.
+    
+    Rows are validated one by one against MemberCreate so an invalid row is
+    reported back instead of rejecting the whole batch.
+    """
+    members: List[Dict[str, Any]] = Field(..., max_length=10000)
+
+
+class BulkMemberError(BaseModel):
+    """Bulk member row error schema."""
+    index: int
+    member: Dict[str, Any]
+    error: str
+
+
+class BulkMemberOut(BaseModel):
+    """Bulk member creation result schema."""
+    created: int
+    failed: int
+    members: List[MemberOut]
+    errors: Optional[List[BulkMemberError]] = None
+
+
+class BulkMemberMark(BaseModel):
+    """Bulk mark read/paid request schema."""
+    member_ids: List[str] = Field(..., min_length=1, max_length=1000)
+
+
+class BulkMemberMarkOut(BaseModel):
+    """Bulk mark read/paid result schema."""
+    changed_ids: List[str]  # Marked by this request
+    unchanged_ids: List[str]  # Already marked before
+
+
+class RosterImportError(BaseModel):
+    """Roster import row error schema."""
+    line: int  # 1-based CSV line number (the header is line 1)
+    error: str
+
+
+class RosterImportOut(BaseModel):
+    """Roster import result schema."""
+    created: int
+    duplicates: int  # Phone already in the collection or earlier in the file
+    failed: int
+    errors: Optional[List[RosterImportError]] = None  # First 100 row errors
 
 
 # Notice schemas
@@ -148,7 +193,35 @@ class NoticeOut(BaseModel):
     """Notice output schema."""
     success: bool
     message: str
-    log_id: str
+    log_id: str  # Also the notice ID for delivery status
+    queued: int = 0  # Member messages queued for delivery
+    skipped: int = 0  # Members without a valid phone number
+
+
+class NoticeDeliveryOut(BaseModel):
+    """Per-member notice delivery output schema."""
+    id: str
+    member_id: str
+    channel: str
+    phone: str
+    message: str
+    status: DeliveryStatus
+    attempts: int
+    next_attempt_at: datetime
+    last_error: Optional[str]
+    provider_message_id: Optional[str]
+    sent_at: Optional[datetime]
+    
+    class Config:
+        from_attributes = True
+
+
+class NoticeDeliveriesOut(BaseModel):
+    """Notice delivery status output schema."""
+    notice_id: str
+    total: int
+    counts: Dict[str, int]  # By status
+    deliveries: List[NoticeDeliveryOut]
 
 
 # Event log schemas
@@ -164,6 +237,15 @@ class EventLogOut(BaseModel):
         from_attributes = True
 
 
+class EventLogPageOut(BaseModel):
+    """Paginated event log output schema."""
+    total: Optional[int] = None  # None when the count is skipped
+    limit: int
+    offset: Optional[int] = None  # None in cursor mode
+    next_cursor: Optional[str] = None  # None on the last page
+    logs: List[EventLogOut]
+
+
 # Reminder schemas
 class ReminderCreate(BaseModel):
     """Reminder creation schema."""
@@ -171,6 +253,8 @@ class ReminderCreate(BaseModel):
     title: str = Field(..., min_length=1, max_length=200)
     scheduled_at: datetime
     repeat_type: str = Field(..., pattern="^(none|daily|weekly)$")
+    repeat_until: Optional[datetime] = None
+    repeat_count: Optional[int] = Field(None, ge=1)
     message: Optional[str] = Field(None, max_length=500)
 
 
@@ -179,6 +263,8 @@ class ReminderUpdate(BaseModel):
     title: Optional[str] = Field(None, min_length=1, max_length=200)
     scheduled_at: Optional[datetime] = None
     repeat_type: Optional[str] = Field(None, pattern="^(none|daily|weekly)$")
+    repeat_until: Optional[datetime] = None
+    repeat_count: Optional[int] = Field(None, ge=1)
     message: Optional[str] = Field(None, max_length=500)
 
 
@@ -188,11 +274,14 @@ class ReminderOut(BaseModel):
     user_id: str
     collection_id: Optional[str]
     title: str
-    scheduled_at: datetime
+    scheduled_at: datetime  # Next unsent occurrence
     repeat_type: str
+    repeat_until: Optional[datetime] = None
+    repeat_count: Optional[int] = None
     message: Optional[str]
     is_sent: bool
     sent_at: Optional[datetime]
+    sent_count: int = 0
     created_at: datetime
     updated_at: Optional[datetime]
     
@@ -200,6 +289,16 @@ class ReminderOut(BaseModel):
         from_attributes = True
 
 
+class ReminderOccurrenceOut(BaseModel):
+    """Upcoming reminder occurrence output schema."""
+    reminder_id: str
+    collection_id: Optional[str]
+    title: str
+    message: Optional[str]
+    repeat_type: str
+    scheduled_at: datetime
+
+
 class LogStatsOut(BaseModel):
     """Log statistics output schema."""
     total_logs: int
@@ -0,0 +1,113 @@
+"""Benchmark for ownership checks: DB round trips and time per check.
+
+Creates a throwaway collection with members and counts the statements each
+access check sends to the database, next to the member -> collection -> group
+primary-key chain the joined checks replaced. "cold" clears the ownership
+cache before every check. Run from the project root against a development
+database:
+
+    python -m app.backend.scripts.bench_access_checks --iterations 500 --batch 50
+"""
+import argparse
+import time
+from datetime import date
+
+from sqlalchemy import delete, event, insert
+
+from app.backend.db.session import SessionLocal, engine
+from app.backend.db.models.total_manager import TMGroup, TMCollection, TMMemberStatus, GroupType, PaymentType
+from app.backend.services.common import (
+    check_collection_access,
+    get_collection,
+    get_group,
+    get_member,
+    ownership_cache,
+    verify_collection_access,
+    verify_member_access,
+    verify_members_access,
+)
+from app.backend.services.members_service import mark_read
+from app.backend.utils.ulid import generate_ulid, generate_ulids
+
+BENCH_OWNER_ID = "bench_owner"
+
+statements = 0
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def _count_statement(*_) -> None:
+    global statements
+    statements += 1
+
+
+def measure(name: str, fn, iterations: int, cold: bool = False) -> None:
+    """Print statements and microseconds per call."""
+    global statements
+    fn()  # Warm-up (and fills the ownership cache for warm runs)
+    statements = 0
+    started = time.perf_counter()
+    for _ in range(iterations):
+        if cold:
+            ownership_cache.clear()
+        fn()
+    elapsed = time.perf_counter() - started
+    print(f"{name:46} {statements / iterations:5.2f} queries  {elapsed / iterations * 1e6:8.0f} us/call")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--batch", type=int, default=50)
+    args = parser.parse_args()
+    
+    db = SessionLocal()
+    group = TMGroup(id=generate_ulid(), owner_id=BENCH_OWNER_ID, name="bench", type=GroupType.OTHER)
+    collection = TMCollection(
+        id=generate_ulid(),
+        group_id=group.id,
+        title="bench",
+        amount=10000,
+        due_date=date.today(),
+        payment_type=PaymentType.BANK,
+        payment_value="bench",
+        member_count=args.members,
+    )
+    db.add_all([group, collection])
+    db.flush()
+    member_ids = generate_ulids(args.members)
+    db.execute(insert(TMMemberStatus), [
+        {"id": member_id, "collection_id": collection.id, "display_name": f"member {i}"}
+        for i, member_id in enumerate(member_ids)
+    ])
+    db.commit()
+    try:
+        member_id = member_ids[0]
+        batch = member_ids[:args.batch]
+        
+        def chained():
+            # The lookups verify_member_access made before it was a single join
+            member = get_member(db, member_id)
+            get_group(db, get_collection(db, member.collection_id).group_id)
+        
+        measure("member: chained PK lookups (before)", chained, args.iterations)
+        measure("member: verify_member_access (cold)", lambda: verify_member_access(db, member_id, BENCH_OWNER_ID), args.iterations, cold=True)
+        measure("collection: check_collection_access (cached)", lambda: check_collection_access(db, collection.id, BENCH_OWNER_ID), args.iterations)
+        measure("collection: verify_collection_access (cold)", lambda: verify_collection_access(db, collection.id, BENCH_OWNER_ID), args.iterations, cold=True)
+        
+        def one_by_one():
+            for batch_id in batch:
+                verify_member_access(db, batch_id, BENCH_OWNER_ID)
+        
+        measure(f"{len(batch)} members: one check each (cold)", one_by_one, max(1, args.iterations // 10), cold=True)
+        measure(f"{len(batch)} members: verify_members_access", lambda: verify_members_access(db, batch, BENCH_OWNER_ID), max(1, args.iterations // 10), cold=True)
+        measure("request: mark_read (cold)", lambda: mark_read(db, member_id, BENCH_OWNER_ID), args.iterations, cold=True)
+    finally:
+        db.rollback()
+        db.execute(delete(TMGroup).where(TMGroup.id == group.id))
+        db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
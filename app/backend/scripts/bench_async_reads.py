@@ -0,0 +1,129 @@
+"""Benchmark for sync vs async throughput on the hot read endpoints.
+
+Creates a throwaway collection with members and logs, then runs the
+collection summary, member list and log list services with --concurrency
+requests in flight: the sync services in a thread pool of --threads threads
+(Starlette's default is 40) and the async services on one event loop. Async
+mode must be enabled, and the response cache disabled so the summary reaches
+the database. Run from the project root against a development database:
+
+    DATABASE_ASYNC=true RESPONSE_CACHE_BACKEND=none \\
+        python -m app.backend.scripts.bench_async_reads --requests 2000 --concurrency 200
+"""
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+from sqlalchemy import delete, insert
+
+from app.backend.db.session import AsyncSessionLocal, SessionLocal
+from app.backend.db.models.total_manager import (
+    TMGroup,
+    TMCollection,
+    TMMemberStatus,
+    TMEventLog,
+    GroupType,
+    LogType,
+    PaymentType,
+)
+from app.backend.services import async_reads_service
+from app.backend.services.collections_service import get_collection_summary
+from app.backend.services.logs_service import add_event_logs, list_logs
+from app.backend.services.members_service import list_members
+from app.backend.utils.ulid import generate_ulid, generate_ulids
+
+BENCH_OWNER_ID = "bench_owner"
+
+ENDPOINTS = {
+    "summary": (get_collection_summary, async_reads_service.get_collection_summary),
+    "members": (list_members, async_reads_service.list_members),
+    "logs": (list_logs, async_reads_service.list_logs),
+}
+
+
+def run_sync(fn, collection_id: str, requests: int, threads: int) -> float:
+    def call(_):
+        db = SessionLocal()
+        try:
+            fn(db, collection_id, BENCH_OWNER_ID)
+        finally:
+            db.close()
+    
+    started = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        list(pool.map(call, range(requests)))
+    return requests / (time.perf_counter() - started)
+
+
+async def run_async(fn, collection_id: str, requests: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def call():
+        async with semaphore:
+            async with AsyncSessionLocal() as db:
+                await fn(db, collection_id, BENCH_OWNER_ID)
+    
+    started = time.perf_counter()
+    await asyncio.gather(*(call() for _ in range(requests)))
+    return requests / (time.perf_counter() - started)
+
+
+async def compare(collection_id: str, args: argparse.Namespace) -> None:
+    # One event loop for every async run: pooled asyncpg connections are bound to it
+    print(f"{args.requests} requests, {args.concurrency} in flight, {args.threads} sync threads")
+    for name, (sync_fn, async_fn) in ENDPOINTS.items():
+        # A short warm-up fills both connection pools before timing
+        run_sync(sync_fn, collection_id, args.threads, args.threads)
+        await run_async(async_fn, collection_id, args.concurrency, args.concurrency)
+        sync_rps = run_sync(sync_fn, collection_id, args.requests, args.threads)
+        async_rps = await run_async(async_fn, collection_id, args.requests, args.concurrency)
+        print(f"{name:8} sync={sync_rps:8.0f} req/s  async={async_rps:8.0f} req/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=200)
+    parser.add_argument("--logs", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--threads", type=int, default=40)
+    args = parser.parse_args()
+    if AsyncSessionLocal is None:
+        parser.error("async mode is disabled; run with DATABASE_ASYNC=true")
+    
+    db = SessionLocal()
+    group = TMGroup(id=generate_ulid(), owner_id=BENCH_OWNER_ID, name="bench", type=GroupType.OTHER)
+    collection = TMCollection(
+        id=generate_ulid(),
+        group_id=group.id,
+        title="bench",
+        amount=10000,
+        due_date=date.today(),
+        payment_type=PaymentType.BANK,
+        payment_value="bench",
+        member_count=args.members,
+    )
+    db.add_all([group, collection])
+    db.flush()
+    if args.members:
+        db.execute(insert(TMMemberStatus), [
+            {"id": member_id, "collection_id": collection.id, "display_name": f"member {i}"}
+            for i, member_id in enumerate(generate_ulids(args.members))
+        ])
+    add_event_logs(db, BENCH_OWNER_ID, [
+        TMEventLog(id=log_id, collection_id=collection.id, owner_id=BENCH_OWNER_ID, type=LogType.READ, message="bench")
+        for log_id in generate_ulids(args.logs)
+    ])
+    db.commit()
+    try:
+        asyncio.run(compare(collection.id, args))
+    finally:
+        db.execute(delete(TMGroup).where(TMGroup.id == group.id))
+        db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark for access token authentication overhead.
+
+Times token verification with and without the verified-token cache, and the
+per-request cost of the auth dependency on a minimal endpoint. No database is
+needed:
+
+    python -m app.backend.scripts.bench_auth --iterations 20000
+"""
+import argparse
+import time
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.backend.core.security import create_access_token, get_current_user_id, token_cache, verify_access_token
+
+
+def per_call_us(fn, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+    
+    token = create_access_token("bench_user")
+    
+    def verify_uncached():
+        token_cache.clear()
+        verify_access_token(token)
+    
+    print(f"verify (signature check): {per_call_us(verify_uncached, args.iterations):.1f} us/op")
+    print(f"verify (cached):          {per_call_us(lambda: verify_access_token(token), args.iterations):.1f} us/op")
+    
+    app = FastAPI()
+    
+    @app.get("/open")
+    def open_endpoint():
+        return {}
+    
+    @app.get("/authed")
+    def authed_endpoint(user_id: str = Depends(get_current_user_id)):
+        return {}
+    
+    client = TestClient(app, headers={"Authorization": f"Bearer {token}"})
+    # Interleave short rounds so drift in the test client does not skew the delta
+    rounds, per_round = 20, max(1, args.iterations // 200)
+    open_us = authed_us = 0.0
+    for _ in range(rounds):
+        open_us += per_call_us(lambda: client.get("/open"), per_round) / rounds
+        authed_us += per_call_us(lambda: client.get("/authed"), per_round) / rounds
+    print(f"request without auth:     {open_us:.1f} us")
+    print(f"request with auth:        {authed_us:.1f} us (overhead {authed_us - open_us:.1f} us)")
+
+if __name__ == "__main__":
+    main()
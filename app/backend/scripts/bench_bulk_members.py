@@ -0,0 +1,56 @@
+"""Benchmark for bulk member insert.
+
+Creates a throwaway group and collection, bulk-adds members and prints the
+elapsed time. Run from the project root against a development database:
+
+    python -m app.backend.scripts.bench_bulk_members --count 5000
+"""
+import argparse
+import time
+from datetime import date
+
+from sqlalchemy import delete
+
+from app.backend.db.session import SessionLocal
+from app.backend.db.models.total_manager import TMGroup, TMCollection, GroupType, PaymentType
+from app.backend.schemas.total_manager import BulkMemberCreate
+from app.backend.services.members_service import bulk_add_members
+from app.backend.utils.ulid import generate_ulid
+
+BENCH_OWNER_ID = "bench_owner"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=5000)
+    args = parser.parse_args()
+    
+    db = SessionLocal()
+    group = TMGroup(id=generate_ulid(), owner_id=BENCH_OWNER_ID, name="bench", type=GroupType.OTHER)
+    collection = TMCollection(
+        id=generate_ulid(),
+        group_id=group.id,
+        title="bench",
+        amount=10000,
+        due_date=date.today(),
+        payment_type=PaymentType.BANK,
+        payment_value="bench",
+    )
+    db.add_all([group, collection])
+    db.commit()
+    try:
+        bulk_data = BulkMemberCreate(members=[
+            {"display_name": f"member {i}", "phone": f"010{i:08d}"} for i in range(args.count)
+        ])
+        started = time.perf_counter()
+        result = bulk_add_members(db, collection.id, BENCH_OWNER_ID, bulk_data)
+        elapsed = time.perf_counter() - started
+        print(f"created={result.created} failed={result.failed} elapsed={elapsed:.3f}s")
+    finally:
+        db.execute(delete(TMGroup).where(TMGroup.id == group.id))
+        db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
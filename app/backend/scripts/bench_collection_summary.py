@@ -0,0 +1,137 @@
+"""Benchmark for collection summaries at 10, 1k and 100k members.
+
+For each size, creates a throwaway collection and times three ways to get its
+summary: loading every member row (the original implementation), one COUNT
+... FILTER aggregate, and the current path that reads the denormalized
+counters (response cache bypassed). Also times get_collection_summaries for a
+batch of collections. Run from the project root against a development
+database:
+
+    python -m app.backend.scripts.bench_collection_summary --sizes 10 1000 100000
+"""
+import argparse
+import time
+from datetime import date, datetime, timezone
+
+from sqlalchemy import delete, func, insert, select
+
+from app.backend.db.session import SessionLocal
+from app.backend.db.models.total_manager import TMGroup, TMCollection, TMMemberStatus, GroupType, PaymentType
+from app.backend.services.collections_service import build_collection_summary, get_collection_summaries
+from app.backend.services.common import ownership_cache, verify_collection_access
+from app.backend.utils.ulid import generate_ulid, generate_ulids
+
+BENCH_OWNER_ID = "bench_owner"
+INSERT_CHUNK = 10000
+
+
+def per_call_ms(fn, iterations: int) -> float:
+    fn()  # Warm-up
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1000
+
+
+def add_collection(db, group_id: str, members: int) -> str:
+    """Add a collection with `members` members (a third read, a third paid)."""
+    collection = TMCollection(
+        id=generate_ulid(),
+        group_id=group_id,
+        title="bench",
+        amount=10000,
+        due_date=date.today(),
+        payment_type=PaymentType.BANK,
+        payment_value="bench",
+        member_count=members,
+        read_count=len(range(0, members, 3)),
+        paid_count=len(range(1, members, 3)),
+    )
+    db.add(collection)
+    db.flush()
+    now = datetime.now(timezone.utc)
+    member_ids = generate_ulids(members)
+    for start in range(0, members, INSERT_CHUNK):
+        db.execute(insert(TMMemberStatus), [
+            {
+                "id": member_ids[i],
+                "collection_id": collection.id,
+                "display_name": f"member {i}",
+                "read_at": now if i % 3 == 0 else None,
+                "paid_at": now if i % 3 == 1 else None,
+            }
+            for i in range(start, min(start + INSERT_CHUNK, members))
+        ])
+    db.commit()
+    return collection.id
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 100000])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--batch", type=int, default=50)
+    args = parser.parse_args()
+    
+    db = SessionLocal()
+    group = TMGroup(id=generate_ulid(), owner_id=BENCH_OWNER_ID, name="bench", type=GroupType.OTHER)
+    group_id = group.id  # Kept as a plain value: the timed calls expunge the session
+    db.add(group)
+    db.commit()
+    try:
+        for size in args.sizes:
+            collection_id = add_collection(db, group_id, size)
+            
+            def load_rows():
+                # What get_collection_summary did before the aggregate
+                verify_collection_access(db, collection_id, BENCH_OWNER_ID)
+                members = db.scalars(select(TMMemberStatus).where(TMMemberStatus.collection_id == collection_id)).all()
+                db.expunge_all()
+                return sum(1 for m in members if m.read_at), sum(1 for m in members if m.paid_at)
+            
+            def aggregate():
+                verify_collection_access(db, collection_id, BENCH_OWNER_ID)
+                db.execute(
+                    select(
+                        func.count(),
+                        func.count().filter(TMMemberStatus.read_at.isnot(None)),
+                        func.count().filter(TMMemberStatus.paid_at.isnot(None)),
+                    ).where(TMMemberStatus.collection_id == collection_id)
+                ).one()
+            
+            def counters():
+                ownership_cache.clear()
+                build_collection_summary(verify_collection_access(db, collection_id, BENCH_OWNER_ID))
+                db.expunge_all()
+            
+            iterations = max(1, args.iterations if size <= 10000 else args.iterations // 10)
+            print(
+                f"{size:>7} members: load rows={per_call_ms(load_rows, iterations):8.2f} ms"
+                f"  aggregate={per_call_ms(aggregate, iterations):7.2f} ms"
+                f"  counters={per_call_ms(counters, iterations):6.2f} ms"
+            )
+        
+        batch_ids = [add_collection(db, group_id, 10) for _ in range(args.batch)]
+        
+        def one_by_one():
+            for batch_id in batch_ids:
+                build_collection_summary(verify_collection_access(db, batch_id, BENCH_OWNER_ID))
+            db.expunge_all()
+        
+        def batched():
+            get_collection_summaries(db, batch_ids, BENCH_OWNER_ID)
+            db.expunge_all()
+        
+        print(
+            f"{args.batch} collections: one by one={per_call_ms(one_by_one, args.iterations):7.2f} ms"
+            f"  get_collection_summaries={per_call_ms(batched, args.iterations):6.2f} ms"
+        )
+    finally:
+        db.rollback()
+        db.execute(delete(TMGroup).where(TMGroup.id == group_id))
+        db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
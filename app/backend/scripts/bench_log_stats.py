@@ -0,0 +1,117 @@
+"""Benchmark for log statistics with 1M log rows per owner.
+
+Fills a throwaway owner's collection with --rows event logs spread over the
+last year (generated in SQL) and the matching tm_event_log_daily rollup, then
+times three ways to compute GET /logs/stats: loading every log into Python
+(the original implementation), GROUP BY over tm_event_logs, and the current
+rollup queries. Run from the project root against a development database:
+
+    python -m app.backend.scripts.bench_log_stats --rows 1000000
+"""
+import argparse
+import time
+from collections import Counter
+from datetime import date
+
+from sqlalchemy import cast, delete, func, select, text, Date
+
+from app.backend.db.session import SessionLocal
+from app.backend.db.models.total_manager import TMGroup, TMCollection, TMEventLog, GroupType, LogType, PaymentType
+from app.backend.services.logs_service import build_log_stats, get_log_stats
+from app.backend.utils.ulid import generate_ulid
+
+BENCH_OWNER_ID = "bench_owner"
+
+
+def per_call_ms(fn, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--skip-load", action="store_true", help="skip the load-every-row baseline")
+    args = parser.parse_args()
+    
+    db = SessionLocal()
+    group_id, collection_id = generate_ulid(), generate_ulid()
+    db.add(TMGroup(id=group_id, owner_id=BENCH_OWNER_ID, name="bench", type=GroupType.OTHER))
+    db.add(TMCollection(
+        id=collection_id,
+        group_id=group_id,
+        title="bench",
+        amount=10000,
+        due_date=date.today(),
+        payment_type=PaymentType.BANK,
+        payment_value="bench",
+    ))
+    db.flush()
+    started = time.perf_counter()
+    log_types = [log_type.value for log_type in LogType]
+    db.execute(
+        text(
+            "INSERT INTO tm_event_logs (id, collection_id, owner_id, type, message, created_at) "
+            "SELECT gen_random_uuid(), :collection_id, :owner_id, "
+            "(:types)[1 + i % cardinality(:types)]::logtype, 'bench', now() - (i % 365) * interval '1 day' "
+            "FROM generate_series(1, :rows) AS i"
+        ),
+        {
+            "collection_id": TMCollection.id.type.process_bind_param(collection_id, None),
+            "owner_id": BENCH_OWNER_ID,
+            "types": log_types,
+            "rows": args.rows,
+        },
+    )
+    # The rollup add_event_logs would have maintained for these logs
+    db.execute(text(
+        "INSERT INTO tm_event_log_daily (owner_id, date, collection_id, type, count) "
+        "SELECT owner_id, created_at::date, collection_id, type, count(*) FROM tm_event_logs "
+        "WHERE owner_id = :owner_id GROUP BY 1, 2, 3, 4"
+    ), {"owner_id": BENCH_OWNER_ID})
+    db.commit()
+    db.execute(text("ANALYZE tm_event_logs"))
+    db.execute(text("ANALYZE tm_event_log_daily"))
+    print(f"generated {args.rows} logs in {time.perf_counter() - started:.1f}s")
+    try:
+        def load_rows():
+            # What get_log_stats did before: every log in memory, one pass per type
+            logs = db.scalars(select(TMEventLog).where(TMEventLog.owner_id == BENCH_OWNER_ID)).all()
+            by_type = {log_type.value: sum(1 for log in logs if log.type == log_type) for log_type in LogType}
+            by_date = Counter(log.created_at.date() for log in logs)
+            db.expunge_all()
+            return by_type, by_date
+        
+        def group_by():
+            day = cast(TMEventLog.created_at, Date)
+            type_rows = db.execute(
+                select(TMEventLog.type, func.count())
+                .where(TMEventLog.owner_id == BENCH_OWNER_ID)
+                .group_by(TMEventLog.type)
+            )
+            date_rows = db.execute(
+                select(day, func.count())
+                .where(TMEventLog.owner_id == BENCH_OWNER_ID)
+                .group_by(day)
+                .order_by(day.desc())
+                .limit(7)
+            )
+            return build_log_stats(type_rows, date_rows)
+        
+        if not args.skip_load:
+            print(f"load every row: {per_call_ms(load_rows, 1):10.1f} ms")
+        print(f"GROUP BY logs:  {per_call_ms(group_by, args.iterations):10.1f} ms")
+        print(f"daily rollup:   {per_call_ms(lambda: get_log_stats(db, BENCH_OWNER_ID), args.iterations):10.1f} ms")
+    finally:
+        db.rollback()
+        # Cascades to the logs and the rollup rows
+        db.execute(delete(TMGroup).where(TMGroup.id == group_id))
+        db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
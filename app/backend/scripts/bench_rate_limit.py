@@ -0,0 +1,74 @@
+"""Benchmark for the rate limiting middleware overhead.
+
+Calls a minimal ASGI app directly, with and without RateLimitMiddleware, so the
+difference is the limiter's own cost per request. No database is needed:
+
+    python -m app.backend.scripts.bench_rate_limit --requests 50000
+"""
+import argparse
+import asyncio
+import time
+
+from app.backend.core.rate_limit import (
+    RateLimitMiddleware,
+    RateLimiter,
+    create_rate_limit_backend,
+    default_policies,
+)
+from app.backend.core.security import create_access_token
+
+
+async def bare_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message):
+    pass
+
+
+def make_scope(method: str, path: str, token: str = None) -> dict:
+    headers = [(b"authorization", f"Bearer {token}".encode())] if token else []
+    return {"type": "http", "method": method, "path": path, "headers": headers, "client": ("10.0.0.1", 5000)}
+
+
+async def per_request_us(app, scope: dict, requests: int) -> float:
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(scope, receive, send)
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+async def run(requests: int) -> None:
+    token = create_access_token("bench_user")
+    cases = [
+        ("unmatched GET", make_scope("GET", "/total-manager/collections/c1/members", token)),
+        ("per-IP POST", make_scope("POST", "/auth/login/phone")),
+        ("per-user POST", make_scope("POST", "/total-manager/collections/c1/members/bulk", token)),
+    ]
+    baseline = await per_request_us(bare_app, cases[0][1], requests)
+    print(f"bare app: {baseline:.2f} us/request")
+    for backend_name in ("memory", "fake-redis"):
+        policies = default_policies()
+        for policy in policies:
+            policy.limit = requests * 10  # Measure allowed requests only
+        app = RateLimitMiddleware(bare_app, RateLimiter(policies, create_rate_limit_backend(backend_name)))
+        for label, scope in cases:
+            await per_request_us(app, scope, 100)  # Warm up (token cache, buckets)
+            elapsed = await per_request_us(app, scope, requests)
+            print(f"{backend_name:>10} {label:<14} {elapsed:.2f} us/request (overhead {elapsed - baseline:.2f} us)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=50000)
+    args = parser.parse_args()
+    asyncio.run(run(args.requests))
+
+
+if __name__ == "__main__":
+    main()
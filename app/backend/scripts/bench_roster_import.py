@@ -0,0 +1,72 @@
+"""Benchmark for CSV roster import.
+
+Writes a CSV roster to a temporary file, imports it into a throwaway
+collection and prints the elapsed time and the process's peak RSS growth. Run from the
+project root against a development database:
+
+    python -m app.backend.scripts.bench_roster_import --rows 100000
+"""
+import argparse
+import csv
+import resource
+import tempfile
+import time
+from datetime import date
+
+from sqlalchemy import delete
+
+from app.backend.db.session import SessionLocal
+from app.backend.db.models.total_manager import TMGroup, TMCollection, GroupType, PaymentType
+from app.backend.services.roster_import_service import import_roster_csv
+from app.backend.utils.ulid import generate_ulid
+
+BENCH_OWNER_ID = "bench_owner"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args()
+    
+    db = SessionLocal()
+    group = TMGroup(id=generate_ulid(), owner_id=BENCH_OWNER_ID, name="bench", type=GroupType.OTHER)
+    collection = TMCollection(
+        id=generate_ulid(),
+        group_id=group.id,
+        title="bench",
+        amount=10000,
+        due_date=date.today(),
+        payment_type=PaymentType.BANK,
+        payment_value="bench",
+    )
+    db.add_all([group, collection])
+    db.commit()
+    try:
+        with tempfile.TemporaryFile("w+b") as roster:
+            with open(roster.fileno(), "w", encoding="utf-8", newline="", closefd=False) as text_file:
+                writer = csv.writer(text_file)
+                writer.writerow(["display_name", "phone"])
+                for i in range(args.rows):
+                    # Every 10th row repeats an earlier phone in a different format
+                    n = i - 1 if i % 10 == 0 else i
+                    phone = f"010-{n // 10000:04d}-{n % 10000:04d}" if i % 10 == 0 else f"010{n:08d}"
+                    writer.writerow([f"member {i}", phone])
+            roster.seek(0)
+            
+            rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            started = time.perf_counter()
+            result = import_roster_csv(db, collection.id, BENCH_OWNER_ID, roster)
+            elapsed = time.perf_counter() - started
+            rss_growth = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before
+        print(
+            f"created={result.created} duplicates={result.duplicates} failed={result.failed} "
+            f"elapsed={elapsed:.3f}s peak_rss_growth={rss_growth}KiB"
+        )
+    finally:
+        db.execute(delete(TMGroup).where(TMGroup.id == group.id))
+        db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
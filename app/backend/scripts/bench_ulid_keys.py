@@ -0,0 +1,84 @@
+"""Benchmark for ULID keys stored as text vs native uuid.
+
+Builds parent/child temporary tables shaped like tm_collections and
+tm_member_status with each key type, filled with the same monotonic ULIDs,
+then prints index sizes and the time of a join that walks every child.
+Run from the project root against a development database:
+
+    python -m app.backend.scripts.bench_ulid_keys --parents 2000 --children 200000
+"""
+import argparse
+import time
+
+from sqlalchemy import text
+
+from app.backend.db.session import SessionLocal
+from app.backend.utils.ulid import generate_ulids, ulid_to_uuid
+
+JOIN_QUERY = """
+    SELECT count(*), sum(length(c.display_name))
+    FROM {prefix}_child c JOIN {prefix}_parent p ON p.id = c.parent_id
+"""
+
+
+def build(db, prefix: str, key_type: str, parent_ids, child_rows) -> None:
+    cast = "::uuid" if key_type == "uuid" else ""
+    if key_type == "uuid":
+        parent_ids = [str(ulid_to_uuid(value)) for value in parent_ids]
+        child_rows = [(str(ulid_to_uuid(a)), str(ulid_to_uuid(b))) for a, b in child_rows]
+    db.execute(text(f"CREATE TEMP TABLE {prefix}_parent (id {key_type} PRIMARY KEY)"))
+    db.execute(text(
+        f"CREATE TEMP TABLE {prefix}_child "
+        f"(id {key_type} PRIMARY KEY, parent_id {key_type} NOT NULL, display_name varchar)"
+    ))
+    db.execute(text(f"CREATE INDEX ON {prefix}_child (parent_id)"))
+    db.execute(
+        text(f"INSERT INTO {prefix}_parent SELECT unnest(CAST(:ids AS text[])){cast}"),
+        {"ids": parent_ids},
+    )
+    db.execute(
+        text(
+            f"INSERT INTO {prefix}_child SELECT i{cast}, p{cast}, 'member' "
+            "FROM unnest(CAST(:ids AS text[]), CAST(:parents AS text[])) AS t(i, p)"
+        ),
+        {"ids": [row[0] for row in child_rows], "parents": [row[1] for row in child_rows]},
+    )
+    db.execute(text(f"ANALYZE {prefix}_parent"))
+    db.execute(text(f"ANALYZE {prefix}_child"))
+
+
+def index_bytes(db, prefix: str) -> int:
+    return db.scalar(text(
+        "SELECT sum(pg_relation_size(indexrelid)) FROM pg_index "
+        f"WHERE indrelid IN ('{prefix}_parent'::regclass, '{prefix}_child'::regclass)"
+    ))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--parents", type=int, default=2000)
+    parser.add_argument("--children", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    
+    ulids = generate_ulids(args.parents + args.children)
+    parent_ids = ulids[:args.parents]
+    child_rows = [(child_id, parent_ids[i % args.parents]) for i, child_id in enumerate(ulids[args.parents:])]
+    
+    db = SessionLocal()
+    try:
+        for prefix, key_type in (("bench_text", "varchar"), ("bench_uuid", "uuid")):
+            build(db, prefix, key_type, parent_ids, child_rows)
+            db.execute(text(JOIN_QUERY.format(prefix=prefix))).one()  # Warm the cache
+            started = time.perf_counter()
+            for _ in range(args.repeat):
+                db.execute(text(JOIN_QUERY.format(prefix=prefix))).one()
+            elapsed = (time.perf_counter() - started) / args.repeat
+            print(f"{key_type:>7}: indexes={index_bytes(db, prefix) / 1024 / 1024:.1f}MiB join={elapsed * 1000:.1f}ms")
+    finally:
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
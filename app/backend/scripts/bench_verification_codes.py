@@ -0,0 +1,56 @@
+"""Load test for the SMS verification code store.
+
+Issues and verifies --codes codes against each store backend, checks every
+verification succeeds, and times an expiry sweep of the same number of codes.
+No database or SMS provider is needed:
+
+    python -m app.backend.scripts.bench_verification_codes --codes 100000
+"""
+import argparse
+import time
+
+from app.backend.core.verification_store import VerificationResult, create_verification_store
+from app.backend.services.verification_service import hash_code
+
+
+def timed(label: str, count: int, fn) -> None:
+    started = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<16} {elapsed:6.2f}s ({count / elapsed:,.0f}/s, {elapsed / count * 1e6:.2f} us each)")
+
+
+def run(backend_name: str, count: int) -> None:
+    print(f"{backend_name}:")
+    store = create_verification_store(backend_name, ttl_seconds=300, max_attempts=5)
+    phones = [f"010{i:08d}" for i in range(count)]
+    codes = [f"{i * 7919 % 1000000:06d}" for i in range(count)]
+    hashes = [hash_code(phone, code) for phone, code in zip(phones, codes)]
+    results = []
+    
+    timed("issue", count, lambda: [store.issue(phone, code_hash) for phone, code_hash in zip(phones, hashes)])
+    timed("verify (wrong)", count, lambda: [store.verify(phone, "0" * 64) for phone in phones])
+    timed("verify", count, lambda: results.extend(store.verify(phone, code_hash) for phone, code_hash in zip(phones, hashes)))
+    ok = sum(result == VerificationResult.OK for result in results)
+    print(f"  verified {ok}/{count}, left {store.stats().get('size', 'n/a')}")
+    assert ok == count, "every issued code must verify once"
+    
+    if backend_name == "memory":
+        expiring = create_verification_store(backend_name, ttl_seconds=0.0, max_attempts=5)
+        for phone, code_hash in zip(phones, hashes):
+            expiring.issue(phone, code_hash)
+        timed("sweep", count, expiring.sweep)
+        print(f"  after sweep {expiring.stats()}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--codes", type=int, default=100000)
+    parser.add_argument("--backends", default="memory,fake-redis")
+    args = parser.parse_args()
+    for backend_name in args.backends.split(","):
+        run(backend_name, args.codes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Async read service layer.
+
+Async variants of the hot read paths (member list, collection summary and
+logs), used when ``settings.DATABASE_ASYNC`` is enabled. They mirror the sync
+services and must return the same results.
+"""
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from fastapi import HTTPException, status
+
+from app.backend.db.models.total_manager import (
+    TMGroup,
+    TMCollection,
+    TMMemberStatus,
+    TMEventLog,
+    LogType,
+)
+from app.backend.schemas.total_manager import CollectionSummaryOut, EventLogPageOut, LogStatsOut
+from app.backend.services.collections_service import build_collection_summary
+from app.backend.services.common import (
+    get_cached_owner,
+    remember_ownership,
+    invalidate_ownership,
+    collection_summary_key,
+    response_cache,
+)
+from app.backend.services.logs_service import (
+    owner_logs_query,
+    owner_logs_page_query,
+    owner_logs_count_query,
+    build_log_page,
+    log_stats_queries,
+    build_log_stats,
+)
+
+
+async def verify_collection_access(db: AsyncSession, collection_id: str, owner_id: str) -> TMCollection:
+    """Verify collection exists and user has access."""
+    cached_owner_id = get_cached_owner("collection", collection_id)
+    if cached_owner_id is not None and cached_owner_id != owner_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied"
+        )
+    row = (await db.execute(
+        select(TMCollection, TMGroup.owner_id)
+        .join(TMGroup, TMGroup.id == TMCollection.group_id)
+        .where(TMCollection.id == collection_id)
+    )).first()
+    if not row:
+        invalidate_ownership(collection_id=collection_id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Collection not found"
+        )
+    collection, collection_owner_id = row
+    remember_ownership(collection_owner_id, collection.group_id, collection.id)
+    if collection_owner_id != owner_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied"
+        )
+    return collection
+
+
+async def check_collection_access(db: AsyncSession, collection_id: str, owner_id: str) -> None:
+    """Like verify_collection_access, but skips the query on a cache hit."""
+    cached_owner_id = get_cached_owner("collection", collection_id)
+    if cached_owner_id is None:
+        await verify_collection_access(db, collection_id, owner_id)
+    elif cached_owner_id != owner_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied"
+        )
+
+
+async def get_collection_version(db: AsyncSession, collection_id: str, owner_id: str) -> int:
+    """Get a collection's version after checking access (a PK lookup on a cache hit)."""
+    if get_cached_owner("collection", collection_id) is None:
+        return (await verify_collection_access(db, collection_id, owner_id)).version
+    await check_collection_access(db, collection_id, owner_id)
+    version = await db.scalar(select(TMCollection.version).where(TMCollection.id == collection_id))
+    if version is None:
+        invalidate_ownership(collection_id=collection_id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Collection not found"
+        )
+    return version
+
+
+async def list_members(db: AsyncSession, collection_id: str, owner_id: str) -> List[TMMemberStatus]:
+    """List all members for a collection."""
+    await check_collection_access(db, collection_id, owner_id)
+    result = await db.scalars(
+        select(TMMemberStatus).where(TMMemberStatus.collection_id == collection_id)
+    )
+    return list(result)
+
+
+async def get_collection_summary(
+    db: AsyncSession,
+    collection_id: str,
+    owner_id: str,
+    version: Optional[int] = None
+) -> CollectionSummaryOut:
+    """Get collection summary with statistics (served from the response cache).
+
+    Pass the version already read for the ETag so the body matches it.
+    """
+    if version is None:
+        version = await get_collection_version(db, collection_id, owner_id)
+    
+    async def load() -> CollectionSummaryOut:
+        return build_collection_summary(await verify_collection_access(db, collection_id, owner_id))
+    
+    return await response_cache.aget_or_load(collection_summary_key(collection_id, version), load, CollectionSummaryOut)
+
+
+async def list_logs(db: AsyncSession, collection_id: str, owner_id: str) -> List[TMEventLog]:
+    """List all logs for a collection."""
+    await check_collection_access(db, collection_id, owner_id)
+    result = await db.scalars(
+        select(TMEventLog)
+        .where(TMEventLog.collection_id == collection_id)
+        .order_by(TMEventLog.created_at.desc())
+    )
+    return list(result)
+
+
+async def list_all_logs(
+    db: AsyncSession,
+    user_id: str,
+    collection_id: Optional[str] = None,
+    log_type: Optional[LogType] = None,
+    limit: int = 50,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    count: str = "exact"
+) -> EventLogPageOut:
+    """List all logs for a user."""
+    query = owner_logs_query(user_id, collection_id, log_type)
+    count_query = owner_logs_count_query(query, user_id, collection_id, log_type, count)
+    total = await db.scalar(count_query) if count_query is not None else None
+    logs = list(await db.scalars(owner_logs_page_query(query, limit, offset, cursor)))
+    return build_log_page(logs, total, limit, offset, cursor)
+
+
+async def get_log_stats(db: AsyncSession, user_id: str) -> LogStatsOut:
+    """Get log statistics for a user."""
+    by_type, by_date = log_stats_queries(user_id)
+    return build_log_stats(await db.execute(by_type), await db.execute(by_date))
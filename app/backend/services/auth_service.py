@@ -2,12 +2,19 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
+from app.backend.core.cache import TTLCache
+from app.backend.core.config import settings
+from app.backend.core.security import create_access_token as create_jwt, verify_access_token as verify_jwt
 from app.backend.db.models.user import User
 from app.backend.schemas.auth import SignupRequest, PhoneLoginRequest, UserOut
+from app.backend.services.verification_service import verify_code
 from app.backend.utils.ulid import generate_ulid
-from datetime import datetime, timedelta
-import jwt
-from app.backend.core.config import settings
+
+# user_id -> UserOut, so GET /auth/me does not query users on every call
+user_cache = TTLCache(
+    max_size=settings.AUTH_USER_CACHE_MAX_SIZE,
+    ttl_seconds=settings.AUTH_USER_CACHE_TTL_SECONDS,
+)
 
 
 def create_user(db: Session, signup_data: SignupRequest) -> User:
@@ -20,9 +27,9 @@ def create_user(db: Session, signup_data: SignupRequest) -> User:
             detail="이미 가입된 전화번호입니다"
         )
     
-    # TODO: SMS 인증 코드 검증 (선택적)
-    # if signup_data.verification_code:
-    #     verify_code(signup_data.phone, signup_data.verification_code)
+    # SMS 인증 코드 검증 (선택적)
+    if signup_data.verification_code:
+        verify_code(signup_data.phone, signup_data.verification_code)
     
     user = User(
         id=generate_ulid(),
@@ -52,27 +59,33 @@ def get_user_by_phone(db: Session, phone: str) -> User | None:
 
 def create_access_token(user_id: str) -> str:
     """JWT 액세스 토큰 생성."""
-    # TODO: 실제 JWT 구현 시 SECRET_KEY 사용
-    # 현재는 간단한 토큰 생성 (임시)
-    payload = {
-        "user_id": user_id,
-        "exp": datetime.utcnow() + timedelta(days=7),
-        "iat": datetime.utcnow(),
-    }
-    # 실제 구현 시: return jwt.encode(payload, settings.SECRET_KEY, algorithm="HS256")
-    # 임시로 간단한 토큰 반환
-    return f"token_{user_id}_{datetime.utcnow().timestamp()}"
+    return create_jwt(user_id)
 
 
 def verify_access_token(token: str) -> str | None:
-    """JWT 토큰 검증 및 user_id 반환."""
-    # TODO: 실제 JWT 검증 구현
-    # 현재는 임시로 토큰에서 user_id 추출
-    if token.startswith("token_"):
-        parts = token.split("_")
-        if len(parts) >= 2:
-            return parts[1]
-    return None
+    """JWT 토큰 검증 및 user_id 반환 (유효하지 않거나 만료되면 None)."""
+    principal = verify_jwt(token)
+    return principal.user_id if principal else None
+
+
+def get_user_principal(db: Session, user_id: str) -> UserOut:
+    """사용자 정보 조회 (user_cache 사용).
+
+    캐시는 명시적으로 무효화하지 않으므로, 사용자 정보가 바뀌면 최대
+    AUTH_USER_CACHE_TTL_SECONDS 동안 이전 값이 반환될 수 있습니다.
+    """
+    cached = user_cache.get(user_id)
+    if cached is not None:
+        return cached
+    user = db.query(User).filter(User.id == user_id).first()
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="사용자를 찾을 수 없습니다"
+        )
+    principal = UserOut.model_validate(user)
+    user_cache.set(user_id, principal)
+    return principal
 
 
 def phone_login(db: Session, login_data: PhoneLoginRequest) -> User:
@@ -84,9 +97,9 @@ def phone_login(db: Session, login_data: PhoneLoginRequest) -> User:
             detail="가입되지 않은 전화번호입니다"
         )
     
-    # TODO: SMS 인증 코드 검증 (선택적)
-    # if login_data.verification_code:
-    #     verify_code(login_data.phone, login_data.verification_code)
+    # SMS 인증 코드 검증 (선택적)
+    if login_data.verification_code:
+        verify_code(login_data.phone, login_data.verification_code)
     
     return user
 
@@ -0,0 +1,76 @@
+"""Collection status service layer.
+
+A collection is ``closed`` once its due date has arrived and ``due_soon``
+within DUE_SOON_DAYS of it. Status is set on create/update and moved forward
+as days pass by sweep_collection_statuses, which runs a couple of set-based
+UPDATEs over the (status, due_date) index. Each UPDATE only matches rows still
+in an earlier status, so concurrent or repeated sweeps are harmless. Moved
+collections and their groups get their versions bumped like any other change.
+"""
+from datetime import date, timedelta
+from typing import Dict, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.backend.db.models.total_manager import TMGroup, TMCollection, CollectionStatus
+
+DUE_SOON_DAYS = 3
+
+
+def collection_status(due_date: date, today: Optional[date] = None) -> str:
+    """Get the status a collection with this due date should have today."""
+    today = today or date.today()
+    if due_date <= today:
+        return CollectionStatus.CLOSED.value
+    if (due_date - today).days <= DUE_SOON_DAYS:
+        return CollectionStatus.DUE_SOON.value
+    return CollectionStatus.ACTIVE.value
+
+
+def sweep_collection_statuses(db: Session, today: Optional[date] = None) -> Dict[str, int]:
+    """Move collections past the due_soon/closed thresholds and commit.
+    
+    Returns how many collections moved to each status.
+    """
+    today = today or date.today()
+    
+    closed = db.execute(
+        update(TMCollection)
+        .where(
+            TMCollection.status.in_([CollectionStatus.ACTIVE.value, CollectionStatus.DUE_SOON.value]),
+            TMCollection.due_date <= today,
+        )
+        .values(status=CollectionStatus.CLOSED.value, version=TMCollection.version + 1)
+        .returning(TMCollection.id, TMCollection.group_id)
+        .execution_options(synchronize_session=False)
+    ).all()
+    due_soon = db.execute(
+        update(TMCollection)
+        .where(
+            TMCollection.status == CollectionStatus.ACTIVE.value,
+            TMCollection.due_date <= today + timedelta(days=DUE_SOON_DAYS),
+        )
+        .values(status=CollectionStatus.DUE_SOON.value, version=TMCollection.version + 1)
+        .returning(TMCollection.id, TMCollection.group_id)
+        .execution_options(synchronize_session=False)
+    ).all()
+    group_ids = {group_id for _, group_id in closed + due_soon}
+    if group_ids:
+        # Lock the groups in id order first: the UPDATE itself visits them in
+        # whatever order the plan picks, which could deadlock with another sweep
+        db.execute(
+            select(TMGroup.id)
+            .where(TMGroup.id.in_(group_ids))
+            .order_by(TMGroup.id)
+            .with_for_update(key_share=True)
+        )
+        db.execute(
+            update(TMGroup)
+            .where(TMGroup.id.in_(group_ids))
+            .values(version=TMGroup.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+    db.commit()
+    
+    return {"closed": len(closed), "due_soon": len(due_soon)}
@@ -1,7 +1,6 @@
 """Collections service layer."""
 from sqlalchemy.orm import Session
-from datetime import date
-from typing import List
+from typing import List, Optional
 
 from app.backend.db.models.total_manager import TMCollection, CollectionStatus, PaymentType
 from app.backend.schemas.total_manager import (
@@ -10,7 +9,17 @@ from app.backend.schemas.total_manager import (
     CollectionUpdate,
     CollectionSummaryOut,
 )
-from app.backend.services.common import verify_group_owner, verify_collection_access
+from app.backend.services.collection_status_service import collection_status
+from app.backend.services.common import (
+    check_group_owner,
+    get_collection_version,
+    verify_collection_access,
+    verify_collections_access,
+    invalidate_ownership,
+    collection_summary_key,
+    response_cache,
+)
+from app.backend.services.counters_service import adjust_collection_counters, adjust_group_counters
 from app.backend.utils.ulid import generate_ulid
 
 
@@ -22,15 +31,7 @@ def create_collection(
 ) -> TMCollection:
     """Create a new collection."""
     # Verify group ownership
-    verify_group_owner(db, group_id, owner_id)
-    
-    # Determine status based on due_date
-    today = date.today()
-    status_value = 'active'
-    if collection_data.due_date <= today:
-        status_value = 'closed'
-    elif (collection_data.due_date - today).days <= 3:
-        status_value = 'due_soon'
+    check_group_owner(db, group_id, owner_id)
     
     # Normalize and validate payment_type
     payment_type_value = collection_data.payment_type
@@ -53,9 +54,10 @@ def create_collection(
         due_date=collection_data.due_date,
         payment_type=payment_type_value,
         payment_value=collection_data.payment_value,
-        status=status_value,
+        status=collection_status(collection_data.due_date),
     )
     db.add(collection)
+    adjust_group_counters(db, group_id, collections=1, amount=collection.amount)
     db.commit()
     db.refresh(collection)
     return collection
@@ -63,7 +65,7 @@ def create_collection(
 
 def list_collections(db: Session, group_id: str, owner_id: str) -> List[TMCollection]:
     """List all collections for a group."""
-    verify_group_owner(db, group_id, owner_id)
+    check_group_owner(db, group_id, owner_id)
     return db.query(TMCollection).filter(TMCollection.group_id == group_id).all()
 
 
@@ -78,18 +80,13 @@ def update_collection(
     
     if collection_data.title is not None:
         collection.title = collection_data.title
+    amount_delta = 0
     if collection_data.amount is not None:
+        amount_delta = collection_data.amount - collection.amount
         collection.amount = collection_data.amount
     if collection_data.due_date is not None:
         collection.due_date = collection_data.due_date
-        # Recalculate status based on due_date
-        today = date.today()
-        if collection_data.due_date <= today:
-            collection.status = 'closed'
-        elif (collection_data.due_date - today).days <= 3:
-            collection.status = 'due_soon'
-        else:
-            collection.status = 'active'
+        collection.status = collection_status(collection_data.due_date)
     if collection_data.payment_type is not None:
         # Normalize and validate payment_type
         payment_type_value = collection_data.payment_type
@@ -107,6 +104,8 @@ def update_collection(
         collection.payment_type = payment_type_value
     if collection_data.payment_value is not None:
         collection.payment_value = collection_data.payment_value
+    adjust_collection_counters(db, collection.id)
+    adjust_group_counters(db, collection.group_id, amount=amount_delta)
     
     db.commit()
     db.refresh(collection)
@@ -117,25 +116,15 @@ def delete_collection(db: Session, collection_id: str, owner_id: str) -> None:
     """Delete a collection."""
     collection = verify_collection_access(db, collection_id, owner_id)
     db.delete(collection)
+    adjust_group_counters(db, collection.group_id, collections=-1, amount=-collection.amount)
     db.commit()
+    invalidate_ownership(collection_id=collection_id)
 
 
-def get_collection_summary(
-    db: Session,
-    collection_id: str,
-    owner_id: str
-) -> CollectionSummaryOut:
-    """Get collection summary with statistics."""
-    collection = verify_collection_access(db, collection_id, owner_id)
-    
-    from app.backend.db.models.total_manager import TMMemberStatus
-    members = db.query(TMMemberStatus).filter(
-        TMMemberStatus.collection_id == collection_id
-    ).all()
-    
-    total_members = len(members)
-    read_members = sum(1 for m in members if m.read_at is not None)
-    paid_members = sum(1 for m in members if m.paid_at is not None)
+def build_collection_summary(collection: TMCollection) -> CollectionSummaryOut:
+    """Build a collection summary from its denormalized counters."""
+    total_members = collection.member_count
+    paid_members = collection.paid_count
     
     # Calculate current amount (simple: paid_members * (amount / total_members))
     current_amount = int((paid_members / total_members * collection.amount)) if total_members > 0 else 0
@@ -147,10 +136,38 @@ def get_collection_summary(
         due_date=collection.due_date,
         status=collection.status,
         total_members=total_members,
-        read_members=read_members,
+        read_members=collection.read_count,
         paid_members=paid_members,
         current_amount=current_amount,
         payment_type=collection.payment_type,
         payment_value=collection.payment_value,
     )
 
+
+def get_collection_summary(
+    db: Session,
+    collection_id: str,
+    owner_id: str,
+    version: Optional[int] = None
+) -> CollectionSummaryOut:
+    """Get collection summary with statistics (served from the response cache).
+
+    Pass the version already read for the ETag so the body matches it.
+    """
+    if version is None:
+        version = get_collection_version(db, collection_id, owner_id)
+    return response_cache.get_or_load(
+        collection_summary_key(collection_id, version),
+        lambda: build_collection_summary(verify_collection_access(db, collection_id, owner_id)),
+        CollectionSummaryOut,
+    )
+
+
+def get_collection_summaries(
+    db: Session,
+    collection_ids: List[str],
+    owner_id: str
+) -> List[CollectionSummaryOut]:
+    """Get summaries for many collections at once."""
+    collections = verify_collections_access(db, collection_ids, owner_id)
+    return [build_collection_summary(collection) for collection in collections]
@@ -1,9 +1,93 @@
 """Common utility functions for Total Manager services."""
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import List, Optional
 from fastapi import HTTPException, status
 
+from app.backend.core.cache import TTLCache
+from app.backend.core.response_cache import ResponseCache, create_cache_backend
+from app.backend.core.config import settings
 from app.backend.db.models.total_manager import TMGroup, TMCollection, TMMemberStatus
+from app.backend.utils.ulid import canonical_ulid
+
+# Ownership links: ("group", id) -> owner_id, ("collection", id) -> group_id,
+# ("member", id) -> collection_id. A member or collection resolves to an owner
+# only while every link up to its group is cached, so invalidating a group or
+# collection also invalidates everything below it.
+ownership_cache = TTLCache(
+    max_size=settings.OWNERSHIP_CACHE_MAX_SIZE,
+    ttl_seconds=settings.OWNERSHIP_CACHE_TTL_SECONDS,
+)
+_OWNERSHIP_LINKS = ("member", "collection", "group")
+
+# Serialized group detail and collection summary responses, keyed by entity ID
+# and version. Every change bumps the version (see counters_service), so a
+# committed write is visible on the next read in any worker, and a cached body
+# always matches the ETag built from the same version. Old versions age out.
+response_cache = ResponseCache(
+    create_cache_backend(
+        settings.RESPONSE_CACHE_BACKEND,
+        max_size=settings.RESPONSE_CACHE_MAX_SIZE,
+        ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+        redis_url=settings.RESPONSE_CACHE_REDIS_URL,
+    ),
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+)
+
+
+def _not_found(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+
+
+def _access_denied() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
+
+
+def get_cached_owner(kind: str, entity_id: str) -> Optional[str]:
+    """Resolve an entity's owner from the ownership cache."""
+    value = entity_id
+    for link in _OWNERSHIP_LINKS[_OWNERSHIP_LINKS.index(kind):]:
+        value = ownership_cache.get((link, value), record_stats=False)
+        if value is None:
+            ownership_cache.record(hit=False)
+            return None
+    ownership_cache.record(hit=True)
+    return value
+
+
+def remember_ownership(
+    owner_id: str,
+    group_id: str,
+    collection_id: Optional[str] = None,
+    member_id: Optional[str] = None,
+) -> None:
+    """Cache the ownership links of a verified entity."""
+    ownership_cache.set(("group", group_id), owner_id)
+    if collection_id is not None:
+        ownership_cache.set(("collection", collection_id), group_id)
+    if member_id is not None:
+        ownership_cache.set(("member", member_id), collection_id)
+
+
+def invalidate_ownership(
+    group_id: Optional[str] = None,
+    collection_id: Optional[str] = None,
+    member_id: Optional[str] = None,
+) -> None:
+    """Drop cached ownership of a deleted entity (and, through it, its children)."""
+    if group_id is not None:
+        ownership_cache.delete(("group", group_id))
+    if collection_id is not None:
+        ownership_cache.delete(("collection", collection_id))
+    if member_id is not None:
+        ownership_cache.delete(("member", member_id))
+
+
+def group_detail_key(group_id: str, version: int) -> str:
+    return f"group:{group_id}:detail:{version}"
+
+
+def collection_summary_key(collection_id: str, version: int) -> str:
+    return f"collection:{collection_id}:summary:{version}"
 
 
 def get_group(db: Session, group_id: str) -> Optional[TMGroup]:
@@ -13,52 +97,154 @@ def get_group(db: Session, group_id: str) -> Optional[TMGroup]:
 
 def verify_group_owner(db: Session, group_id: str, owner_id: str) -> TMGroup:
     """Verify group exists and belongs to owner."""
+    cached_owner_id = get_cached_owner("group", group_id)
+    if cached_owner_id is not None and cached_owner_id != owner_id:
+        raise _access_denied()
     group = get_group(db, group_id)
     if not group:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Group not found"
-        )
+        invalidate_ownership(group_id=group_id)
+        raise _not_found("Group not found")
+    remember_ownership(group.owner_id, group.id)
     if group.owner_id != owner_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied"
-        )
+        raise _access_denied()
     return group
 
 
+def check_group_owner(db: Session, group_id: str, owner_id: str) -> None:
+    """Like verify_group_owner, but skips the query on a cache hit."""
+    cached_owner_id = get_cached_owner("group", group_id)
+    if cached_owner_id is None:
+        verify_group_owner(db, group_id, owner_id)
+    elif cached_owner_id != owner_id:
+        raise _access_denied()
+
+
 def get_collection(db: Session, collection_id: str) -> Optional[TMCollection]:
     """Get a collection by ID."""
     return db.query(TMCollection).filter(TMCollection.id == collection_id).first()
 
 
 def verify_collection_access(db: Session, collection_id: str, owner_id: str) -> TMCollection:
-    """Verify collection exists and user has access."""
-    collection = get_collection(db, collection_id)
-    if not collection:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Collection not found"
-        )
-    # Verify through group ownership
-    verify_group_owner(db, collection.group_id, owner_id)
+    """Verify collection exists and user has access.
+
+    The collection and its group owner are fetched in one joined query.
+    """
+    cached_owner_id = get_cached_owner("collection", collection_id)
+    if cached_owner_id is not None and cached_owner_id != owner_id:
+        raise _access_denied()
+    row = (
+        db.query(TMCollection, TMGroup.owner_id)
+        .join(TMGroup, TMGroup.id == TMCollection.group_id)
+        .filter(TMCollection.id == collection_id)
+        .first()
+    )
+    if not row:
+        invalidate_ownership(collection_id=collection_id)
+        raise _not_found("Collection not found")
+    collection, collection_owner_id = row
+    remember_ownership(collection_owner_id, collection.group_id, collection.id)
+    if collection_owner_id != owner_id:
+        raise _access_denied()
     return collection
 
 
+def check_collection_access(db: Session, collection_id: str, owner_id: str) -> None:
+    """Like verify_collection_access, but skips the query on a cache hit."""
+    cached_owner_id = get_cached_owner("collection", collection_id)
+    if cached_owner_id is None:
+        verify_collection_access(db, collection_id, owner_id)
+    elif cached_owner_id != owner_id:
+        raise _access_denied()
+
+
+def verify_collections_access(db: Session, collection_ids: List[str], owner_id: str) -> List[TMCollection]:
+    """Verify a list of collections in one query, returned in request order."""
+    unique_ids = list(dict.fromkeys(map(canonical_ulid, collection_ids)))
+    rows = (
+        db.query(TMCollection, TMGroup.owner_id)
+        .join(TMGroup, TMGroup.id == TMCollection.group_id)
+        .filter(TMCollection.id.in_(unique_ids))
+        .all()
+    )
+    for collection, collection_owner_id in rows:
+        remember_ownership(collection_owner_id, collection.group_id, collection.id)
+    if len(rows) != len(unique_ids):
+        raise _not_found("Collection not found")
+    if any(collection_owner_id != owner_id for _, collection_owner_id in rows):
+        raise _access_denied()
+    by_id = {collection.id: collection for collection, _ in rows}
+    return [by_id[collection_id] for collection_id in unique_ids]
+
+
+def get_group_version(db: Session, group_id: str, owner_id: str) -> int:
+    """Get a group's version after checking access (a PK lookup on a cache hit)."""
+    if get_cached_owner("group", group_id) is None:
+        return verify_group_owner(db, group_id, owner_id).version
+    check_group_owner(db, group_id, owner_id)
+    version = db.query(TMGroup.version).filter(TMGroup.id == group_id).scalar()
+    if version is None:
+        invalidate_ownership(group_id=group_id)
+        raise _not_found("Group not found")
+    return version
+
+
+def get_collection_version(db: Session, collection_id: str, owner_id: str) -> int:
+    """Get a collection's version after checking access (a PK lookup on a cache hit)."""
+    if get_cached_owner("collection", collection_id) is None:
+        return verify_collection_access(db, collection_id, owner_id).version
+    check_collection_access(db, collection_id, owner_id)
+    version = db.query(TMCollection.version).filter(TMCollection.id == collection_id).scalar()
+    if version is None:
+        invalidate_ownership(collection_id=collection_id)
+        raise _not_found("Collection not found")
+    return version
+
+
 def get_member(db: Session, member_id: str) -> Optional[TMMemberStatus]:
     """Get a member by ID."""
     return db.query(TMMemberStatus).filter(TMMemberStatus.id == member_id).first()
 
 
 def verify_member_access(db: Session, member_id: str, owner_id: str) -> TMMemberStatus:
-    """Verify member exists and user has access."""
-    member = get_member(db, member_id)
-    if not member:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Member not found"
-        )
-    # Verify through collection and group ownership
-    verify_collection_access(db, member.collection_id, owner_id)
+    """Verify member exists and user has access.
+
+    The member and its group owner are fetched in one joined query.
+    """
+    cached_owner_id = get_cached_owner("member", member_id)
+    if cached_owner_id is not None and cached_owner_id != owner_id:
+        raise _access_denied()
+    row = (
+        db.query(TMMemberStatus, TMCollection.group_id, TMGroup.owner_id)
+        .join(TMCollection, TMCollection.id == TMMemberStatus.collection_id)
+        .join(TMGroup, TMGroup.id == TMCollection.group_id)
+        .filter(TMMemberStatus.id == member_id)
+        .first()
+    )
+    if not row:
+        invalidate_ownership(member_id=member_id)
+        raise _not_found("Member not found")
+    member, group_id, member_owner_id = row
+    remember_ownership(member_owner_id, group_id, member.collection_id, member.id)
+    if member_owner_id != owner_id:
+        raise _access_denied()
     return member
 
+
+def verify_members_access(db: Session, member_ids: List[str], owner_id: str) -> List[TMMemberStatus]:
+    """Verify a list of members in one query, returned in request order."""
+    unique_ids = list(dict.fromkeys(map(canonical_ulid, member_ids)))
+    rows = (
+        db.query(TMMemberStatus, TMCollection.group_id, TMGroup.owner_id)
+        .join(TMCollection, TMCollection.id == TMMemberStatus.collection_id)
+        .join(TMGroup, TMGroup.id == TMCollection.group_id)
+        .filter(TMMemberStatus.id.in_(unique_ids))
+        .all()
+    )
+    for member, group_id, member_owner_id in rows:
+        remember_ownership(member_owner_id, group_id, member.collection_id, member.id)
+    if len(rows) != len(unique_ids):
+        raise _not_found("Member not found")
+    if any(member_owner_id != owner_id for _, _, member_owner_id in rows):
+        raise _access_denied()
+    by_id = {member.id: member for member, _, _ in rows}
+    return [by_id[member_id] for member_id in unique_ids]
@@ -0,0 +1,146 @@
+"""Denormalized counters service layer.
+
+TMCollection.member_count/read_count/paid_count and
+TMGroup.collections_count/total_amount are adjusted with atomic
+``col = col + n`` updates in the same transaction as the change they count.
+reconcile_counters recomputes them from the source rows to repair drift.
+
+The same updates bump TMCollection.version (any change to a collection or its
+members) and TMGroup.version (any change to the group or its collections), which
+the polled read endpoints use as their ETag.
+"""
+from sqlalchemy import select, func, update, or_
+from sqlalchemy.orm import Session
+
+from app.backend.db.models.total_manager import TMGroup, TMCollection, TMMemberStatus
+
+
+def adjust_collection_counters(
+    db: Session,
+    collection_id: str,
+    members: int = 0,
+    read: int = 0,
+    paid: int = 0
+) -> None:
+    """Atomically adjust a collection's member counters and bump its version."""
+    values = {TMCollection.version: TMCollection.version + 1}
+    if members:
+        values[TMCollection.member_count] = TMCollection.member_count + members
+    if read:
+        values[TMCollection.read_count] = TMCollection.read_count + read
+    if paid:
+        values[TMCollection.paid_count] = TMCollection.paid_count + paid
+    db.execute(
+        update(TMCollection).where(TMCollection.id == collection_id).values(values),
+        execution_options={"synchronize_session": False},
+    )
+
+
+def adjust_group_counters(
+    db: Session,
+    group_id: str,
+    collections: int = 0,
+    amount: int = 0
+) -> None:
+    """Atomically adjust a group's collection counters and bump its version."""
+    values = {TMGroup.version: TMGroup.version + 1}
+    if collections:
+        values[TMGroup.collections_count] = TMGroup.collections_count + collections
+    if amount:
+        values[TMGroup.total_amount] = TMGroup.total_amount + amount
+    db.execute(
+        update(TMGroup).where(TMGroup.id == group_id).values(values),
+        execution_options={"synchronize_session": False},
+    )
+
+
+def _lock_batch(db: Session, model, after, batch_size: int) -> list:
+    # FOR NO KEY UPDATE in id order: blocks concurrent counter updates on these
+    # rows (and waits for in-flight ones) without blocking member/collection
+    # inserts, whose foreign key checks only take KEY SHARE locks
+    query = select(model.id).order_by(model.id).limit(batch_size).with_for_update(key_share=True)
+    if after is not None:
+        query = query.where(model.id > after)
+    return db.scalars(query).all()
+
+
+def reconcile_counters(db: Session, batch_size: int = 1000) -> dict:
+    """Recompute all counters and repair the rows that drifted.
+
+    Rows are locked in id-ordered batches before they are recomputed, so the
+    recount (a new statement, hence a new snapshot) includes every increment
+    committed before the lock and none can land between the count and the
+    write. Each batch is committed on its own to keep the locks short.
+    """
+    collections_fixed = 0
+    ids = _lock_batch(db, TMCollection, None, batch_size)
+    while ids:
+        member_counts = (
+            select(
+                TMCollection.id.label("id"),
+                func.count(TMMemberStatus.id).label("member_count"),
+                func.count(TMMemberStatus.id).filter(TMMemberStatus.read_at.isnot(None)).label("read_count"),
+                func.count(TMMemberStatus.id).filter(TMMemberStatus.paid_at.isnot(None)).label("paid_count"),
+            )
+            .outerjoin(TMMemberStatus, TMMemberStatus.collection_id == TMCollection.id)
+            .where(TMCollection.id.in_(ids))
+            .group_by(TMCollection.id)
+            .subquery()
+        )
+        collections_fixed += len(db.scalars(
+            update(TMCollection)
+            .where(TMCollection.id == member_counts.c.id)
+            .where(or_(
+                TMCollection.member_count != member_counts.c.member_count,
+                TMCollection.read_count != member_counts.c.read_count,
+                TMCollection.paid_count != member_counts.c.paid_count,
+            ))
+            .values(
+                member_count=member_counts.c.member_count,
+                read_count=member_counts.c.read_count,
+                paid_count=member_counts.c.paid_count,
+                version=TMCollection.version + 1,
+            )
+            .returning(TMCollection.id),
+            execution_options={"synchronize_session": False},
+        ).all())
+        db.commit()
+        ids = _lock_batch(db, TMCollection, ids[-1], batch_size)
+    
+    groups_fixed = 0
+    ids = _lock_batch(db, TMGroup, None, batch_size)
+    while ids:
+        collection_totals = (
+            select(
+                TMGroup.id.label("id"),
+                func.count(TMCollection.id).label("collections_count"),
+                func.coalesce(func.sum(TMCollection.amount), 0).label("total_amount"),
+            )
+            .outerjoin(TMCollection, TMCollection.group_id == TMGroup.id)
+            .where(TMGroup.id.in_(ids))
+            .group_by(TMGroup.id)
+            .subquery()
+        )
+        groups_fixed += len(db.scalars(
+            update(TMGroup)
+            .where(TMGroup.id == collection_totals.c.id)
+            .where(or_(
+                TMGroup.collections_count != collection_totals.c.collections_count,
+                TMGroup.total_amount != collection_totals.c.total_amount,
+            ))
+            .values(
+                collections_count=collection_totals.c.collections_count,
+                total_amount=collection_totals.c.total_amount,
+                version=TMGroup.version + 1,
+            )
+            .returning(TMGroup.id),
+            execution_options={"synchronize_session": False},
+        ).all())
+        db.commit()
+        ids = _lock_batch(db, TMGroup, ids[-1], batch_size)
+    
+    db.commit()
+    return {
+        "collections_fixed": collections_fixed,
+        "groups_fixed": groups_fixed,
+    }
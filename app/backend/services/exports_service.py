@@ -0,0 +1,126 @@
+"""Exports service layer.
+
+Exports run column-only queries through a server-side cursor
+(``yield_per``, which turns on ``stream_results``) and serialize one batch at
+a time, so memory stays flat no matter how many rows are exported.
+Access is checked eagerly, before the returned iterator is consumed, so
+errors surface as normal HTTP responses rather than a broken stream.
+"""
+import csv
+import enum
+import io
+import json
+from datetime import date, datetime
+from typing import Any, Iterator, Optional
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+
+from app.backend.db.models.total_manager import TMCollection, TMEventLog, TMMemberStatus, LogType
+from app.backend.services.common import check_collection_access, check_group_owner
+from app.backend.services.logs_service import owner_logs_query
+
+EXPORT_BATCH_SIZE = 1000
+
+MEMBER_EXPORT_COLUMNS = (
+    TMMemberStatus.id,
+    TMMemberStatus.display_name,
+    TMMemberStatus.phone,
+    TMMemberStatus.read_at,
+    TMMemberStatus.paid_at,
+    TMMemberStatus.created_at,
+)
+COLLECTION_EXPORT_COLUMNS = (
+    TMCollection.id,
+    TMCollection.title,
+    TMCollection.amount,
+    TMCollection.due_date,
+    TMCollection.status,
+    TMCollection.payment_type,
+    TMCollection.payment_value,
+    TMCollection.member_count,
+    TMCollection.read_count,
+    TMCollection.paid_count,
+    TMCollection.created_at,
+)
+LOG_EXPORT_COLUMNS = (
+    TMEventLog.id,
+    TMEventLog.collection_id,
+    TMEventLog.type,
+    TMEventLog.message,
+    TMEventLog.created_at,
+)
+
+
+def _export_value(value: Any) -> Any:
+    """Convert a column value to a CSV/JSON friendly value."""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def stream_rows(db: Session, query: Select, export_format: str) -> Iterator[str]:
+    """Stream query rows as CSV (with a UTF-8 BOM for Excel) or NDJSON chunks."""
+    result = db.execute(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+    try:
+        columns = list(result.keys())
+        out = io.StringIO()
+        writer = csv.writer(out, lineterminator="\n")
+        if export_format == "csv":
+            out.write("\ufeff")
+            writer.writerow(columns)
+        for rows in result.partitions():
+            for row in rows:
+                values = [_export_value(value) for value in row]
+                if export_format == "csv":
+                    writer.writerow(values)
+                else:
+                    out.write(json.dumps(dict(zip(columns, values)), ensure_ascii=False))
+                    out.write("\n")
+            yield out.getvalue()
+            out.seek(0)
+            out.truncate()
+        if out.tell():
+            yield out.getvalue()
+    finally:
+        result.close()
+
+
+def export_members(db: Session, collection_id: str, owner_id: str, export_format: str) -> Iterator[str]:
+    """Export a collection's members."""
+    check_collection_access(db, collection_id, owner_id)
+    query = (
+        select(*MEMBER_EXPORT_COLUMNS)
+        .where(TMMemberStatus.collection_id == collection_id)
+        .order_by(TMMemberStatus.id)
+    )
+    return stream_rows(db, query, export_format)
+
+
+def export_collections(db: Session, group_id: str, owner_id: str, export_format: str) -> Iterator[str]:
+    """Export a group's collections."""
+    check_group_owner(db, group_id, owner_id)
+    query = (
+        select(*COLLECTION_EXPORT_COLUMNS)
+        .where(TMCollection.group_id == group_id)
+        .order_by(TMCollection.id)
+    )
+    return stream_rows(db, query, export_format)
+
+
+def export_logs(
+    db: Session,
+    user_id: str,
+    export_format: str,
+    collection_id: Optional[str] = None,
+    log_type: Optional[LogType] = None
+) -> Iterator[str]:
+    """Export all event logs for a user, newest first."""
+    query = (
+        owner_logs_query(user_id, collection_id, log_type)
+        .with_only_columns(*LOG_EXPORT_COLUMNS)
+        .order_by(TMEventLog.created_at.desc(), TMEventLog.id.desc())
+    )
+    return stream_rows(db, query, export_format)
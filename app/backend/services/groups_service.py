@@ -4,7 +4,14 @@ from typing import List
 
 from app.backend.db.models.total_manager import TMGroup, GroupType
 from app.backend.schemas.total_manager import GroupCreate, GroupOut, GroupUpdate, GroupDetailOut
-from app.backend.services.common import verify_group_owner, get_group
+from app.backend.services.common import (
+    get_group_version,
+    verify_group_owner,
+    invalidate_ownership,
+    group_detail_key,
+    response_cache,
+)
+from app.backend.services.counters_service import adjust_group_counters
 from app.backend.utils.ulid import generate_ulid
 
 
@@ -42,22 +49,25 @@ def list_groups(db: Session, owner_id: str) -> List[TMGroup]:
 
 
 def get_group_detail(db: Session, group_id: str, owner_id: str) -> GroupDetailOut:
-    """Get group detail with statistics."""
-    group = verify_group_owner(db, group_id, owner_id)
-    
-    from app.backend.db.models.total_manager import TMCollection
-    collections = db.query(TMCollection).filter(TMCollection.group_id == group_id).all()
-    collections_count = len(collections)
-    total_amount = sum(c.amount for c in collections)
-    
+    """Get group detail with statistics (served from the response cache)."""
+    version = get_group_version(db, group_id, owner_id)
+    return response_cache.get_or_load(
+        group_detail_key(group_id, version),
+        lambda: build_group_detail(verify_group_owner(db, group_id, owner_id)),
+        GroupDetailOut,
+    )
+
+
+def build_group_detail(group: TMGroup) -> GroupDetailOut:
+    """Build a group detail from its denormalized counters."""
     return GroupDetailOut(
         id=group.id,
         owner_id=group.owner_id,
         name=group.name,
         type=group.type,
         created_at=group.created_at,
-        collections_count=collections_count,
-        total_amount=total_amount,
+        collections_count=group.collections_count,
+        total_amount=group.total_amount,
     )
 
 
@@ -83,6 +93,7 @@ def update_group(
         }
         group_type_value = type_mapping.get(type_str, GroupType.OTHER).value
         group.type = group_type_value  # Store as string value
+    adjust_group_counters(db, group.id)  # Bump the version
     
     db.commit()
     db.refresh(group)
@@ -94,4 +105,5 @@ def delete_group(db: Session, group_id: str, owner_id: str) -> None:
     group = verify_group_owner(db, group_id, owner_id)
     db.delete(group)
     db.commit()
+    invalidate_ownership(group_id=group_id)
 
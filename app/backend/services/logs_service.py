@@ -1,16 +1,73 @@
 """Logs service layer."""
+import base64
+from sqlalchemy import Select, select, func, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional, Tuple
+from collections import Counter
+from fastapi import HTTPException, status
 
-from app.backend.db.models.total_manager import TMEventLog, TMGroup, TMCollection, LogType
-from app.backend.schemas.total_manager import EventLogOut, LogStatsOut
-from app.backend.services.common import verify_collection_access
+from app.backend.db.models.total_manager import TMEventLog, TMEventLogDaily, LogType
+from app.backend.schemas.total_manager import EventLogPageOut, LogStatsOut
+from app.backend.services.common import check_collection_access
+from app.backend.utils.ulid import generate_ulid
+
+
+def add_event_logs(db: Session, owner_id: str, logs: List[TMEventLog]) -> None:
+    """Add event logs and count them in the daily rollup.
+
+    The caller commits; the rollup upsert runs in the same transaction.
+    """
+    if not logs:
+        return
+    db.add_all(logs)
+    
+    today = datetime.now(timezone.utc).date()
+    counts = Counter((log.collection_id, log.type) for log in logs)
+    stmt = insert(TMEventLogDaily).values([
+        {
+            "owner_id": owner_id,
+            "date": today,
+            "collection_id": collection_id,
+            "type": log_type,
+            "count": count,
+        }
+        for (collection_id, log_type), count in counts.items()
+    ])
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[
+            TMEventLogDaily.owner_id,
+            TMEventLogDaily.date,
+            TMEventLogDaily.collection_id,
+            TMEventLogDaily.type,
+        ],
+        set_={"count": TMEventLogDaily.count + stmt.excluded.count},
+    ))
+
+
+def add_event_log(
+    db: Session,
+    owner_id: str,
+    collection_id: str,
+    log_type: LogType,
+    message: str
+) -> TMEventLog:
+    """Add a single event log (see add_event_logs)."""
+    log = TMEventLog(
+        id=generate_ulid(),
+        collection_id=collection_id,
+        owner_id=owner_id,
+        type=log_type,
+        message=message,
+    )
+    add_event_logs(db, owner_id, [log])
+    return log
 
 
 def list_logs(db: Session, collection_id: str, owner_id: str) -> List[TMEventLog]:
     """List all logs for a collection."""
-    verify_collection_access(db, collection_id, owner_id)
+    check_collection_access(db, collection_id, owner_id)
     return (
         db.query(TMEventLog)
         .filter(TMEventLog.collection_id == collection_id)
@@ -19,75 +76,156 @@ def list_logs(db: Session, collection_id: str, owner_id: str) -> List[TMEventLog
     )
 
 
+def encode_log_cursor(log: TMEventLog) -> str:
+    """Encode the keyset position after a log as an opaque cursor."""
+    raw = f"{log.created_at.isoformat()}|{log.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_log_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a cursor into its (created_at, id) keyset position."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, log_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), log_id
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def owner_logs_query(
+    user_id: str,
+    collection_id: Optional[str] = None,
+    log_type: Optional[LogType] = None
+) -> Select:
+    """Build the owner-scoped log query (served by the owner_id index)."""
+    query = select(TMEventLog).where(TMEventLog.owner_id == user_id)
+    if collection_id:
+        query = query.where(TMEventLog.collection_id == collection_id)
+    if log_type:
+        query = query.where(TMEventLog.type == log_type)
+    return query
+
+
+def owner_logs_page_query(
+    query: Select,
+    limit: int,
+    offset: int = 0,
+    cursor: Optional[str] = None
+) -> Select:
+    """Order and page a log query, fetching one extra row to detect more."""
+    if cursor:
+        created_at, log_id = decode_log_cursor(cursor)
+        columns = (TMEventLog.created_at, TMEventLog.id)
+        query = query.where(tuple_(*columns) < tuple_(created_at, log_id, types=[c.type for c in columns]))
+    else:
+        query = query.offset(offset)
+    return query.order_by(TMEventLog.created_at.desc(), TMEventLog.id.desc()).limit(limit + 1)
+
+
+def owner_logs_count_query(
+    query: Select,
+    user_id: str,
+    collection_id: Optional[str] = None,
+    log_type: Optional[LogType] = None,
+    count: str = "exact"
+) -> Optional[Select]:
+    """Build the total count query for a count mode.
+
+    "exact" counts the log rows, "approximate" sums the daily rollup
+    (cheap, but may drift from the log table), "none" skips the count.
+    """
+    if count == "none":
+        return None
+    if count == "approximate":
+        rollup = select(func.coalesce(func.sum(TMEventLogDaily.count), 0)).where(
+            TMEventLogDaily.owner_id == user_id
+        )
+        if collection_id:
+            rollup = rollup.where(TMEventLogDaily.collection_id == collection_id)
+        if log_type:
+            rollup = rollup.where(TMEventLogDaily.type == log_type)
+        return rollup
+    return select(func.count()).select_from(query.subquery())
+
+
+def build_log_page(
+    logs: List[TMEventLog],
+    total: Optional[int],
+    limit: int,
+    offset: int = 0,
+    cursor: Optional[str] = None
+) -> EventLogPageOut:
+    """Build a log page from up to limit + 1 fetched rows."""
+    has_more = len(logs) > limit
+    logs = logs[:limit]
+    return EventLogPageOut(
+        total=int(total) if total is not None else None,
+        limit=limit,
+        offset=None if cursor else offset,
+        next_cursor=encode_log_cursor(logs[-1]) if has_more else None,
+        logs=logs,
+    )
+
+
 def list_all_logs(
     db: Session,
     user_id: str,
     collection_id: Optional[str] = None,
     log_type: Optional[LogType] = None,
     limit: int = 50,
-    offset: int = 0
-) -> dict:
-    """List all logs for a user."""
-    # Get user's groups
-    groups = db.query(TMGroup).filter(TMGroup.owner_id == user_id).all()
-    group_ids = [g.id for g in groups]
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    count: str = "exact"
+) -> EventLogPageOut:
+    """List all logs for a user.
     
-    # Get collections from user's groups
-    collections = db.query(TMCollection).filter(
-        TMCollection.group_id.in_(group_ids)
-    ).all()
-    collection_ids = [c.id for c in collections]
-    
-    query = db.query(TMEventLog).filter(
-        TMEventLog.collection_id.in_(collection_ids)
+    With a cursor, pages by (created_at, id) so deep pages cost the same as
+    the first; otherwise falls back to offset pagination.
+    """
+    query = owner_logs_query(user_id, collection_id, log_type)
+    count_query = owner_logs_count_query(query, user_id, collection_id, log_type, count)
+    total = db.scalar(count_query) if count_query is not None else None
+    logs = list(db.scalars(owner_logs_page_query(query, limit, offset, cursor)))
+    return build_log_page(logs, total, limit, offset, cursor)
+
+
+def log_stats_queries(user_id: str) -> Tuple[Select, Select]:
+    """Build the per-type and last-7-days queries over the daily rollup."""
+    by_type = (
+        select(TMEventLogDaily.type, func.sum(TMEventLogDaily.count))
+        .where(TMEventLogDaily.owner_id == user_id)
+        .group_by(TMEventLogDaily.type)
     )
-    
-    if collection_id:
-        query = query.filter(TMEventLog.collection_id == collection_id)
-    if log_type:
-        query = query.filter(TMEventLog.type == log_type)
-    
-    total = query.count()
-    logs = query.order_by(TMEventLog.created_at.desc()).offset(offset).limit(limit).all()
-    
-    return {
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-        "logs": logs,
-    }
+    by_date = (
+        select(TMEventLogDaily.date, func.sum(TMEventLogDaily.count))
+        .where(TMEventLogDaily.owner_id == user_id)
+        .group_by(TMEventLogDaily.date)
+        .order_by(TMEventLogDaily.date.desc())
+        .limit(7)
+    )
+    return by_type, by_date
 
 
-def get_log_stats(db: Session, user_id: str) -> LogStatsOut:
-    """Get log statistics for a user."""
-    groups = db.query(TMGroup).filter(TMGroup.owner_id == user_id).all()
-    group_ids = [g.id for g in groups]
-    
-    collections = db.query(TMCollection).filter(
-        TMCollection.group_id.in_(group_ids)
-    ).all()
-    collection_ids = [c.id for c in collections]
-    
-    logs = db.query(TMEventLog).filter(
-        TMEventLog.collection_id.in_(collection_ids)
-    ).all()
-    
-    by_type = {}
-    for log_type in LogType:
-        by_type[log_type.value] = sum(1 for log in logs if log.type == log_type)
-    
-    # Recent activity (by date)
-    recent_activity_dict = defaultdict(int)
-    for log in logs:
-        date_key = log.created_at.date().isoformat()
-        recent_activity_dict[date_key] += 1
+def build_log_stats(type_rows: Iterable, date_rows: Iterable) -> LogStatsOut:
+    """Build log statistics from the rollup query rows."""
+    by_type = {log_type.value: 0 for log_type in LogType}
+    for log_type, count in type_rows:
+        by_type[log_type.value] = int(count)
     
     return LogStatsOut(
-        total_logs=len(logs),
+        total_logs=sum(by_type.values()),
         by_type=by_type,
         recent_activity=[
-            {"date": date, "count": count}
-            for date, count in sorted(recent_activity_dict.items(), reverse=True)[:7]
+            {"date": day.isoformat(), "count": int(count)}
+            for day, count in date_rows
         ],
     )
 
+
+def get_log_stats(db: Session, user_id: str) -> LogStatsOut:
+    """Get log statistics for a user."""
+    by_type, by_date = log_stats_queries(user_id)
+    return build_log_stats(db.execute(by_type), db.execute(by_date))
@@ -1,17 +1,32 @@
 """Members service layer."""
-from sqlalchemy.orm import Session
+from sqlalchemy import any_, func, insert, literal, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import InstrumentedAttribute, Session
+from fastapi import HTTPException, status
+from pydantic import ValidationError
 from datetime import datetime, timezone
 from typing import List
 
 from app.backend.db.models.total_manager import TMMemberStatus, TMEventLog, LogType
+from app.backend.db.types import ULIDType
 from app.backend.schemas.total_manager import (
     MemberCreate,
     MemberOut,
     MemberUpdate,
     BulkMemberCreate,
+    BulkMemberError,
+    BulkMemberOut,
+    BulkMemberMark,
+    BulkMemberMarkOut,
 )
-from app.backend.services.common import verify_collection_access, verify_member_access
-from app.backend.utils.ulid import generate_ulid
+from app.backend.services.common import (
+    check_collection_access,
+    verify_member_access,
+    invalidate_ownership,
+)
+from app.backend.services.counters_service import adjust_collection_counters
+from app.backend.services.logs_service import add_event_log, add_event_logs
+from app.backend.utils.ulid import canonical_ulid, generate_ulid, generate_ulids
 
 
 def add_member(
@@ -21,7 +36,7 @@ def add_member(
     member_data: MemberCreate
 ) -> TMMemberStatus:
     """Add a member to a collection."""
-    verify_collection_access(db, collection_id, owner_id)
+    check_collection_access(db, collection_id, owner_id)
     
     member = TMMemberStatus(
         id=generate_ulid(),
@@ -30,6 +45,7 @@ def add_member(
         phone=member_data.phone,
     )
     db.add(member)
+    adjust_collection_counters(db, collection_id, members=1)
     db.commit()
     db.refresh(member)
     return member
@@ -37,7 +53,7 @@ def add_member(
 
 def list_members(db: Session, collection_id: str, owner_id: str) -> List[TMMemberStatus]:
     """List all members for a collection."""
-    verify_collection_access(db, collection_id, owner_id)
+    check_collection_access(db, collection_id, owner_id)
     return db.query(TMMemberStatus).filter(TMMemberStatus.collection_id == collection_id).all()
 
 
@@ -54,6 +70,7 @@ def update_member(
         member.display_name = member_data.display_name
     if member_data.phone is not None:
         member.phone = member_data.phone
+    adjust_collection_counters(db, member.collection_id)
     
     db.commit()
     db.refresh(member)
@@ -64,7 +81,15 @@ def delete_member(db: Session, member_id: str, owner_id: str) -> None:
     """Delete a member."""
     member = verify_member_access(db, member_id, owner_id)
     db.delete(member)
+    adjust_collection_counters(
+        db,
+        member.collection_id,
+        members=-1,
+        read=-1 if member.read_at is not None else 0,
+        paid=-1 if member.paid_at is not None else 0,
+    )
     db.commit()
+    invalidate_ownership(member_id=member_id)
 
 
 def bulk_add_members(
@@ -72,54 +97,74 @@ def bulk_add_members(
     collection_id: str,
     owner_id: str,
     bulk_data: BulkMemberCreate
-) -> dict:
-    """Add multiple members at once."""
-    verify_collection_access(db, collection_id, owner_id)
+) -> BulkMemberOut:
+    """Add multiple members at once.
     
-    created = []
-    failed = []
+    Valid rows go in with a single INSERT ... RETURNING; invalid rows are
+    reported in errors without aborting the batch.
+    """
+    check_collection_access(db, collection_id, owner_id)
     
-    for member_data in bulk_data.members:
+    rows = []
+    failed = []
+    for index, raw in enumerate(bulk_data.members):
         try:
-            member = TMMemberStatus(
-                id=generate_ulid(),
-                collection_id=collection_id,
-                display_name=member_data.display_name,
-                phone=member_data.phone,
+            member_data = MemberCreate.model_validate(raw)
+        except ValidationError as e:
+            message = "; ".join(
+                f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in e.errors()
             )
-            db.add(member)
-            created.append(member)
-        except Exception as e:
-            failed.append({"member": member_data.model_dump(), "error": str(e)})
+            failed.append(BulkMemberError(index=index, member=raw, error=message))
+            continue
+        rows.append({
+            "collection_id": collection_id,
+            "display_name": member_data.display_name,
+            "phone": member_data.phone,
+        })
     
-    db.commit()
-    
-    # Refresh created members
-    for member in created:
-        db.refresh(member)
+    members = []
+    if rows:
+        for row, member_id in zip(rows, generate_ulids(len(rows))):
+            row["id"] = member_id
+        created = db.scalars(
+            insert(TMMemberStatus).returning(TMMemberStatus, sort_by_parameter_order=True),
+            rows,
+        )
+        # Serialize before commit so expired rows are not reloaded one by one
+        members = [MemberOut.model_validate(member) for member in created]
+        adjust_collection_counters(db, collection_id, members=len(members))
+        db.commit()
     
-    return {
-        "created": len(created),
-        "failed": len(failed),
-        "members": created,
-        "errors": failed if failed else None,
-    }
+    return BulkMemberOut(
+        created=len(members),
+        failed=len(failed),
+        members=members,
+        errors=failed or None,
+    )
 
 
 def mark_read(db: Session, member_id: str, owner_id: str) -> TMMemberStatus:
     """Mark a member as read."""
     member = verify_member_access(db, member_id, owner_id)
     
-    member.read_at = datetime.now(timezone.utc)
+    now = datetime.now(timezone.utc)
+    # Conditional update so concurrent marks count the member only once
+    newly_read = db.query(TMMemberStatus).filter(
+        TMMemberStatus.id == member_id,
+        TMMemberStatus.read_at.is_(None),
+    ).update({TMMemberStatus.read_at: now}, synchronize_session=False)
+    if not newly_read:
+        member.read_at = now
+    adjust_collection_counters(db, member.collection_id, read=newly_read)
     
     # Create read log
-    read_log = TMEventLog(
-        id=generate_ulid(),
-        collection_id=member.collection_id,
-        type=LogType.READ,
-        message=f"{member.display_name}님이 읽음 처리했습니다.",
+    add_event_log(
+        db,
+        owner_id,
+        member.collection_id,
+        LogType.READ,
+        f"{member.display_name}님이 읽음 처리했습니다.",
     )
-    db.add(read_log)
     
     db.commit()
     db.refresh(member)
@@ -131,19 +176,112 @@ def mark_paid(db: Session, member_id: str, owner_id: str) -> TMMemberStatus:
     """Mark a member as paid."""
     member = verify_member_access(db, member_id, owner_id)
     
-    member.paid_at = datetime.now(timezone.utc)
+    now = datetime.now(timezone.utc)
+    # Conditional update so concurrent marks count the member only once
+    newly_paid = db.query(TMMemberStatus).filter(
+        TMMemberStatus.id == member_id,
+        TMMemberStatus.paid_at.is_(None),
+    ).update({TMMemberStatus.paid_at: now}, synchronize_session=False)
+    if not newly_paid:
+        member.paid_at = now
+    adjust_collection_counters(db, member.collection_id, paid=newly_paid)
     
     # Create paid_marked log
-    paid_log = TMEventLog(
-        id=generate_ulid(),
-        collection_id=member.collection_id,
-        type=LogType.PAID_MARKED,
-        message=f"{member.display_name}님이 납부 처리했습니다.",
+    add_event_log(
+        db,
+        owner_id,
+        member.collection_id,
+        LogType.PAID_MARKED,
+        f"{member.display_name}님이 납부 처리했습니다.",
     )
-    db.add(paid_log)
     
     db.commit()
     db.refresh(member)
     
     return member
 
+
+
+def _bulk_mark(
+    db: Session,
+    collection_id: str,
+    owner_id: str,
+    member_ids: List[str],
+    column: InstrumentedAttribute,
+    counter: str,
+    log_type: LogType,
+    message: str,
+) -> BulkMemberMarkOut:
+    """Set a timestamp column on many members of a collection in one UPDATE."""
+    check_collection_access(db, collection_id, owner_id)
+    unique_ids = list(dict.fromkeys(map(canonical_ulid, member_ids)))
+    ids_param = literal(unique_ids, ARRAY(ULIDType))
+    
+    found = db.scalar(
+        select(func.count())
+        .select_from(TMMemberStatus)
+        .where(TMMemberStatus.collection_id == collection_id, TMMemberStatus.id == any_(ids_param))
+    )
+    if found != len(unique_ids):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Member not found"
+        )
+    
+    changed = db.execute(
+        update(TMMemberStatus)
+        .where(
+            TMMemberStatus.collection_id == collection_id,
+            TMMemberStatus.id == any_(ids_param),
+            column.is_(None),
+        )
+        .values({column: datetime.now(timezone.utc)})
+        .returning(TMMemberStatus.id, TMMemberStatus.display_name)
+        .execution_options(synchronize_session=False)
+    ).all()
+    
+    if changed:
+        adjust_collection_counters(db, collection_id, **{counter: len(changed)})
+        add_event_logs(db, owner_id, [
+            TMEventLog(
+                id=log_id,
+                collection_id=collection_id,
+                owner_id=owner_id,
+                type=log_type,
+                message=message.format(name=display_name),
+            )
+            for log_id, (_, display_name) in zip(generate_ulids(len(changed)), changed)
+        ])
+    db.commit()
+    
+    changed_ids = {member_id for member_id, _ in changed}
+    return BulkMemberMarkOut(
+        changed_ids=[member_id for member_id in unique_ids if member_id in changed_ids],
+        unchanged_ids=[member_id for member_id in unique_ids if member_id not in changed_ids],
+    )
+
+
+def bulk_mark_read(
+    db: Session,
+    collection_id: str,
+    owner_id: str,
+    bulk_data: BulkMemberMark
+) -> BulkMemberMarkOut:
+    """Mark many members of a collection as read."""
+    return _bulk_mark(
+        db, collection_id, owner_id, bulk_data.member_ids,
+        TMMemberStatus.read_at, "read", LogType.READ, "{name}님이 읽음 처리했습니다.",
+    )
+
+
+def bulk_mark_paid(
+    db: Session,
+    collection_id: str,
+    owner_id: str,
+    bulk_data: BulkMemberMark
+) -> BulkMemberMarkOut:
+    """Mark many members of a collection as paid."""
+    return _bulk_mark(
+        db, collection_id, owner_id, bulk_data.member_ids,
+        TMMemberStatus.paid_at, "paid", LogType.PAID_MARKED, "{name}님이 납부 처리했습니다.",
+    )
@@ -0,0 +1,39 @@
+"""Internal metrics service layer."""
+from sqlalchemy.orm import Session
+
+from app.backend.core.rate_limit import rate_limiter
+from app.backend.core.security import token_cache
+from app.backend.db.pool import pool_status
+from app.backend.db.session import engine, async_engine, replica_engines, async_replica_engines
+
+from app.backend.services.auth_service import user_cache
+from app.backend.services.common import ownership_cache, response_cache
+from app.backend.services.notice_delivery_service import get_delivery_backlog
+from app.backend.services.reminder_dispatch_service import dispatch_stats, get_dispatch_backlog
+from app.backend.services.user_settings_service import settings_cache
+from app.backend.services.verification_service import verification_store
+
+
+def get_metrics(db: Session) -> dict:
+    """Collect internal runtime metrics."""
+    metrics = {
+        "db_pool": pool_status(engine.pool),
+    }
+    if replica_engines:
+        metrics["db_replica_pools"] = [pool_status(e.pool) for e in replica_engines]
+    if async_engine is not None:
+        metrics["db_async_pool"] = pool_status(async_engine.pool)
+    if async_replica_engines:
+        metrics["db_async_replica_pools"] = [pool_status(e.pool) for e in async_replica_engines]
+    metrics["ownership_cache"] = ownership_cache.stats()
+    metrics["response_cache"] = response_cache.stats()
+    metrics["user_settings_cache"] = settings_cache.stats()
+    metrics["rate_limit"] = rate_limiter.stats()
+    metrics["verification_codes"] = {"backend": verification_store.name, **verification_store.stats()}
+    metrics["auth"] = {"token_cache": token_cache.stats(), "user_cache": user_cache.stats()}
+    metrics["reminder_dispatch"] = {
+        "backlog": get_dispatch_backlog(db),
+        "worker": dispatch_stats.snapshot(),  # Only for workers in this process
+    }
+    metrics["notice_delivery"] = {"backlog": get_delivery_backlog(db)}
+    return metrics
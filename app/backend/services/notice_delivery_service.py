@@ -0,0 +1,226 @@
+"""Notice delivery service layer.
+
+tm_notice_deliveries is a durable per-member send queue. send_notice
+renders and enqueues one row per member in the request transaction; workers
+(see notice_delivery_worker) claim due rows with FOR UPDATE SKIP LOCKED,
+holding them under a lease so a crashed worker's rows are picked up again.
+Every claim counts as an attempt, and a result is only written while the
+worker still holds the lease it was claimed under.
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import Row, bindparam, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.backend.db.models.total_manager import (
+    TMCollection,
+    TMEventLog,
+    TMMemberStatus,
+    TMNoticeDelivery,
+    DeliveryStatus,
+    LogType,
+)
+from app.backend.schemas.total_manager import NoticeDeliveriesOut
+from app.backend.utils.phone import normalize_phone
+from app.backend.utils.ulid import generate_ulids
+
+ENQUEUE_BATCH_SIZE = 1000
+ACTIVE_STATUSES = (DeliveryStatus.PENDING.value, DeliveryStatus.SENDING.value)
+
+
+def render_notice(template: str, display_name: str, collection: TMCollection) -> str:
+    """Fill {name}, {title}, {amount} and {due_date} in a notice template."""
+    values = {
+        "{name}": display_name,
+        "{title}": collection.title,
+        "{amount}": f"{collection.amount:,}",
+        "{due_date}": str(collection.due_date),
+    }
+    for placeholder, value in values.items():
+        template = template.replace(placeholder, value)
+    return template
+
+
+def enqueue_notice_deliveries(
+    db: Session,
+    collection: TMCollection,
+    owner_id: str,
+    notice_id: str,
+    template: str,
+    channel: str
+) -> Tuple[int, int]:
+    """Queue a personalized message for every member with a valid phone.
+
+    Members are read and rendered in batches; the caller commits. Returns
+    (queued, skipped).
+    """
+    members = db.execute(
+        select(TMMemberStatus.id, TMMemberStatus.display_name, TMMemberStatus.phone)
+        .where(TMMemberStatus.collection_id == collection.id)
+        .execution_options(yield_per=ENQUEUE_BATCH_SIZE)
+    )
+    queued = skipped = 0
+    for rows in members.partitions():
+        batch = []
+        for member_id, display_name, raw_phone in rows:
+            try:
+                phone = normalize_phone(raw_phone)
+            except ValueError:
+                phone = None
+            if phone is None:
+                skipped += 1
+                continue
+            batch.append({
+                "notice_id": notice_id,
+                "collection_id": collection.id,
+                "member_id": member_id,
+                "owner_id": owner_id,
+                "channel": channel,
+                "phone": phone,
+                "message": render_notice(template, display_name, collection),
+                "status": DeliveryStatus.PENDING.value,
+            })
+        if batch:
+            for delivery, delivery_id in zip(batch, generate_ulids(len(batch))):
+                delivery["id"] = delivery_id
+            db.execute(insert(TMNoticeDelivery), batch)
+            queued += len(batch)
+    return queued, skipped
+
+
+def claim_deliveries(db: Session, batch_size: int, lease_seconds: float, max_attempts: int) -> List[Row]:
+    """Claim up to batch_size due deliveries and commit the claim.
+
+    Claimed rows move to "sending" with next_attempt_at as the lease expiry;
+    rows whose lease expired are claimable again until they reach
+    max_attempts, after which they are marked failed (e.g. a message that
+    keeps crashing or hanging the worker).
+    """
+    now = datetime.now(timezone.utc)
+    db.execute(
+        update(TMNoticeDelivery)
+        .where(
+            TMNoticeDelivery.status.in_(ACTIVE_STATUSES),
+            TMNoticeDelivery.next_attempt_at <= now,
+            TMNoticeDelivery.attempts >= max_attempts,
+        )
+        .values(status=DeliveryStatus.FAILED.value, last_error="Lease expired on the last attempt")
+        .execution_options(synchronize_session=False)
+    )
+    due = (
+        select(TMNoticeDelivery.id)
+        .where(
+            TMNoticeDelivery.status.in_(ACTIVE_STATUSES),
+            TMNoticeDelivery.next_attempt_at <= now,
+            TMNoticeDelivery.attempts < max_attempts,
+        )
+        .order_by(TMNoticeDelivery.next_attempt_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    claimed = db.execute(
+        update(TMNoticeDelivery)
+        .where(TMNoticeDelivery.id.in_(due))
+        .values(
+            status=DeliveryStatus.SENDING.value,
+            attempts=TMNoticeDelivery.attempts + 1,
+            next_attempt_at=now + timedelta(seconds=lease_seconds),
+        )
+        .returning(
+            TMNoticeDelivery.id,
+            TMNoticeDelivery.phone,
+            TMNoticeDelivery.message,
+            TMNoticeDelivery.attempts,
+        )
+        .execution_options(synchronize_session=False)
+    ).all()
+    db.commit()
+    return claimed
+
+
+def record_delivery_results(db: Session, results: List[Dict[str, Any]]) -> None:
+    """Write delivery outcomes and commit.
+
+    Each result is a dict with the row's id, the attempts value it was claimed
+    with and the columns to set. A row is only updated while it is still
+    "sending" under that claim; if its lease expired and another worker
+    reclaimed it, the late result is dropped. Results with the same columns
+    share one executemany UPDATE.
+    """
+    by_columns: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+    for result in results:
+        columns = tuple(sorted(key for key in result if key not in ("id", "attempts")))
+        by_columns.setdefault(columns, []).append({
+            "claimed_id": result["id"],
+            "claimed_attempts": result["attempts"],
+            **{f"new_{column}": result[column] for column in columns},
+        })
+    table = TMNoticeDelivery.__table__  # Core UPDATE: the ORM would treat a list as a bulk update by PK
+    for columns, params in by_columns.items():
+        db.execute(
+            update(table)
+            .where(
+                table.c.id == bindparam("claimed_id", type_=table.c.id.type),
+                table.c.attempts == bindparam("claimed_attempts"),
+                table.c.status == DeliveryStatus.SENDING.value,
+            )
+            .values({column: bindparam(f"new_{column}", type_=table.c[column].type) for column in columns}),
+            params,
+        )
+    db.commit()
+
+
+def get_notice_deliveries(
+    db: Session,
+    notice_id: str,
+    owner_id: str,
+    status_filter: Optional[DeliveryStatus] = None,
+    limit: int = 100,
+    offset: int = 0
+) -> NoticeDeliveriesOut:
+    """Get per-member delivery status for a notice."""
+    notice = db.get(TMEventLog, notice_id)
+    if not notice or notice.type != LogType.NOTICE_SENT:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Notice not found"
+        )
+    if notice.owner_id != owner_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied"
+        )
+    
+    counts = {s.value: 0 for s in DeliveryStatus}
+    counts.update(db.execute(
+        select(TMNoticeDelivery.status, func.count())
+        .where(TMNoticeDelivery.notice_id == notice_id)
+        .group_by(TMNoticeDelivery.status)
+    ).all())
+    
+    query = select(TMNoticeDelivery).where(TMNoticeDelivery.notice_id == notice_id)
+    if status_filter:
+        query = query.where(TMNoticeDelivery.status == status_filter.value)
+    deliveries = db.scalars(query.order_by(TMNoticeDelivery.id).offset(offset).limit(limit)).all()
+    
+    return NoticeDeliveriesOut(
+        notice_id=notice_id,
+        total=sum(counts.values()),
+        counts=counts,
+        deliveries=deliveries,
+    )
+
+
+def get_delivery_backlog(db: Session) -> Dict[str, Any]:
+    """Get the due, unsent delivery backlog (served by the partial due index)."""
+    now = datetime.now(timezone.utc)
+    due, oldest = db.execute(
+        select(func.count(), func.min(TMNoticeDelivery.next_attempt_at))
+        .where(TMNoticeDelivery.status.in_(ACTIVE_STATUSES), TMNoticeDelivery.next_attempt_at <= now)
+    ).one()
+    return {
+        "due": due,
+        "oldest_lag_seconds": round((now - oldest).total_seconds(), 3) if oldest else 0.0,
+    }
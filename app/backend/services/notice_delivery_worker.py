@@ -0,0 +1,156 @@
+"""Asyncio notice delivery worker.
+
+Claims batches from the tm_notice_deliveries queue and sends them through a
+NoticeProvider with bounded concurrency and a token bucket rate limit.
+Retryable failures are rescheduled with exponential backoff and jitter.
+Database calls are short and run in a thread so sends stay concurrent.
+"""
+import asyncio
+import logging
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict
+
+from sqlalchemy import Row
+from sqlalchemy.orm import Session
+
+from app.backend.db.models.total_manager import DeliveryStatus
+from app.backend.services.notice_delivery_service import claim_deliveries, record_delivery_results
+from app.backend.services.notice_providers import NoticeProvider, ProviderError
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """Token bucket allowing `rate` acquisitions per second (bursts up to `burst`)."""
+
+    def __init__(self, rate: float, burst: float = 1.0):
+        self.rate = rate
+        self.capacity = max(1.0, burst)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class NoticeDeliveryWorker:
+    """Sends queued notice deliveries through a provider."""
+
+    def __init__(
+        self,
+        provider: NoticeProvider,
+        session_factory: Callable[[], Session],
+        concurrency: int = 10,
+        rate_per_second: float = 50.0,
+        batch_size: int = 200,
+        max_attempts: int = 5,
+        retry_base_seconds: float = 5.0,
+        retry_max_seconds: float = 3600.0,
+        lease_seconds: float = 300.0,
+    ):
+        self.provider = provider
+        self.session_factory = session_factory
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.rate_limiter = RateLimiter(rate_per_second, burst=concurrency)
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self.lease_seconds = lease_seconds
+        self.sent = 0
+        self.retried = 0
+        self.failed = 0
+
+    def _with_session(self, fn: Callable, *args):
+        db = self.session_factory()
+        try:
+            return fn(db, *args)
+        finally:
+            db.close()
+
+    def retry_delay(self, attempts: int) -> float:
+        """Exponential backoff with jitter for the given attempt number."""
+        delay = min(self.retry_max_seconds, self.retry_base_seconds * 2 ** (attempts - 1))
+        return delay * random.uniform(0.5, 1.0)
+
+    async def _deliver(self, delivery: Row) -> Dict[str, Any]:
+        """Send one delivery and build its result row."""
+        async with self.semaphore:
+            await self.rate_limiter.acquire()
+            try:
+                message_id = await self.provider.send(delivery.phone, delivery.message)
+            except ProviderError as e:
+                error, retryable = str(e), e.retryable
+            except Exception as e:  # Unknown provider errors are retried
+                logger.exception("Provider raised while sending delivery %s", delivery.id)
+                error, retryable = f"{type(e).__name__}: {e}", True
+            else:
+                self.sent += 1
+                return {
+                    "id": delivery.id,
+                    "attempts": delivery.attempts,
+                    "status": DeliveryStatus.SENT.value,
+                    "provider_message_id": message_id,
+                    "sent_at": datetime.now(timezone.utc),
+                    "last_error": None,
+                }
+        if retryable and delivery.attempts < self.max_attempts:
+            self.retried += 1
+            return {
+                "id": delivery.id,
+                "attempts": delivery.attempts,
+                "status": DeliveryStatus.PENDING.value,
+                "next_attempt_at": datetime.now(timezone.utc) + timedelta(seconds=self.retry_delay(delivery.attempts)),
+                "last_error": error,
+            }
+        self.failed += 1
+        return {
+            "id": delivery.id,
+            "attempts": delivery.attempts,
+            "status": DeliveryStatus.FAILED.value,
+            "last_error": error,
+        }
+
+    async def run_once(self) -> int:
+        """Claim and send one batch; returns how many deliveries were attempted."""
+        deliveries = await asyncio.to_thread(
+            self._with_session, claim_deliveries, self.batch_size, self.lease_seconds, self.max_attempts
+        )
+        if not deliveries:
+            return 0
+        results = await asyncio.gather(*(self._deliver(delivery) for delivery in deliveries))
+        await asyncio.to_thread(self._with_session, record_delivery_results, list(results))
+        return len(deliveries)
+
+    async def run(self, poll_seconds: float = 5.0, once: bool = False) -> None:
+        """Deliver until stopped, or until the queue has nothing due when once is set."""
+        while True:
+            try:
+                attempted = await self.run_once()
+            except Exception:
+                logger.exception("Notice delivery batch failed")
+                attempted = 0
+            if attempted:
+                logger.info(
+                    "Notice deliveries: %d attempted (sent %d, retried %d, failed %d in total)",
+                    attempted,
+                    self.sent,
+                    self.retried,
+                    self.failed,
+                )
+            if attempted < self.batch_size:
+                if once:
+                    return
+                await asyncio.sleep(poll_seconds)
@@ -0,0 +1,76 @@
+"""Notice delivery providers.
+
+A provider sends one rendered message to one phone number. Real SMS or
+KakaoTalk gateways plug in by subclassing NoticeProvider and pointing
+``settings.NOTICE_PROVIDER`` at them as ``package.module:ClassName``; the
+built-in ``fake`` provider records messages locally for development and tests.
+"""
+import asyncio
+import importlib
+import random
+from collections import deque
+from typing import Deque, Tuple
+
+from app.backend.core.config import settings
+from app.backend.utils.ulid import generate_ulid
+
+
+class ProviderError(Exception):
+    """Delivery failure reported by a provider.
+
+    Retryable errors (timeouts, throttling, 5xx) are retried with backoff;
+    permanent ones (invalid number, blocked recipient) fail the delivery.
+    """
+
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class NoticeProvider:
+    """Interface for outbound notice providers."""
+
+    channel = "sms"
+
+    async def send(self, phone: str, message: str) -> str:
+        """Send a message and return the provider's message ID.
+
+        Raises ProviderError on failure.
+        """
+        raise NotImplementedError
+
+
+class FakeProvider(NoticeProvider):
+    """In-memory provider that records the last max_sent messages.
+
+    failure_rate makes a share of sends raise a retryable ProviderError and
+    latency_seconds simulates the gateway round trip. Messages (including
+    verification codes) are kept in plain text, so it refuses to load in
+    production.
+    """
+
+    def __init__(self, failure_rate: float = 0.0, latency_seconds: float = 0.0, max_sent: int = 1000):
+        self.failure_rate = failure_rate
+        self.latency_seconds = latency_seconds
+        self.sent: Deque[Tuple[str, str]] = deque(maxlen=max_sent)
+
+    async def send(self, phone: str, message: str) -> str:
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+        if self.failure_rate and random.random() < self.failure_rate:
+            raise ProviderError("Simulated provider failure")
+        self.sent.append((phone, message))
+        return generate_ulid()
+
+
+def load_provider(name: str) -> NoticeProvider:
+    """Create the provider named in settings ("fake" or "module:ClassName")."""
+    if name == "fake":
+        if settings.ENVIRONMENT == "production":
+            raise RuntimeError("NOTICE_PROVIDER=fake cannot be used in production")
+        return FakeProvider()
+    module_name, _, class_name = name.partition(":")
+    if not class_name:
+        raise ValueError(f"Unknown notice provider: {name}")
+    provider_class = getattr(importlib.import_module(module_name), class_name)
+    return provider_class()
@@ -2,9 +2,12 @@
 from sqlalchemy.orm import Session
 from datetime import timedelta
 
+from app.backend.core.config import settings
 from app.backend.db.models.total_manager import TMEventLog, LogType
 from app.backend.schemas.total_manager import NoticeCreate, NoticeOut
 from app.backend.services.common import verify_collection_access
+from app.backend.services.logs_service import add_event_logs
+from app.backend.services.notice_delivery_service import enqueue_notice_deliveries
 from app.backend.utils.ulid import generate_ulid
 
 
@@ -14,21 +17,27 @@ def send_notice(
     owner_id: str,
     notice_data: NoticeCreate
 ) -> NoticeOut:
-    """Send a notice and create reminder logs."""
-    from app.backend.db.models.total_manager import TMCollection
+    """Send a notice, queue its per-member deliveries and create reminder logs.
+    
+    Delivery happens in the background (see jobs.deliver_notices), so this
+    returns as soon as the messages are queued.
+    """
     collection = verify_collection_access(db, collection_id, owner_id)
     
     # Generate default message if not provided
     message = notice_data.message or f"'{collection.title}' 모금 안내: {collection.amount:,}원, 마감일: {collection.due_date}"
+    # Custom messages may use {name}, {title}, {amount} and {due_date}
+    template = notice_data.message or f"{{name}}님, {message}"
     
     # Create notice_sent log
     notice_log = TMEventLog(
         id=generate_ulid(),
         collection_id=collection_id,
+        owner_id=owner_id,
         type=LogType.NOTICE_SENT,
         message=message,
     )
-    db.add(notice_log)
+    logs = [notice_log]
     
     # Create reminder_scheduled logs for due_date - 1 day and due_date + 1 day
     reminder_dates = [
@@ -40,17 +49,24 @@ def send_notice(
         reminder_log = TMEventLog(
             id=generate_ulid(),
             collection_id=collection_id,
+            owner_id=owner_id,
             type=LogType.REMINDER_SCHEDULED,
             message=f"리마인더 예약: {reminder_date}",
         )
-        db.add(reminder_log)
+        logs.append(reminder_log)
     
+    add_event_logs(db, owner_id, logs)
+    db.flush()
+    queued, skipped = enqueue_notice_deliveries(
+        db, collection, owner_id, notice_log.id, template, settings.NOTICE_CHANNEL
+    )
     db.commit()
-    db.refresh(notice_log)
     
     return NoticeOut(
         success=True,
         message=message,
         log_id=notice_log.id,
+        queued=queued,
+        skipped=skipped,
     )
 
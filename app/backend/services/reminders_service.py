@@ -1,11 +1,16 @@
 """Reminders service layer."""
+from sqlalchemy import false, or_, select
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
-from datetime import datetime, timedelta, timezone
+from fastapi import HTTPException, status
+from datetime import datetime, timezone
 from typing import List, Optional
 
-from app.backend.db.models.total_manager import TMReminder, TMEventLog, LogType
-from app.backend.schemas.total_manager import ReminderCreate, ReminderUpdate, ReminderOut
-from app.backend.services.common import verify_collection_access
+from app.backend.db.models.total_manager import TMReminder, LogType
+from app.backend.schemas.total_manager import ReminderCreate, ReminderUpdate, ReminderOut, ReminderOccurrenceOut
+from app.backend.services.common import check_collection_access
+from app.backend.services.logs_service import add_event_log
+from app.backend.utils.recurrence import next_occurrence, occurrences_between, series_ended
 from app.backend.utils.ulid import generate_ulid
 
 
@@ -16,7 +21,7 @@ def create_reminder(
 ) -> TMReminder:
     """Create a new reminder."""
     if reminder_data.collection_id:
-        verify_collection_access(db, reminder_data.collection_id, user_id)
+        check_collection_access(db, reminder_data.collection_id, user_id)
     
     reminder = TMReminder(
         id=generate_ulid(),
@@ -25,6 +30,8 @@ def create_reminder(
         title=reminder_data.title,
         scheduled_at=reminder_data.scheduled_at,
         repeat_type=reminder_data.repeat_type,
+        repeat_until=reminder_data.repeat_until,
+        repeat_count=reminder_data.repeat_count,
         message=reminder_data.message,
     )
     db.add(reminder)
@@ -37,7 +44,9 @@ def list_reminders(
     db: Session,
     user_id: str,
     is_sent: Optional[bool] = None,
-    collection_id: Optional[str] = None
+    collection_id: Optional[str] = None,
+    limit: int = 100,
+    offset: int = 0
 ) -> List[TMReminder]:
     """List reminders for a user."""
     query = db.query(TMReminder).filter(TMReminder.user_id == user_id)
@@ -47,7 +56,7 @@ def list_reminders(
     if collection_id:
         query = query.filter(TMReminder.collection_id == collection_id)
     
-    return query.order_by(TMReminder.scheduled_at.asc()).all()
+    return query.order_by(TMReminder.scheduled_at.asc(), TMReminder.id).offset(offset).limit(limit).all()
 
 
 def get_reminder(db: Session, reminder_id: str) -> Optional[TMReminder]:
@@ -57,8 +66,6 @@ def get_reminder(db: Session, reminder_id: str) -> Optional[TMReminder]:
 
 def verify_reminder_access(db: Session, reminder_id: str, user_id: str) -> TMReminder:
     """Verify reminder exists and belongs to user."""
-    from fastapi import HTTPException, status
-    
     reminder = get_reminder(db, reminder_id)
     if not reminder:
         raise HTTPException(
@@ -88,8 +95,10 @@ def update_reminder(
         reminder.scheduled_at = reminder_data.scheduled_at
     if reminder_data.repeat_type is not None:
         reminder.repeat_type = reminder_data.repeat_type
-    if reminder_data.message is not None:
-        reminder.message = reminder_data.message
+    # Optional fields: an explicit null clears them, an omitted field is kept
+    provided = reminder_data.model_dump(include={"repeat_until", "repeat_count", "message"}, exclude_unset=True)
+    for field, value in provided.items():
+        setattr(reminder, field, value)
     
     db.commit()
     db.refresh(reminder)
@@ -103,48 +112,107 @@ def delete_reminder(db: Session, reminder_id: str, user_id: str) -> None:
     db.commit()
 
 
-def send_reminder(db: Session, reminder_id: str, user_id: str) -> TMReminder:
-    """Send a reminder immediately."""
-    reminder = verify_reminder_access(db, reminder_id, user_id)
+def deliver_reminder(db: Session, reminder: TMReminder) -> None:
+    """Apply the side effects of sending a reminder (the caller commits).
     
-    reminder.is_sent = True
-    reminder.sent_at = datetime.now(timezone.utc)
+    Logs reminder_sent on its collection. A repeating reminder keeps its
+    single row: scheduled_at moves to the next occurrence (skipping any
+    already missed) until the series ends, which marks it sent.
+    """
+    now = datetime.now(timezone.utc)
+    reminder.sent_at = now
+    reminder.sent_count = (reminder.sent_count or 0) + 1
     
     # Create event log if collection exists
     if reminder.collection_id:
-        log = TMEventLog(
-            id=generate_ulid(),
-            collection_id=reminder.collection_id,
-            type=LogType.REMINDER_SENT,
-            message=reminder.message or reminder.title,
+        add_event_log(
+            db,
+            reminder.user_id,
+            reminder.collection_id,
+            LogType.REMINDER_SENT,
+            reminder.message or reminder.title,
         )
-        db.add(log)
     
-    # Handle repeat reminders
-    if reminder.repeat_type == "daily":
-        next_reminder = TMReminder(
-            id=generate_ulid(),
-            user_id=user_id,
-            collection_id=reminder.collection_id,
-            title=reminder.title,
-            scheduled_at=reminder.scheduled_at + timedelta(days=1),
-            repeat_type=reminder.repeat_type,
-            message=reminder.message,
-        )
-        db.add(next_reminder)
-    elif reminder.repeat_type == "weekly":
-        next_reminder = TMReminder(
-            id=generate_ulid(),
-            user_id=user_id,
-            collection_id=reminder.collection_id,
-            title=reminder.title,
-            scheduled_at=reminder.scheduled_at + timedelta(weeks=1),
-            repeat_type=reminder.repeat_type,
-            message=reminder.message,
+    next_at = next_occurrence(reminder.scheduled_at, reminder.repeat_type, now)
+    if series_ended(next_at, reminder.sent_count, reminder.repeat_count, reminder.repeat_until):
+        reminder.is_sent = True
+    else:
+        reminder.scheduled_at = next_at
+
+
+def list_upcoming_occurrences(
+    db: Session,
+    user_id: str,
+    start: datetime,
+    end: datetime,
+    collection_id: Optional[str] = None,
+    limit: int = 100
+) -> List[ReminderOccurrenceOut]:
+    """List reminder occurrences in [start, end], expanding repeat rules lazily."""
+    start, end = _as_utc(start), _as_utc(end)
+    if end < start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end must not be before start"
         )
-        db.add(next_reminder)
     
+    query = db.query(TMReminder).filter(
+        TMReminder.user_id == user_id,
+        TMReminder.is_sent == false(),
+        TMReminder.scheduled_at <= end,
+        or_(TMReminder.repeat_until.is_(None), TMReminder.repeat_until >= start),
+    )
+    if collection_id:
+        query = query.filter(TMReminder.collection_id == collection_id)
+    
+    occurrences = []
+    for reminder in query:
+        for scheduled_at in occurrences_between(
+            reminder.scheduled_at,
+            reminder.repeat_type,
+            start,
+            end,
+            limit,
+            sent_count=reminder.sent_count,
+            repeat_count=reminder.repeat_count,
+            repeat_until=reminder.repeat_until,
+        ):
+            occurrences.append(ReminderOccurrenceOut(
+                reminder_id=reminder.id,
+                collection_id=reminder.collection_id,
+                title=reminder.title,
+                message=reminder.message,
+                repeat_type=reminder.repeat_type,
+                scheduled_at=scheduled_at,
+            ))
+    occurrences.sort(key=lambda occurrence: (occurrence.scheduled_at, occurrence.reminder_id))
+    return occurrences[:limit]
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC."""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def send_reminder(db: Session, reminder_id: str, user_id: str) -> TMReminder:
+    """Send a reminder immediately."""
+    verify_reminder_access(db, reminder_id, user_id)
+    try:
+        # Same row lock the dispatcher claims with SKIP LOCKED; NOWAIT instead
+        # of waiting so a reminder it is sending right now is not sent twice
+        reminder = db.scalars(
+            select(TMReminder)
+            .where(TMReminder.id == reminder_id)
+            .with_for_update(nowait=True)
+            .execution_options(populate_existing=True)
+        ).one()
+    except OperationalError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Reminder is being sent; try again shortly"
+        )
+    deliver_reminder(db, reminder)
     db.commit()
     db.refresh(reminder)
     return reminder
-
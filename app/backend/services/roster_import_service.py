@@ -0,0 +1,174 @@
+"""Roster import service layer.
+
+CSV rosters are parsed row by row from the uploaded file and streamed with
+COPY into a temporary staging table; deduplication and the insert into
+tm_member_status happen set-based in Postgres, so memory use does not grow
+with the file size.
+"""
+import csv
+import io
+from typing import BinaryIO, Iterator, List, Optional
+
+import psycopg2
+from fastapi import HTTPException, status
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from app.backend.db.types import ULIDType
+from app.backend.schemas.total_manager import RosterImportError, RosterImportOut
+from app.backend.services.common import check_collection_access
+from app.backend.services.counters_service import adjust_collection_counters
+from app.backend.utils.phone import normalize_phone
+from app.backend.utils.ulid import generate_ulid, ulid_to_uuid
+
+NAME_COLUMNS = ("display_name", "name", "이름")
+PHONE_COLUMNS = ("phone", "전화번호", "연락처")
+MAX_REPORTED_ERRORS = 100
+COPY_CHUNK_ROWS = 1000
+
+
+class _RosterParser:
+    """Turns CSV roster rows into staging rows, collecting row errors."""
+
+    def __init__(self, reader: Iterator[List[str]]):
+        self.reader = reader
+        self.failed = 0
+        self.errors: List[RosterImportError] = []
+        self.name_index, self.phone_index = self._read_header()
+
+    def _read_header(self):
+        header = [column.strip().lower() for column in next(self.reader, [])]
+        name_index = next((header.index(c) for c in NAME_COLUMNS if c in header), None)
+        phone_index = next((header.index(c) for c in PHONE_COLUMNS if c in header), None)
+        if name_index is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="CSV header must include a display_name column"
+            )
+        return name_index, phone_index
+
+    def _fail(self, line: int, error: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(RosterImportError(line=line, error=error))
+
+    def _cell(self, row: List[str], index: Optional[int]) -> str:
+        return row[index].strip() if index is not None and index < len(row) else ""
+
+    def staging_chunks(self) -> Iterator[str]:
+        """Yield CSV chunks of (line, id, display_name, phone) rows for COPY."""
+        out = io.StringIO()
+        writer = csv.writer(out, lineterminator="\n")
+        pending = 0
+        for line, row in enumerate(self.reader, start=2):
+            if not any(cell.strip() for cell in row):
+                continue
+            display_name = self._cell(row, self.name_index)
+            if not display_name:
+                self._fail(line, "display_name is required")
+                continue
+            try:
+                phone = normalize_phone(self._cell(row, self.phone_index))
+            except ValueError as e:
+                self._fail(line, str(e))
+                continue
+            writer.writerow((line, ulid_to_uuid(generate_ulid()), display_name, phone))
+            pending += 1
+            if pending == COPY_CHUNK_ROWS:
+                yield out.getvalue()
+                out.seek(0)
+                out.truncate()
+                pending = 0
+        if pending:
+            yield out.getvalue()
+
+
+class _CopyStream:
+    """Minimal file-like object feeding generated chunks to COPY FROM STDIN."""
+
+    def __init__(self, chunks: Iterator[str]):
+        self.chunks = chunks
+        self.buffer = b""
+        self.error: Optional[Exception] = None
+
+    def _next_chunk(self) -> Optional[str]:
+        # psycopg2 turns exceptions raised here into a cancelled COPY, so keep
+        # the original error for the caller
+        try:
+            return next(self.chunks, None)
+        except (UnicodeDecodeError, csv.Error) as e:
+            self.error = e
+            raise
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self.buffer) < size:
+            chunk = self._next_chunk()
+            if chunk is None:
+                break
+            self.buffer += chunk.encode("utf-8")
+        if size < 0:
+            size = len(self.buffer)
+        chunk, self.buffer = self.buffer[:size], self.buffer[size:]
+        return chunk
+
+
+def import_roster_csv(
+    db: Session,
+    collection_id: str,
+    owner_id: str,
+    file: BinaryIO
+) -> RosterImportOut:
+    """Import members from a CSV roster into a collection.
+    
+    Phone numbers are normalized; rows whose phone is already in the
+    collection (or earlier in the file) are skipped as duplicates.
+    """
+    check_collection_access(db, collection_id, owner_id)
+    
+    reader = csv.reader(io.TextIOWrapper(file, encoding="utf-8-sig", newline=""))
+    stream = None
+    try:
+        parser = _RosterParser(reader)
+        stream = _CopyStream(parser.staging_chunks())
+        db.execute(text(
+            "CREATE TEMP TABLE tm_roster_import "
+            "(line integer, id uuid, display_name varchar, phone varchar) ON COMMIT DROP"
+        ))
+        with db.connection().connection.cursor() as cursor:
+            cursor.copy_expert(
+                "COPY tm_roster_import (line, id, display_name, phone) FROM STDIN WITH (FORMAT csv)",
+                stream,
+            )
+            staged = cursor.rowcount
+    except (UnicodeDecodeError, csv.Error, psycopg2.Error) as e:
+        db.rollback()
+        error = stream.error if stream is not None and stream.error is not None else e
+        if isinstance(error, psycopg2.Error):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid CSV file: {error}"
+        )
+    
+    # Keep the first row per phone and skip phones already in the collection
+    created = db.execute(text("""
+        INSERT INTO tm_member_status (id, collection_id, display_name, phone)
+        SELECT DISTINCT ON (coalesce(s.phone, s.id::text)) s.id, :collection_id, s.display_name, s.phone
+        FROM tm_roster_import s
+        WHERE s.phone IS NULL OR NOT EXISTS (
+            SELECT 1 FROM tm_member_status m
+            WHERE m.collection_id = :collection_id
+              -- Same form as normalize_phone: digits only, +82 country code as 0
+              AND regexp_replace(regexp_replace(m.phone, '[^0-9]', '', 'g'), '^82', '0') = s.phone
+        )
+        ORDER BY coalesce(s.phone, s.id::text), s.line
+    """).bindparams(bindparam("collection_id", type_=ULIDType)), {"collection_id": collection_id}).rowcount
+    adjust_collection_counters(db, collection_id, members=created)
+    db.commit()
+    
+    return RosterImportOut(
+        created=created,
+        duplicates=staged - created,
+        failed=parser.failed,
+        errors=parser.errors or None,
+    )
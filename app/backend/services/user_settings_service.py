@@ -1,34 +1,96 @@
-"""User settings service layer."""
+"""User settings service layer.
+
+Notification settings are cached per user (settings_cache) and invalidated
+by update_notification_settings. The cache is per process, so an update made
+through another process is seen here after at most the cache TTL.
+"""
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Dict, Iterable, Optional
 from fastapi import HTTPException, status
 
+from app.backend.core.cache import TTLCache
+from app.backend.core.config import settings as app_settings
 from app.backend.db.models.user_settings import UserSettings, UserPaymentMethod
 from app.backend.schemas.user_settings import (
+    NotificationSettingsOut,
     NotificationSettingsUpdate,
     PaymentMethodCreate,
     PaymentMethodUpdate,
 )
 from app.backend.utils.ulid import generate_ulid
 
+# user_id -> NotificationSettingsOut
+settings_cache = TTLCache(
+    max_size=app_settings.USER_SETTINGS_CACHE_MAX_SIZE,
+    ttl_seconds=app_settings.USER_SETTINGS_CACHE_TTL_SECONDS,
+)
+
 
 def get_or_create_user_settings(db: Session, user_id: str) -> UserSettings:
-    """Get user settings or create default if not exists."""
+    """Get user settings or create default if not exists.
+    
+    Creation is an INSERT ... ON CONFLICT DO NOTHING RETURNING, so concurrent
+    first requests from one user cannot fail on the unique user_id.
+    """
     settings = db.query(UserSettings).filter(UserSettings.user_id == user_id).first()
-    if not settings:
-        settings = UserSettings(
-            id=generate_ulid(),
-            user_id=user_id,
-        )
-        db.add(settings)
-        db.commit()
-        db.refresh(settings)
+    if settings:
+        return settings
+    
+    settings = db.scalars(
+        insert(UserSettings)
+        .values(id=generate_ulid(), user_id=user_id)
+        .on_conflict_do_nothing(index_elements=[UserSettings.user_id])
+        .returning(UserSettings)
+    ).first()
+    if settings is None:
+        # Created by a concurrent request between our SELECT and INSERT
+        settings = db.query(UserSettings).filter(UserSettings.user_id == user_id).one()
+    db.commit()
     return settings
 
 
-def get_notification_settings(db: Session, user_id: str) -> UserSettings:
+def default_notification_settings() -> NotificationSettingsOut:
+    """Get the settings a user has before their row is created (column defaults)."""
+    columns = UserSettings.__table__.c
+    return NotificationSettingsOut(**{
+        field: columns[field].default.arg for field in NotificationSettingsOut.model_fields
+    })
+
+
+def get_notification_settings(db: Session, user_id: str) -> NotificationSettingsOut:
     """Get notification settings for a user."""
-    return get_or_create_user_settings(db, user_id)
+    cached = settings_cache.get(user_id)
+    if cached is not None:
+        return cached
+    result = NotificationSettingsOut.model_validate(get_or_create_user_settings(db, user_id))
+    settings_cache.set(user_id, result)
+    return result
+
+
+def get_notification_settings_bulk(db: Session, user_ids: Iterable[str]) -> Dict[str, NotificationSettingsOut]:
+    """Get notification settings for many users (e.g. fan-out jobs) in one query.
+    
+    Users without a settings row get the defaults; no rows are created.
+    """
+    results = {}
+    missing = []
+    for user_id in dict.fromkeys(user_ids):
+        cached = settings_cache.get(user_id)
+        if cached is not None:
+            results[user_id] = cached
+        else:
+            missing.append(user_id)
+    
+    if missing:
+        rows = db.scalars(select(UserSettings).where(UserSettings.user_id.in_(missing)))
+        found = {row.user_id: NotificationSettingsOut.model_validate(row) for row in rows}
+        defaults = default_notification_settings()
+        for user_id in missing:
+            results[user_id] = found.get(user_id, defaults)
+            settings_cache.set(user_id, results[user_id])
+    return results
 
 
 def update_notification_settings(
@@ -47,6 +109,7 @@ def update_notification_settings(
         settings.reminder_notifications_enabled = settings_data.reminder_notifications_enabled
     
     db.commit()
+    settings_cache.delete(user_id)
     db.refresh(settings)
     return settings
 
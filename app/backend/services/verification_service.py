@@ -0,0 +1,101 @@
+"""SMS verification code service."""
+import hashlib
+import hmac
+import logging
+import secrets
+from typing import Optional
+
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+
+from app.backend.core.config import settings
+from app.backend.core.verification_store import VerificationResult, create_verification_store
+from app.backend.services.notice_providers import NoticeProvider, ProviderError, load_provider
+from app.backend.utils.phone import normalize_phone
+
+logger = logging.getLogger(__name__)
+
+verification_store = create_verification_store(
+    settings.VERIFICATION_CODE_BACKEND,
+    ttl_seconds=settings.VERIFICATION_CODE_TTL_SECONDS,
+    max_attempts=settings.VERIFICATION_CODE_MAX_ATTEMPTS,
+    sweep_interval_seconds=settings.VERIFICATION_CODE_SWEEP_SECONDS,
+    redis_url=settings.VERIFICATION_CODE_REDIS_URL,
+)
+_sms_provider: Optional[NoticeProvider] = None
+
+
+def get_sms_provider() -> NoticeProvider:
+    """Get the SMS provider, loading it on first use.
+
+    Loaded lazily so a misconfigured provider only breaks sending codes,
+    not application startup.
+    """
+    global _sms_provider
+    if _sms_provider is None:
+        _sms_provider = load_provider(settings.NOTICE_PROVIDER)
+    return _sms_provider
+
+
+def _normalize(phone: str) -> str:
+    # One key per number however it was typed ("010-1234-5678", "+82 10...")
+    try:
+        normalized = normalize_phone(phone)
+    except ValueError:
+        normalized = None
+    if normalized is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="전화번호 형식이 올바르지 않습니다")
+    return normalized
+
+
+def hash_code(phone: str, code: str) -> str:
+    """Keyed hash of a code, so stored codes are not readable as-is."""
+    return hmac.new(settings.SECRET_KEY.encode(), f"{phone}:{code}".encode(), hashlib.sha256).hexdigest()
+
+
+def issue_verification_code(phone: str) -> str:
+    """인증 코드 생성 및 저장 (이전 코드는 무효화)."""
+    code = str(secrets.randbelow(10 ** settings.VERIFICATION_CODE_LENGTH)).zfill(settings.VERIFICATION_CODE_LENGTH)
+    verification_store.issue(phone, hash_code(phone, code))
+    return code
+
+
+async def send_verification_code(phone: str) -> None:
+    """인증 코드 발송."""
+    phone = _normalize(phone)
+    try:
+        provider = get_sms_provider()
+    except (ImportError, AttributeError, RuntimeError, ValueError):
+        logger.error("SMS provider %r could not be loaded", settings.NOTICE_PROVIDER, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="인증 코드 발송을 사용할 수 없습니다"
+        )
+    code = await run_in_threadpool(issue_verification_code, phone)
+    try:
+        await provider.send(phone, f"[총무노트] 인증 코드는 [{code}] 입니다.")
+    except ProviderError:
+        logger.warning("Verification code SMS to %s failed", phone, exc_info=True)
+        await run_in_threadpool(verification_store.discard, phone)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="인증 코드 발송에 실패했습니다. 잠시 후 다시 시도해 주세요"
+        )
+
+
+def verify_code(phone: str, code: str) -> None:
+    """인증 코드 검증 (성공 시 코드는 소모됨)."""
+    phone = _normalize(phone)
+    result = verification_store.verify(phone, hash_code(phone, code))
+    if result == VerificationResult.OK:
+        return
+    if result == VerificationResult.LOCKED:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="인증 시도 횟수를 초과했습니다. 인증 코드를 다시 받아 주세요"
+        )
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="인증 코드가 일치하지 않습니다" if result == VerificationResult.MISMATCH
+        else "인증 코드가 만료되었거나 발송되지 않았습니다"
+    )
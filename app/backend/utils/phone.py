@@ -0,0 +1,21 @@
+"""Phone number utility."""
+import re
+from typing import Optional
+
+_NON_DIGITS = re.compile(r"\D")
+
+
+def normalize_phone(raw: Optional[str]) -> Optional[str]:
+    """Normalize a Korean phone number to digits only (e.g. 01012345678).
+
+    Accepts separators and a +82 country code; returns None for blank input
+    and raises ValueError if the result is not a 9-11 digit local number.
+    """
+    if raw is None or not raw.strip():
+        return None
+    digits = _NON_DIGITS.sub("", raw)
+    if digits.startswith("82"):
+        digits = "0" + digits[2:]
+    if not digits.startswith("0") or not 9 <= len(digits) <= 11:
+        raise ValueError(f"Invalid phone number: {raw}")
+    return digits
@@ -0,0 +1,71 @@
+"""Reminder recurrence utility.
+
+A repeating reminder is stored as one row: ``scheduled_at`` is its next
+unsent occurrence and the series ends after ``repeat_count`` sends or past
+``repeat_until``. Later occurrences are computed here on demand.
+"""
+import math
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+REPEAT_INTERVALS = {
+    "daily": timedelta(days=1),
+    "weekly": timedelta(weeks=1),
+}
+
+
+def next_occurrence(scheduled_at: datetime, repeat_type: str, now: datetime) -> Optional[datetime]:
+    """Get the occurrence after scheduled_at, skipping any already in the past.
+
+    Returns None for non-repeating reminders.
+    """
+    interval = REPEAT_INTERVALS.get(repeat_type)
+    if interval is None:
+        return None
+    steps = 1
+    if now >= scheduled_at:
+        steps = math.floor((now - scheduled_at) / interval) + 1
+    return scheduled_at + steps * interval
+
+
+def series_ended(
+    next_at: Optional[datetime],
+    sent_count: int,
+    repeat_count: Optional[int] = None,
+    repeat_until: Optional[datetime] = None
+) -> bool:
+    """Check whether a series has no occurrence left after sent_count sends."""
+    if next_at is None:
+        return True
+    if repeat_count is not None and sent_count >= repeat_count:
+        return True
+    return repeat_until is not None and next_at > repeat_until
+
+
+def occurrences_between(
+    scheduled_at: datetime,
+    repeat_type: str,
+    start: datetime,
+    end: datetime,
+    limit: int,
+    sent_count: int = 0,
+    repeat_count: Optional[int] = None,
+    repeat_until: Optional[datetime] = None
+) -> List[datetime]:
+    """List unsent occurrences in [start, end], starting from scheduled_at."""
+    interval = REPEAT_INTERVALS.get(repeat_type)
+    if interval is None:
+        return [scheduled_at] if start <= scheduled_at <= end and limit > 0 else []
+
+    index = max(0, math.ceil((start - scheduled_at) / interval))
+    remaining = repeat_count - sent_count if repeat_count is not None else None
+    occurrences = []
+    while len(occurrences) < limit:
+        if remaining is not None and index >= remaining:
+            break
+        occurrence = scheduled_at + index * interval
+        if occurrence > end or (repeat_until is not None and occurrence > repeat_until):
+            break
+        occurrences.append(occurrence)
+        index += 1
+    return occurrences
@@ -1,8 +1,99 @@
-"""ULID generation utility."""
-import ulid
+"""ULID generation and conversion utilities.
+
+ULIDs are 128-bit IDs (48-bit millisecond timestamp + 80 random bits) shown
+as 26-character Crockford base32 strings. The database stores them as native
+16-byte uuid values (see db.types.ULIDType) and the API exposes the strings.
+
+IDs are monotonic within a process: IDs generated in the same millisecond
+increment the random part instead of drawing a new one, so rows inserted in
+one batch are in index order.
+"""
+import base64
+import secrets
+import threading
+import time
+import uuid
+from typing import List, Tuple
+
+_CROCKFORD = b"0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_BASE32 = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ234567"
+# base64.b32encode/b32decode do the bit packing in C; only the alphabets differ
+_TO_CROCKFORD = bytes.maketrans(_BASE32, _CROCKFORD)
+_FROM_CROCKFORD = bytes.maketrans(_CROCKFORD, _BASE32)
+_RANDOM_LIMIT = 1 << 80
+
+_lock = threading.Lock()
+_last_ms = 0
+_last_random = 0
+
+
+def _reserve(count: int) -> Tuple[int, int]:
+    """Reserve count consecutive IDs; returns (timestamp_ms, first random part)."""
+    global _last_ms, _last_random
+    with _lock:
+        ms = time.time_ns() // 1_000_000
+        if ms <= _last_ms:
+            # Same millisecond (or the clock stepped back): continue the sequence
+            ms, start = _last_ms, _last_random + 1
+            if start + count > _RANDOM_LIMIT:
+                ms, start = ms + 1, secrets.randbelow(_RANDOM_LIMIT - count)
+        else:
+            start = secrets.randbelow(_RANDOM_LIMIT - count)
+        _last_ms, _last_random = ms, start + count - 1
+        return ms, start
+
+
+def encode_ulid(value: int) -> str:
+    """Encode a 128-bit integer as a ULID string."""
+    # 26 base32 digits hold 130 bits: shift to a 160-bit (20-byte) boundary
+    return base64.b32encode((value << 30).to_bytes(20, "big"))[:26].translate(_TO_CROCKFORD).decode()
+
+
+def decode_ulid(value: str) -> int:
+    """Decode a ULID string into a 128-bit integer; raises ValueError if invalid."""
+    if not isinstance(value, str) or len(value) != 26 or value[0] > "7":
+        raise ValueError(f"Invalid ULID: {value!r}")
+    try:
+        raw = value.upper().encode("ascii")
+    except UnicodeEncodeError:
+        raise ValueError(f"Invalid ULID: {value!r}") from None
+    if raw.translate(None, _CROCKFORD):  # Anything left is not a Crockford digit
+        raise ValueError(f"Invalid ULID: {value!r}")
+    return int.from_bytes(base64.b32decode((raw + b"AAAAAA").translate(_FROM_CROCKFORD)), "big") >> 30
+
+
+def canonical_ulid(value: str) -> str:
+    """Get the canonical (upper-case) form of a ULID string, the form the DB returns.
+
+    Invalid input is returned unchanged; it binds as a nil uuid and matches nothing.
+    """
+    try:
+        decode_ulid(value)
+    except ValueError:
+        return value
+    return value.upper()
 
 
 def generate_ulid() -> str:
     """Generate a new ULID string."""
-    return str(ulid.new())
+    ms, random_part = _reserve(1)
+    return encode_ulid(ms << 80 | random_part)
+
+
+def generate_ulids(count: int) -> List[str]:
+    """Generate count ascending ULID strings with one timestamp (for bulk inserts)."""
+    if count <= 0:
+        return []
+    ms, start = _reserve(count)
+    base = ms << 80 | start
+    return [encode_ulid(base + offset) for offset in range(count)]
+
+
+def ulid_to_uuid(value: str) -> uuid.UUID:
+    """Convert a ULID string to the uuid it is stored as."""
+    return uuid.UUID(int=decode_ulid(value))
+
 
+def uuid_to_ulid(value: uuid.UUID) -> str:
+    """Convert a stored uuid back to its ULID string."""
+    return encode_ulid(value.int)